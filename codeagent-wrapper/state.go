@@ -7,6 +7,8 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"reflect"
+	"sort"
 	"strings"
 	"sync"
 	"time"
@@ -60,6 +62,11 @@ type TaskResultState struct {
 	WindowID     string    `json:"window_id,omitempty"`
 	PaneID       string    `json:"pane_id,omitempty"`
 	CompletedAt  time.Time `json:"completed_at"`
+
+	// Extra holds keys this struct does not declare (e.g. detached, output_ref,
+	// review_rollup, dispatched_at written by Python scripts) so that a
+	// wrapper write round-trips them unchanged.
+	Extra map[string]json.RawMessage `json:"-"`
 }
 
 // ReviewFindingState represents a review finding.
@@ -70,6 +77,9 @@ type ReviewFindingState struct {
 	Summary   string    `json:"summary"`
 	Details   string    `json:"details,omitempty"`
 	CreatedAt time.Time `json:"created_at"`
+
+	// Extra holds undeclared keys (e.g. details_ref)
+	Extra map[string]json.RawMessage `json:"-"`
 }
 
 // FinalReportState represents a consolidated review report.
@@ -117,6 +127,127 @@ type AgentState struct {
 	PendingDecisions []PendingDecisionState `json:"pending_decisions"`
 	DeferredFixes    []DeferredFixState     `json:"deferred_fixes"`
 	WindowMapping    map[string]string      `json:"window_mapping"`
+
+	// Extra holds undeclared top-level keys
+	Extra map[string]json.RawMessage `json:"-"`
+}
+
+// The alias types have the same fields but no JSON methods, so the methods
+// below can use the default encoding for the declared fields.
+type (
+	taskResultStateJSON    TaskResultState
+	reviewFindingStateJSON ReviewFindingState
+	agentStateJSON         AgentState
+)
+
+func (t *TaskResultState) UnmarshalJSON(data []byte) error {
+	extra, err := unmarshalKeepingUnknown(data, (*taskResultStateJSON)(t))
+	t.Extra = extra
+	return err
+}
+
+func (t TaskResultState) MarshalJSON() ([]byte, error) {
+	return marshalWithUnknown(taskResultStateJSON(t), t.Extra)
+}
+
+func (f *ReviewFindingState) UnmarshalJSON(data []byte) error {
+	extra, err := unmarshalKeepingUnknown(data, (*reviewFindingStateJSON)(f))
+	f.Extra = extra
+	return err
+}
+
+func (f ReviewFindingState) MarshalJSON() ([]byte, error) {
+	return marshalWithUnknown(reviewFindingStateJSON(f), f.Extra)
+}
+
+func (s *AgentState) UnmarshalJSON(data []byte) error {
+	extra, err := unmarshalKeepingUnknown(data, (*agentStateJSON)(s))
+	s.Extra = extra
+	return err
+}
+
+func (s AgentState) MarshalJSON() ([]byte, error) {
+	return marshalWithUnknown(agentStateJSON(s), s.Extra)
+}
+
+var jsonFieldNameCache sync.Map // reflect.Type -> map[string]bool
+
+// jsonFieldNames returns the JSON keys declared by a struct type.
+func jsonFieldNames(t reflect.Type) map[string]bool {
+	if cached, ok := jsonFieldNameCache.Load(t); ok {
+		return cached.(map[string]bool)
+	}
+	names := make(map[string]bool, t.NumField())
+	for i := 0; i < t.NumField(); i++ {
+		tag := t.Field(i).Tag.Get("json")
+		name := strings.Split(tag, ",")[0]
+		if name == "-" {
+			continue
+		}
+		if name == "" {
+			name = t.Field(i).Name
+		}
+		names[name] = true
+	}
+	jsonFieldNameCache.Store(t, names)
+	return names
+}
+
+// unmarshalKeepingUnknown decodes data into v (a pointer to a struct) and
+// returns the keys of data that v does not declare.
+func unmarshalKeepingUnknown(data []byte, v any) (map[string]json.RawMessage, error) {
+	if err := json.Unmarshal(data, v); err != nil {
+		return nil, err
+	}
+	var raw map[string]json.RawMessage
+	if err := json.Unmarshal(data, &raw); err != nil {
+		return nil, err
+	}
+	known := jsonFieldNames(reflect.TypeOf(v).Elem())
+	for key := range raw {
+		if known[key] {
+			delete(raw, key)
+		}
+	}
+	if len(raw) == 0 {
+		return nil, nil
+	}
+	return raw, nil
+}
+
+// marshalWithUnknown encodes v (a struct) and appends the extra keys after
+// the declared fields, in sorted order. Declared fields win over extra keys
+// of the same name.
+func marshalWithUnknown(v any, extra map[string]json.RawMessage) ([]byte, error) {
+	data, err := json.Marshal(v)
+	if err != nil || len(extra) == 0 {
+		return data, err
+	}
+	known := jsonFieldNames(reflect.TypeOf(v))
+	keys := make([]string, 0, len(extra))
+	for key := range extra {
+		if !known[key] {
+			keys = append(keys, key)
+		}
+	}
+	sort.Strings(keys)
+
+	var buf bytes.Buffer
+	buf.Write(data[:len(data)-1])
+	for _, key := range keys {
+		if buf.Len() > 1 {
+			buf.WriteByte(',')
+		}
+		name, err := json.Marshal(key)
+		if err != nil {
+			return nil, err
+		}
+		buf.Write(name)
+		buf.WriteByte(':')
+		buf.Write(extra[key])
+	}
+	buf.WriteByte('}')
+	return buf.Bytes(), nil
 }
 
 // StateWriter handles atomic writes to AGENT_STATE.json.
@@ -181,6 +312,10 @@ func mergeExecutionFields(existing *TaskResultState, result *TaskResultState) {
 	// Update optional execution fields even when empty to clear stale results
 	existing.Output = result.Output
 	existing.Error = result.Error
+	// The Python blob store treats a field with a *_ref as already stored;
+	// drop the refs so the new output and error are not replaced by old blobs
+	delete(existing.Extra, "output_ref")
+	delete(existing.Extra, "error_ref")
 	existing.FilesChanged = result.FilesChanged
 	existing.Coverage = result.Coverage
 	existing.CoverageNum = result.CoverageNum
@@ -491,3 +491,129 @@ func TestStateRoundTripNewTaskPreservesAllFields(t *testing.T) {
 		t.Errorf("fix_attempts mismatch")
 	}
 }
+
+// TestStateRoundTripPreservesPythonOnlyFields verifies that a wrapper write keeps
+// keys the Go structs do not declare (detached field markers, blob refs, review
+// rollups, lifecycle timestamps) and drops the stale output/error refs of a task
+// whose execution fields it replaces.
+func TestStateRoundTripPreservesPythonOnlyFields(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "AGENT_STATE.json")
+
+	initial := `{
+  "spec_path": "/path/to/spec",
+  "session_name": "test-session",
+  "state_version": 2,
+  "tasks": [
+    {
+      "task_id": "task-1",
+      "status": "in_progress",
+      "output": "summary …",
+      "output_ref": "aa11",
+      "error_ref": "bb22",
+      "detached": {"fields": ["review_history"], "digest": "0123456789abcdef", "bytes": 2048},
+      "review_rollup": {"archived_rounds": 2, "rounds_by_severity": {"major": 2}},
+      "dispatched_at": "2026-01-08T00:00:00Z",
+      "execution_seconds": 12.5,
+      "review_seconds": 3.25
+    },
+    {
+      "task_id": "task-2",
+      "status": "completed",
+      "output_ref": "cc33",
+      "removed_at": "2026-01-09T00:00:00Z"
+    }
+  ],
+  "review_findings": [
+    {"task_id": "task-2", "reviewer": "codex", "severity": "minor", "summary": "Nit",
+     "details": "summary …", "details_ref": "dd44", "created_at": "2026-01-09T00:00:00Z"}
+  ],
+  "final_reports": [],
+  "blocked_items": [],
+  "pending_decisions": [],
+  "deferred_fixes": [],
+  "window_mapping": {}
+}`
+	if err := os.WriteFile(path, []byte(initial), 0644); err != nil {
+		t.Fatalf("write initial state: %v", err)
+	}
+
+	writer := NewStateWriter(path)
+	if err := writer.WriteTaskResult(TaskResultState{
+		TaskID:      "task-1",
+		Status:      "pending_review",
+		Output:      "new output",
+		CompletedAt: time.Now().UTC(),
+	}); err != nil {
+		t.Fatalf("write task result: %v", err)
+	}
+	if err := writer.WriteReviewFinding(ReviewFindingState{
+		TaskID:    "task-1",
+		Reviewer:  "codex",
+		Severity:  "none",
+		Summary:   "OK",
+		CreatedAt: time.Now().UTC(),
+	}); err != nil {
+		t.Fatalf("write review finding: %v", err)
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		t.Fatalf("read state: %v", err)
+	}
+	var raw struct {
+		StateVersion   int              `json:"state_version"`
+		Tasks          []map[string]any `json:"tasks"`
+		ReviewFindings []map[string]any `json:"review_findings"`
+	}
+	if err := json.Unmarshal(data, &raw); err != nil {
+		t.Fatalf("unmarshal state: %v", err)
+	}
+
+	if raw.StateVersion != 2 {
+		t.Errorf("top-level state_version lost: %d", raw.StateVersion)
+	}
+	if len(raw.Tasks) != 2 || len(raw.ReviewFindings) != 2 {
+		t.Fatalf("expected 2 tasks and 2 findings, got %d and %d", len(raw.Tasks), len(raw.ReviewFindings))
+	}
+
+	updated := raw.Tasks[0]
+	if updated["output"] != "new output" {
+		t.Errorf("output = %v, want new output", updated["output"])
+	}
+	if _, ok := updated["output_ref"]; ok {
+		t.Errorf("stale output_ref kept after new output")
+	}
+	if _, ok := updated["error_ref"]; ok {
+		t.Errorf("stale error_ref kept after new error")
+	}
+	detached, ok := updated["detached"].(map[string]any)
+	if !ok || detached["digest"] != "0123456789abcdef" {
+		t.Errorf("detached marker lost: %v", updated["detached"])
+	}
+	rollup, ok := updated["review_rollup"].(map[string]any)
+	if !ok || rollup["archived_rounds"] != float64(2) {
+		t.Errorf("review_rollup lost: %v", updated["review_rollup"])
+	}
+	if updated["dispatched_at"] != "2026-01-08T00:00:00Z" {
+		t.Errorf("dispatched_at lost: %v", updated["dispatched_at"])
+	}
+	if updated["execution_seconds"] != 12.5 || updated["review_seconds"] != 3.25 {
+		t.Errorf("timings lost: %v, %v", updated["execution_seconds"], updated["review_seconds"])
+	}
+
+	untouched := raw.Tasks[1]
+	if untouched["output_ref"] != "cc33" {
+		t.Errorf("output_ref of untouched task lost: %v", untouched["output_ref"])
+	}
+	if untouched["removed_at"] != "2026-01-09T00:00:00Z" {
+		t.Errorf("removed_at lost: %v", untouched["removed_at"])
+	}
+
+	if raw.ReviewFindings[0]["details_ref"] != "dd44" {
+		t.Errorf("details_ref lost: %v", raw.ReviewFindings[0]["details_ref"])
+	}
+	if _, ok := raw.ReviewFindings[1]["details_ref"]; ok {
+		t.Errorf("new finding gained a details_ref")
+	}
+}
@@ -17,18 +17,24 @@ from .spec_parser import (
     CircularDependencyError,
     MissingDependencyError,
     parse_tasks,
+    parse_tasks_stream,
+    iter_tasks,
     validate_spec_directory,
     extract_dependencies,
     get_ready_tasks,
     topological_sort,
     load_tasks_from_spec,
+    load_spec,
+    SpecLoadResult,
 )
 
 from .init_orchestration import (
     TaskEntry,
     AgentState,
     InitResult,
+    ReconcileResult,
     initialize_orchestration,
+    reconcile_state,
     assign_owner_agent,
     determine_criticality,
     convert_task_to_entry,
@@ -43,6 +49,13 @@ from .dispatch_batch import (
     build_task_configs,
 )
 
+from .task_index import (
+    TaskIndex,
+    TaskRecord,
+    TaskGraph,
+    find_task,
+)
+
 from .dispatch_reviews import (
     ReviewTaskConfig,
     ReviewReport,
@@ -66,16 +79,22 @@ __all__ = [
     "CircularDependencyError",
     "MissingDependencyError",
     "parse_tasks",
+    "parse_tasks_stream",
+    "iter_tasks",
     "validate_spec_directory",
     "extract_dependencies",
     "get_ready_tasks",
     "topological_sort",
     "load_tasks_from_spec",
+    "load_spec",
+    "SpecLoadResult",
     # init_orchestration
     "TaskEntry",
     "AgentState",
     "InitResult",
+    "ReconcileResult",
     "initialize_orchestration",
+    "reconcile_state",
     "assign_owner_agent",
     "determine_criticality",
     "convert_task_to_entry",
@@ -86,6 +105,11 @@ __all__ = [
     "dispatch_batch",
     "get_ready_tasks_from_state",
     "build_task_configs",
+    # task_index
+    "TaskIndex",
+    "TaskRecord",
+    "TaskGraph",
+    "find_task",
     # dispatch_reviews
     "ReviewTaskConfig",
     "ReviewReport",
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+End-to-End Throughput Benchmark for Multi-Agent Orchestration
+
+Runs the full init -> dispatch -> review -> consolidate -> fix loop cycle
+on a synthetic spec, with fake_codeagent_wrapper standing in for
+codeagent-wrapper, and reports:
+- makespan: wall time from init until no task can make progress
+- wrapper time: time spent inside the (simulated) wrapper invocations
+- orchestrator overhead: makespan minus wrapper time, in total and per task
+  (includes spawning the wrapper process)
+
+Usage:
+    benchmark_e2e.py [--tasks 50] [--latency 0.01] [--severity none=0.8,major=0.2]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_orchestration import FixtureConfig, generate_tasks_md
+from fake_codeagent_wrapper import (
+    SimulationConfig,
+    config_to_env,
+    install_fake_wrapper,
+    parse_severity_weights,
+)
+from init_orchestration import initialize_orchestration
+from dispatch_batch import dispatch_batch
+from dispatch_reviews import dispatch_reviews
+from consolidate_reviews import consolidate_reviews
+from state_store import load_state_file
+
+
+@dataclass
+class E2EResult:
+    """Outcome and timings of one end-to-end run"""
+    task_count: int
+    leaf_count: int
+    cycles: int
+    makespan: float
+    wrapper_seconds: float
+    overhead_seconds: float
+    overhead_per_task_ms: float
+    wrapper_invocations: int
+    completed: int
+    blocked: int
+    unfinished: int
+    fix_attempts: int
+
+
+@contextmanager
+def _patched_environ(updates: Dict[str, str]) -> Iterator[None]:
+    """Temporarily set environment variables (inherited by subprocesses)"""
+    saved = {key: os.environ.get(key) for key in updates}
+    os.environ.update(updates)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _status_snapshot(state_file: str) -> List[tuple]:
+    """(task_id, status, fix_attempts) for every task"""
+    state = load_state_file(state_file, detached=False)
+    return [(t["task_id"], t.get("status"), t.get("fix_attempts", 0)) for t in state.get("tasks", [])]
+
+
+def _read_invocations(log_file: str) -> List[Dict]:
+    """Invocation records written by the fake wrapper"""
+    try:
+        with open(log_file, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except OSError:
+        return []
+
+
+def run_e2e_benchmark(
+    fixture: FixtureConfig,
+    simulation: SimulationConfig,
+    max_cycles: int = 100,
+    work_dir: Optional[str] = None
+) -> E2EResult:
+    """
+    Run init and dispatch/review/consolidate cycles until no task changes.
+    
+    Args:
+        fixture: Synthetic spec shape (task_count, depth, ...)
+        simulation: Fake wrapper behaviour (latency, failures, severities)
+        max_cycles: Safety limit on dispatch cycles
+        work_dir: Directory for spec/state files (temporary if omitted)
+    
+    Returns:
+        E2EResult
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(work_dir or tmpdir)
+        spec_path = base / "spec"
+        spec_path.mkdir(parents=True, exist_ok=True)
+        (spec_path / "requirements.md").write_text("# Requirements\n\nSynthetic benchmark spec.\n")
+        (spec_path / "design.md").write_text("# Design\n\n## Overview\n\nSynthetic benchmark project.\n")
+        (spec_path / "tasks.md").write_text(generate_tasks_md(fixture))
+        
+        bin_dir = base / "bin"
+        install_fake_wrapper(str(bin_dir))
+        log_file = base / "wrapper.jsonl"
+        log_file.write_text("")
+        
+        sim = SimulationConfig(**{**asdict(simulation), "log_file": str(log_file)})
+        env = config_to_env(sim)
+        env["PATH"] = f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+        
+        with _patched_environ(env):
+            started = time.perf_counter()
+            init = initialize_orchestration(str(spec_path), output_dir=str(base / "out"), use_cache=False)
+            if not init.success:
+                raise RuntimeError(f"Initialization failed: {init.message} {init.errors}")
+            state_file = init.state_file
+            
+            cycles = 0
+            snapshot = _status_snapshot(state_file)
+            while cycles < max_cycles:
+                cycles += 1
+                dispatch_batch(state_file, workdir=str(base))
+                dispatch_reviews(state_file, workdir=str(base))
+                consolidate_reviews(state_file)
+                
+                current = _status_snapshot(state_file)
+                if current == snapshot:
+                    break
+                snapshot = current
+            makespan = time.perf_counter() - started
+        
+        tasks = load_state_file(state_file, detached=False)["tasks"]
+        invocations = _read_invocations(str(log_file))
+    
+    leaves = [t for t in tasks if not t.get("subtasks")]
+    wrapper_seconds = sum(r["finished"] - r["started"] for r in invocations)
+    overhead = max(0.0, makespan - wrapper_seconds)
+    
+    return E2EResult(
+        task_count=len(tasks),
+        leaf_count=len(leaves),
+        cycles=cycles,
+        makespan=makespan,
+        wrapper_seconds=wrapper_seconds,
+        overhead_seconds=overhead,
+        overhead_per_task_ms=overhead * 1000 / max(1, len(leaves)),
+        wrapper_invocations=len(invocations),
+        completed=sum(1 for t in leaves if t.get("status") == "completed"),
+        blocked=sum(1 for t in leaves if t.get("status") == "blocked"),
+        unfinished=sum(1 for t in leaves if t.get("status") not in ("completed", "blocked")),
+        fix_attempts=sum(t.get("fix_attempts", 0) for t in leaves),
+    )
+
+
+def main():
+    """Command line entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="End-to-end orchestration throughput with a fake codeagent-wrapper"
+    )
+    parser.add_argument("--tasks", type=int, default=50, help="Number of tasks in the synthetic spec")
+    parser.add_argument("--depth", type=int, default=2, help="Task hierarchy depth")
+    parser.add_argument("--dependency-density", type=float, default=0.3, help="Chance a task depends on earlier tasks")
+    parser.add_argument("--manifest-overlap", type=float, default=0.1, help="Chance a task writes a shared file")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean simulated task latency (s)")
+    parser.add_argument(
+        "--latency-dist", default="fixed", choices=["fixed", "uniform", "exponential", "lognormal"],
+        help="Latency distribution"
+    )
+    parser.add_argument("--workers", type=int, default=0, help="Simulated parallel workers (0 = unlimited)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Worker failure probability")
+    parser.add_argument("--severity", help="Review severity weights, e.g. none=0.8,major=0.2")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--max-cycles", type=int, default=100, help="Dispatch cycle limit")
+    parser.add_argument("--json", action="store_true", help="Output result as JSON")
+    
+    args = parser.parse_args()
+    
+    simulation = SimulationConfig(
+        latency=args.latency,
+        latency_dist=args.latency_dist,
+        workers=args.workers,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    if args.severity:
+        simulation.severity_weights = parse_severity_weights(args.severity)
+    
+    fixture = FixtureConfig(
+        task_count=args.tasks,
+        depth=args.depth,
+        dependency_density=args.dependency_density,
+        manifest_overlap=args.manifest_overlap,
+        seed=args.seed,
+    )
+    
+    result = run_e2e_benchmark(fixture, simulation, max_cycles=args.max_cycles)
+    
+    if args.json:
+        print(json.dumps(asdict(result), indent=2))
+    else:
+        print(f"Tasks: {result.task_count} ({result.leaf_count} leaf)  cycles: {result.cycles}")
+        print(f"  Makespan:              {result.makespan:.3f} s")
+        print(f"  Wrapper time:          {result.wrapper_seconds:.3f} s ({result.wrapper_invocations} invocations)")
+        print(f"  Orchestrator overhead: {result.overhead_seconds:.3f} s ({result.overhead_per_task_ms:.2f} ms/task)")
+        print(f"  Completed: {result.completed}  blocked: {result.blocked}  unfinished: {result.unfinished}"
+              f"  fix attempts: {result.fix_attempts}")
+
+
+if __name__ == "__main__":
+    main()
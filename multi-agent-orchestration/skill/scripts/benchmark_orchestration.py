@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+Scale Benchmarks for Multi-Agent Orchestration
+
+Generates synthetic tasks.md / AGENT_STATE fixtures and times the hot
+orchestration helpers across task counts:
+- parse_tasks, extract_dependencies, topological_sort (spec_parser)
+- get_ready_tasks, partition_by_conflicts (dispatch_batch)
+- update_parent_statuses (init_orchestration)
+- get_all_dependent_task_ids (fix_loop)
+- sync_pulse_from_state (sync_pulse)
+
+Results can be saved as a baseline JSON file and later runs compared
+against it; timings slower than baseline * tolerance are reported as
+regressions (exit code 1).
+
+Usage:
+    benchmark_orchestration.py [--sizes 10,100,1000] [--save-baseline]
+"""
+
+import json
+import logging
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from spec_parser import parse_tasks, extract_dependencies, topological_sort
+from init_orchestration import (
+    AgentState,
+    convert_task_to_entry,
+    generate_pulse_document,
+    update_parent_statuses,
+)
+from dispatch_batch import get_ready_tasks, partition_by_conflicts
+from fix_loop import get_all_dependent_task_ids
+from sync_pulse import sync_pulse_from_state
+
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+DEFAULT_BASELINE_FILE = str(Path(__file__).parent / "benchmark_baselines.json")
+BASELINE_VERSION = 1
+
+# Timings under this many seconds are treated as noise when comparing
+REGRESSION_MIN_DELTA = 0.005
+
+
+# ============================================================================
+# Fixture Generation
+# ============================================================================
+
+@dataclass
+class FixtureConfig:
+    """Shape of a synthetic spec"""
+    task_count: int = 100
+    depth: int = 2                      # hierarchy levels (1 = flat)
+    fanout: int = 4                     # subtasks per parent task
+    dependency_density: float = 0.3     # chance a task depends on earlier tasks
+    manifest_overlap: float = 0.1       # chance a write target is a shared file
+    review_history: int = 0             # review entries per task in AGENT_STATE
+    completed_fraction: float = 0.4     # leading leaf tasks marked completed
+    seed: int = 0
+
+
+@dataclass
+class Fixture:
+    """Generated spec content plus parsed tasks and derived state"""
+    config: FixtureConfig
+    tasks_md: str
+    tasks: List[Any]
+    state: Dict[str, Any]
+    pulse: str
+
+
+def _generate_task_ids(config: FixtureConfig) -> List[str]:
+    """Task IDs in file order (pre-order), exactly config.task_count of them"""
+    ids: List[str] = []
+    
+    def add_subtree(task_id: str, level: int) -> None:
+        if len(ids) >= config.task_count:
+            return
+        ids.append(task_id)
+        if level < config.depth:
+            for child in range(1, config.fanout + 1):
+                add_subtree(f"{task_id}.{child}", level + 1)
+    
+    top = 1
+    while len(ids) < config.task_count:
+        add_subtree(str(top), 1)
+        top += 1
+    return ids
+
+
+def generate_tasks_md(config: FixtureConfig) -> str:
+    """
+    Generate tasks.md content for the given fixture shape.
+    
+    Dependencies only point at earlier tasks with at most two ID segments
+    (the depth spec_parser resolves) that are not ancestors of the task, so
+    the graph is acyclic and every leaf can eventually run.
+    
+    Args:
+        config: Fixture shape
+    
+    Returns:
+        Markdown content of tasks.md
+    """
+    rng = random.Random(config.seed)
+    shared_files = [f"src/shared/module_{i}.py" for i in range(max(1, config.task_count // 50))]
+    lines = ["# Implementation Plan", ""]
+    dependency_targets: List[str] = []
+    
+    for task_id in _generate_task_ids(config):
+        level = task_id.count(".")
+        indent = "  " * level
+        lines.append(f"{indent}- [ ] {task_id} Implement feature step {task_id}")
+        
+        detail_indent = indent + "  "
+        if rng.random() < config.manifest_overlap:
+            write_target = rng.choice(shared_files)
+        else:
+            write_target = f"src/features/task_{task_id.replace('.', '_')}.py"
+        lines.append(f"{detail_indent}- _writes: {write_target}")
+        lines.append(f"{detail_indent}- _reads: {rng.choice(shared_files)}")
+        lines.append(f"{detail_indent}- Handle edge cases and add logging")
+        
+        if dependency_targets and rng.random() < config.dependency_density:
+            deps = set()
+            for _ in range(rng.randint(1, 2)):
+                candidate = rng.choice(dependency_targets)
+                if not task_id.startswith(candidate + "."):
+                    deps.add(candidate)
+            if deps:
+                lines.append(f"{detail_indent}- Depends on: {', '.join(sorted(deps))}")
+        
+        if level <= 1:
+            dependency_targets.append(task_id)
+        lines.append("")
+    
+    return "\n".join(lines)
+
+
+def generate_fixture(config: FixtureConfig) -> Fixture:
+    """
+    Generate tasks.md, parsed tasks, an in-flight AGENT_STATE and PULSE.
+    
+    The first completed_fraction of leaf tasks are completed, the next few
+    are in progress, and every task carries config.review_history review
+    entries. Parent statuses are derived from their subtasks.
+    
+    Args:
+        config: Fixture shape
+    
+    Returns:
+        Fixture
+    """
+    rng = random.Random(config.seed)
+    tasks_md = generate_tasks_md(config)
+    tasks = parse_tasks(tasks_md).tasks
+    extract_dependencies(tasks)
+    entries = [convert_task_to_entry(t) for t in tasks]
+    
+    state = AgentState(
+        spec_path="/bench/spec",
+        session_name="orch-bench",
+        tasks=[e.to_dict() for e in entries],
+    ).to_dict()
+    
+    leaves = [t for t in state["tasks"] if not t["subtasks"]]
+    completed_count = int(len(leaves) * config.completed_fraction)
+    for position, task in enumerate(leaves):
+        if position < completed_count:
+            task["status"] = "completed"
+            task["completed_at"] = f"2024-01-01T00:{position // 60 % 60:02d}:{position % 60:02d}Z"
+        elif position < completed_count + max(1, len(leaves) // 20):
+            task["status"] = "in_progress"
+    
+    severities = ["none", "minor", "major", "critical"]
+    for task in state["tasks"]:
+        task["review_history"] = [
+            {
+                "attempt": attempt,
+                "severity": rng.choice(severities),
+                "reviewed_at": "2024-01-01T00:00:00Z",
+            }
+            for attempt in range(config.review_history)
+        ]
+    
+    update_parent_statuses(state)
+    
+    pulse = generate_pulse_document(
+        state["spec_path"],
+        {"description": "Synthetic benchmark project", "diagram": "flowchart TB"},
+        entries,
+    )
+    return Fixture(config=config, tasks_md=tasks_md, tasks=tasks, state=state, pulse=pulse)
+
+
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+@dataclass
+class BenchmarkCase:
+    """One timed operation; max_tasks skips sizes where it is quadratic"""
+    name: str
+    run: Callable[[Fixture], Any]
+    max_tasks: Optional[int] = None
+
+
+@dataclass
+class BenchmarkResult:
+    """Best-of-N timing for one operation at one task count"""
+    name: str
+    task_count: int
+    seconds: float
+    repeat: int
+
+
+_quiet_log = logging.getLogger("benchmark_orchestration.quiet")
+_quiet_log.disabled = True
+
+
+def _first_dependency_target(fixture: Fixture) -> str:
+    """A task that others depend on (or the first task)"""
+    for task in fixture.state["tasks"]:
+        if task.get("dependencies"):
+            return task["dependencies"][0]
+    return fixture.state["tasks"][0]["task_id"]
+
+
+BENCHMARKS: List[BenchmarkCase] = [
+    BenchmarkCase("parse_tasks", lambda f: parse_tasks(f.tasks_md)),
+    BenchmarkCase("extract_dependencies", lambda f: extract_dependencies(f.tasks)),
+    BenchmarkCase("topological_sort", lambda f: topological_sort(f.tasks), max_tasks=10000),
+    BenchmarkCase("get_ready_tasks", lambda f: get_ready_tasks(f.state)),
+    BenchmarkCase(
+        "partition_by_conflicts",
+        lambda f: partition_by_conflicts(
+            [t for t in f.state["tasks"] if not t["subtasks"]], log=_quiet_log
+        ),
+        max_tasks=10000
+    ),
+    BenchmarkCase("update_parent_statuses", lambda f: update_parent_statuses(f.state)),
+    BenchmarkCase(
+        "get_all_dependent_task_ids",
+        lambda f: get_all_dependent_task_ids(f.state, _first_dependency_target(f))
+    ),
+    BenchmarkCase("sync_pulse_from_state", lambda f: sync_pulse_from_state(f.pulse, f.state)),
+]
+
+
+def time_case(case: BenchmarkCase, fixture: Fixture, repeat: int = 3) -> float:
+    """Best wall-clock time of `repeat` runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        case.run(fixture)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(
+    sizes: List[int],
+    repeat: int = 3,
+    names: Optional[List[str]] = None,
+    base_config: Optional[FixtureConfig] = None,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None
+) -> List[BenchmarkResult]:
+    """
+    Run the benchmark cases across task counts.
+    
+    Args:
+        sizes: Task counts to generate fixtures for
+        repeat: Runs per measurement (best time is kept)
+        names: Optional subset of benchmark names
+        base_config: Fixture shape; task_count is overridden per size
+        on_result: Optional callback per result (progress output)
+    
+    Returns:
+        List of BenchmarkResult
+    """
+    base_config = base_config or FixtureConfig()
+    cases = [c for c in BENCHMARKS if names is None or c.name in names]
+    results = []
+    
+    for size in sizes:
+        config_dict = asdict(base_config)
+        config_dict["task_count"] = size
+        fixture = generate_fixture(FixtureConfig(**config_dict))
+        
+        for case in cases:
+            if case.max_tasks is not None and size > case.max_tasks:
+                continue
+            result = BenchmarkResult(
+                name=case.name,
+                task_count=size,
+                seconds=time_case(case, fixture, repeat),
+                repeat=repeat
+            )
+            results.append(result)
+            if on_result:
+                on_result(result)
+    
+    return results
+
+
+# ============================================================================
+# Baselines
+# ============================================================================
+
+@dataclass
+class Regression:
+    """A benchmark slower than its baseline beyond the tolerance"""
+    name: str
+    task_count: int
+    baseline: float
+    current: float
+    
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def results_to_baseline(results: List[BenchmarkResult]) -> Dict[str, Any]:
+    """Baseline document: {"version", "results": {name: {task_count: seconds}}}"""
+    timings: Dict[str, Dict[str, float]] = {}
+    for result in results:
+        timings.setdefault(result.name, {})[str(result.task_count)] = round(result.seconds, 6)
+    return {"version": BASELINE_VERSION, "results": timings}
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    """Load a baseline file, or None if missing or from another version"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if baseline.get("version") != BASELINE_VERSION:
+        return None
+    return baseline
+
+
+def save_baseline(path: str, results: List[BenchmarkResult]) -> None:
+    """Write results as the new baseline (merged over existing entries)"""
+    baseline = load_baseline(path) or {"version": BASELINE_VERSION, "results": {}}
+    for name, timings in results_to_baseline(results)["results"].items():
+        baseline["results"].setdefault(name, {}).update(timings)
+    tmp_file = path + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, path)
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Any],
+    tolerance: float = 1.5,
+    min_delta: float = REGRESSION_MIN_DELTA
+) -> List[Regression]:
+    """
+    Compare results with a baseline.
+    
+    A result regresses when it is slower than baseline * tolerance and the
+    absolute slowdown exceeds min_delta (tiny timings are mostly noise).
+    Results without a baseline entry are ignored.
+    
+    Args:
+        results: Current benchmark results
+        baseline: Baseline document (see results_to_baseline)
+        tolerance: Allowed slowdown factor
+        min_delta: Minimum absolute slowdown in seconds
+    
+    Returns:
+        List of Regression
+    """
+    regressions = []
+    timings = baseline.get("results", {})
+    for result in results:
+        expected = timings.get(result.name, {}).get(str(result.task_count))
+        if expected is None:
+            continue
+        if result.seconds > expected * tolerance and result.seconds - expected > min_delta:
+            regressions.append(Regression(
+                name=result.name,
+                task_count=result.task_count,
+                baseline=expected,
+                current=result.seconds
+            ))
+    return regressions
+
+
+def main():
+    """Command line entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="Benchmark orchestration scripts on synthetic specs"
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="Comma-separated task counts (default: %(default)s)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    parser.add_argument("--only", help="Comma-separated benchmark names to run")
+    parser.add_argument("--depth", type=int, default=FixtureConfig.depth, help="Task hierarchy depth")
+    parser.add_argument("--fanout", type=int, default=FixtureConfig.fanout, help="Subtasks per parent")
+    parser.add_argument(
+        "--dependency-density", type=float, default=FixtureConfig.dependency_density,
+        help="Chance a task depends on earlier tasks"
+    )
+    parser.add_argument(
+        "--manifest-overlap", type=float, default=FixtureConfig.manifest_overlap,
+        help="Chance a task writes a shared file"
+    )
+    parser.add_argument(
+        "--review-history", type=int, default=FixtureConfig.review_history,
+        help="Review history entries per task"
+    )
+    parser.add_argument("--seed", type=int, default=FixtureConfig.seed, help="Random seed")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_FILE, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed slowdown vs baseline")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    
+    args = parser.parse_args()
+    
+    config = FixtureConfig(
+        depth=args.depth,
+        fanout=args.fanout,
+        dependency_density=args.dependency_density,
+        manifest_overlap=args.manifest_overlap,
+        review_history=args.review_history,
+        seed=args.seed,
+    )
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    names = [n.strip() for n in args.only.split(",")] if args.only else None
+    
+    def report(result: BenchmarkResult) -> None:
+        if not args.json:
+            print(f"  {result.name:<28} {result.task_count:>7} tasks  {result.seconds * 1000:>10.2f} ms")
+    
+    results = run_benchmarks(sizes, repeat=args.repeat, names=names, base_config=config, on_result=report)
+    
+    baseline = load_baseline(args.baseline)
+    regressions = find_regressions(results, baseline, args.tolerance) if baseline else []
+    
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+    
+    if args.json:
+        print(json.dumps({
+            "results": [asdict(r) for r in results],
+            "regressions": [dict(asdict(r), ratio=r.ratio) for r in regressions],
+        }, indent=2))
+    else:
+        if args.save_baseline:
+            print(f"📌 Baseline saved: {args.baseline}")
+        elif baseline is None:
+            print(f"ℹ️  No baseline at {args.baseline} (use --save-baseline)")
+        for regression in regressions:
+            print(
+                f"⚠️  Regression: {regression.name} @ {regression.task_count} tasks: "
+                f"{regression.current * 1000:.2f} ms vs {regression.baseline * 1000:.2f} ms "
+                f"({regression.ratio:.1f}x)"
+            )
+        if baseline is not None and not regressions:
+            print("✅ No regressions against baseline")
+    
+    if regressions and not args.save_baseline:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Blob Store for Large State Text
+
+Worker output, worker errors and review finding details are kept out of
+AGENT_STATE.json:
+- Each text at least BLOB_MIN_BYTES long is stored once, zlib-compressed,
+  under <state>.blobs/<sha256[:2]>/<sha256> (identical texts share a blob)
+- The state keeps a short summary in the original field plus
+  "<field>_ref" holding the sha256
+- inline_blob_fields() restores the full text where a command needs it
+  (review prompts, fix prompts and human fallback decisions)
+
+A text whose "<field>_ref" is set is treated as already stored; code that
+assigns a new value to such a field drops the ref (see clear_blob_ref).
+
+Usage:
+    blob_store.py cat AGENT_STATE.json <sha256>
+    blob_store.py stats AGENT_STATE.json
+"""
+
+import hashlib
+import os
+import sys
+import zlib
+from typing import Any, Dict, Iterable, Tuple
+
+
+# Texts shorter than this stay inline
+BLOB_MIN_BYTES = 512
+
+# Length of the inline summary that replaces a stored text
+SUMMARY_CHARS = 200
+
+REF_SUFFIX = "_ref"
+
+TASK_BLOB_FIELDS = ("output", "error")
+FINDING_BLOB_FIELDS = ("details",)
+
+
+def blob_dir_for(state_file: str) -> str:
+    """Blob directory for a state file: AGENT_STATE.blobs/"""
+    base, _ = os.path.splitext(state_file)
+    return base + ".blobs"
+
+
+def summarize_text(text: str, limit: int = SUMMARY_CHARS) -> str:
+    """First limit characters of text, marked as truncated"""
+    if len(text) <= limit:
+        return text
+    return text[:limit].rstrip() + " …"
+
+
+class BlobStore:
+    """
+    sha256-addressed, zlib-compressed text blobs in one directory.
+    
+    put() is idempotent: a blob that already exists is not rewritten.
+    """
+    
+    def __init__(self, root: str):
+        self.root = root
+        self.writes = 0
+    
+    def path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+    
+    def put(self, text: str) -> str:
+        """
+        Store text.
+        
+        Returns:
+            The sha256 hex digest addressing it
+        """
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_file = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(zlib.compress(data, 6))
+            os.replace(tmp_file, path)
+            self.writes += 1
+        return digest
+    
+    def get(self, digest: str) -> str:
+        """Read a stored text (raises FileNotFoundError for unknown digests)"""
+        with open(self.path(digest), 'rb') as f:
+            return zlib.decompress(f.read()).decode("utf-8")
+
+
+def clear_blob_ref(item: Dict[str, Any], field_name: str) -> None:
+    """Forget the stored text of a field that is about to be overwritten"""
+    item.pop(field_name + REF_SUFFIX, None)
+
+
+def _externalize(item: Dict[str, Any], fields: Tuple[str, ...], store: BlobStore) -> int:
+    stored = 0
+    for field_name in fields:
+        text = item.get(field_name)
+        ref_key = field_name + REF_SUFFIX
+        if not isinstance(text, str) or ref_key in item or len(text.encode("utf-8")) < BLOB_MIN_BYTES:
+            continue
+        item[ref_key] = store.put(text)
+        item[field_name] = summarize_text(text)
+        stored += 1
+    return stored
+
+
+def _blob_items(state: Dict[str, Any]) -> Iterable[Tuple[Dict[str, Any], Tuple[str, ...]]]:
+    """Every dict holding blob fields, with the fields it may hold"""
+    for task in state.get("tasks", []):
+        if not isinstance(task, dict):
+            continue
+        yield task, TASK_BLOB_FIELDS
+        for entry in task.get("review_history", []):
+            if isinstance(entry, dict):
+                for finding in entry.get("findings", []):
+                    if isinstance(finding, dict):
+                        yield finding, FINDING_BLOB_FIELDS
+    for finding in state.get("review_findings", []):
+        if isinstance(finding, dict):
+            yield finding, FINDING_BLOB_FIELDS
+
+
+def externalize_blobs(state: Dict[str, Any], store: BlobStore) -> int:
+    """
+    Move large text fields of the state into the store, in place.
+    
+    Args:
+        state: AGENT_STATE dictionary
+        store: Blob store of the state file
+    
+    Returns:
+        Number of fields replaced by summaries
+    """
+    if not isinstance(state, dict):
+        return 0
+    return sum(_externalize(item, fields, store) for item, fields in _blob_items(state))
+
+
+def inline_blob_fields(
+    store: BlobStore,
+    items: Iterable[Dict[str, Any]],
+    fields: Tuple[str, ...]
+) -> int:
+    """
+    Replace summaries with the full stored text, in place.
+    
+    The ref is dropped; the next save stores the text again, which is a
+    no-op for an unchanged text because the blob already exists.
+    
+    Args:
+        store: Blob store of the state file
+        items: Tasks or findings
+        fields: Fields to restore (e.g. ("output",) or ("details",))
+    
+    Returns:
+        Number of fields restored
+    """
+    restored = 0
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        for field_name in fields:
+            digest = item.get(field_name + REF_SUFFIX)
+            if not digest:
+                continue
+            try:
+                item[field_name] = store.get(digest)
+            except FileNotFoundError:
+                continue
+            clear_blob_ref(item, field_name)
+            restored += 1
+    return restored
+
+
+def inline_all_blobs(state: Dict[str, Any], store: BlobStore) -> int:
+    """Restore every stored text of the state, in place"""
+    return sum(inline_blob_fields(store, [item], fields) for item, fields in _blob_items(state))
+
+
+def main():
+    """Command line entry point"""
+    import argparse
+    import json
+    
+    parser = argparse.ArgumentParser(description="Inspect the blob store of an AGENT_STATE.json")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    cat_parser = subparsers.add_parser("cat", help="Print a stored text")
+    cat_parser.add_argument("state_file", help="Path to AGENT_STATE.json")
+    cat_parser.add_argument("digest", help="sha256 from a *_ref field")
+    stats_parser = subparsers.add_parser("stats", help="Blob count and sizes")
+    stats_parser.add_argument("state_file", help="Path to AGENT_STATE.json")
+    
+    args = parser.parse_args()
+    store = BlobStore(blob_dir_for(args.state_file))
+    
+    if args.command == "cat":
+        try:
+            sys.stdout.write(store.get(args.digest))
+        except FileNotFoundError:
+            print(f"❌ No blob {args.digest} in {store.root}")
+            sys.exit(1)
+        return
+    
+    count = stored = 0
+    for directory, _, files in os.walk(store.root):
+        for name in files:
+            count += 1
+            stored += os.path.getsize(os.path.join(directory, name))
+    print(json.dumps({"blob_dir": store.root, "blobs": count, "stored_bytes": stored}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,6 @@ Requirements: 8.9
 """
 
 import json
-import os
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -23,6 +22,13 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 # Import fix loop functions for triggering fix loop on critical/major (Req 3.1, 4.6)
 from fix_loop import enter_fix_loop, should_enter_fix_loop
+from dispatch_reviews import index_review_findings
+from task_index import TaskIndex, find_task
+from tracing import enable_tracing, traced, TRACE_ENV_VAR
+from profiling import add_profiling_arguments, profiling_from_args
+from review_retention import apply_review_retention
+from state_store import attach_detached_fields, load_state_file, write_state_file
+from lifecycle_metrics import export_metrics_for_state_file, METRICS_ENV_VAR
 
 
 # Severity ordering (highest to lowest)
@@ -64,18 +70,16 @@ class ConsolidationResult:
     errors: List[str] = field(default_factory=list)
 
 
-def load_agent_state(state_file: str) -> Dict[str, Any]:
-    """Load AGENT_STATE.json"""
-    with open(state_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+@traced("state.load")
+def load_agent_state(state_file: str, detached: bool = True) -> Dict[str, Any]:
+    """Load AGENT_STATE.json (detached=False skips detached task output/history)"""
+    return load_state_file(state_file, detached=detached)
 
 
+@traced("state.save")
 def save_agent_state(state_file: str, state: Dict[str, Any]) -> None:
     """Save AGENT_STATE.json atomically"""
-    tmp_file = state_file + ".tmp"
-    with open(tmp_file, 'w', encoding='utf-8') as f:
-        json.dump(state, f, indent=2)
-    os.replace(tmp_file, state_file)
+    write_state_file(state_file, state)
 
 
 def get_tasks_in_final_review(state: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -88,9 +92,17 @@ def get_tasks_in_final_review(state: Dict[str, Any]) -> List[Dict[str, Any]]:
 
 def get_review_findings_for_task(
     state: Dict[str, Any],
-    task_id: str
+    task_id: str,
+    findings_index: Optional[Dict[str, List[Dict[str, Any]]]] = None
 ) -> List[Dict[str, Any]]:
-    """Get all review findings for a specific task"""
+    """
+    Get all review findings for a specific task.
+    
+    Uses findings_index (from index_review_findings) when provided,
+    otherwise scans review_findings.
+    """
+    if findings_index is not None:
+        return list(findings_index.get(task_id, []))
     return [
         finding for finding in state.get("review_findings", [])
         if finding.get("task_id") == task_id
@@ -146,14 +158,15 @@ def generate_summary(findings: List[Dict[str, Any]], task_id: str) -> str:
 
 def consolidate_findings(
     state: Dict[str, Any],
-    task_id: str
+    task_id: str,
+    findings_index: Optional[Dict[str, List[Dict[str, Any]]]] = None
 ) -> Optional[FinalReport]:
     """
     Consolidate all review findings for a task into a final report.
     
     Requirement 8.9: Consolidate findings into Final_Report
     """
-    findings = get_review_findings_for_task(state, task_id)
+    findings = get_review_findings_for_task(state, task_id, findings_index)
     
     if not findings:
         return None
@@ -183,15 +196,19 @@ def add_final_report(state: Dict[str, Any], report: FinalReport) -> None:
     state.setdefault("final_reports", []).append(report.to_dict())
 
 
-def update_task_to_completed(state: Dict[str, Any], task_id: str) -> None:
+def update_task_to_completed(
+    state: Dict[str, Any],
+    task_id: str,
+    task_index: Optional[TaskIndex] = None
+) -> None:
     """Update task status to completed"""
-    for task in state.get("tasks", []):
-        if task["task_id"] == task_id:
-            task["status"] = "completed"
-            task["completed_at"] = datetime.now(timezone.utc).isoformat()
-            break
+    task = find_task(state, task_id, task_index)
+    if task:
+        task["status"] = "completed"
+        task["completed_at"] = datetime.now(timezone.utc).isoformat()
 
 
+@traced("consolidate_reviews")
 def consolidate_reviews(
     state_file: str,
     task_ids: Optional[List[str]] = None,
@@ -212,7 +229,7 @@ def consolidate_reviews(
     """
     # Load state
     try:
-        state = load_agent_state(state_file)
+        state = load_agent_state(state_file, detached=False)
     except Exception as e:
         return ConsolidationResult(
             success=False,
@@ -237,13 +254,23 @@ def consolidate_reviews(
     consolidated_task_ids = []
     errors = []
     
+    # Index tasks, findings and existing reports once instead of rescanning per task
+    task_index = TaskIndex(state)
+    findings_index = index_review_findings(state)
+    reported_task_ids = {
+        report.get("task_id") for report in state.get("final_reports", [])
+    }
+    
+    # The fix loop appends to review_history
+    attach_detached_fields(state_file, filter(None, (task_index.get(task_id) for task_id in task_ids)))
+    
     for task_id in task_ids:
         # Skip if already has final report
-        if has_existing_final_report(state, task_id):
+        if task_id in reported_task_ids:
             continue
         
         # Consolidate findings
-        report = consolidate_findings(state, task_id)
+        report = consolidate_findings(state, task_id, findings_index)
         
         if report is None:
             errors.append(f"No review findings found for task {task_id}")
@@ -251,19 +278,21 @@ def consolidate_reviews(
         
         # Add final report
         add_final_report(state, report)
+        reported_task_ids.add(task_id)
         reports_created += 1
         consolidated_task_ids.append(task_id)
         
         # Check if fix loop is needed (Req 3.1, 4.6)
         if should_enter_fix_loop(report.overall_severity):
             # Enter fix loop instead of completing
-            enter_fix_loop(state, task_id, report.findings)
+            enter_fix_loop(state, task_id, report.findings, task_index)
         elif auto_complete:
             # Only mark as completed if no critical/major issues
-            update_task_to_completed(state, task_id)
+            update_task_to_completed(state, task_id, task_index)
     
-    # Save state
+    # Archive old review rounds and settled findings, then save state
     try:
+        apply_review_retention(state, state_file)
         save_agent_state(state_file, state)
     except Exception as e:
         return ConsolidationResult(
@@ -355,38 +384,53 @@ def main():
         action="store_true",
         help="Output result as JSON"
     )
-    
-    args = parser.parse_args()
-    
-    result = consolidate_reviews(
-        args.state_file,
-        task_ids=args.task_ids,
-        auto_complete=not args.no_complete
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help=f"Append timing spans to FILE as JSON lines (or set {TRACE_ENV_VAR})"
     )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="FILE",
+        help=f"Write per-task lifecycle metrics to FILE in OpenMetrics format (or set {METRICS_ENV_VAR})"
+    )
+    add_profiling_arguments(parser)
     
-    if args.json:
-        output = {
-            "success": result.success,
-            "message": result.message,
-            "reports_created": result.reports_created,
-            "task_ids": result.task_ids,
-            "errors": result.errors
-        }
-        print(json.dumps(output, indent=2))
-    else:
-        if result.success:
-            print(f"✅ {result.message}")
-            if result.task_ids:
-                print(f"   Tasks: {', '.join(result.task_ids)}")
-            if result.errors:
-                print("   Warnings:")
+    args = parser.parse_args()
+    if args.trace:
+        enable_tracing(args.trace)
+    
+    with profiling_from_args("consolidate_reviews", args):
+        result = consolidate_reviews(
+            args.state_file,
+            task_ids=args.task_ids,
+            auto_complete=not args.no_complete
+        )
+        export_metrics_for_state_file(args.state_file, args.metrics_file)
+        
+        if args.json:
+            output = {
+                "success": result.success,
+                "message": result.message,
+                "reports_created": result.reports_created,
+                "task_ids": result.task_ids,
+                "errors": result.errors
+            }
+            print(json.dumps(output, indent=2))
+        else:
+            if result.success:
+                print(f"✅ {result.message}")
+                if result.task_ids:
+                    print(f"   Tasks: {', '.join(result.task_ids)}")
+                if result.errors:
+                    print("   Warnings:")
+                    for error in result.errors:
+                        print(f"   - {error}")
+            else:
+                print(f"❌ {result.message}")
                 for error in result.errors:
                     print(f"   - {error}")
-        else:
-            print(f"❌ {result.message}")
-            for error in result.errors:
-                print(f"   - {error}")
-            sys.exit(1)
+                sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -17,9 +17,9 @@ Requirements: 1.1, 1.2, 1.3, 1.4, 1.6, 1.7, 2.3, 2.4, 2.5, 2.6, 2.7, 9.1, 9.3, 9
 
 import json
 import logging
-import os
 import subprocess
 import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -28,8 +28,8 @@ from typing import List, Dict, Optional, Any, Set
 # Add script directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Import update_parent_statuses for parent status aggregation (Req 1.3, 1.4, 1.5)
-from init_orchestration import update_parent_statuses
+# Import parent status aggregation (Req 1.3, 1.4, 1.5)
+from init_orchestration import update_parent_statuses, propagate_parent_statuses
 
 # Import leaf task filtering and dependency expansion from spec_parser (Req 1.1, 1.2, 1.6, 1.7)
 from spec_parser import is_leaf_task, expand_dependencies, Task
@@ -37,6 +37,27 @@ from spec_parser import is_leaf_task, expand_dependencies, Task
 # Import fix loop processing (Req 3.1, 4.6)
 from fix_loop import process_fix_loop, get_fix_required_tasks, on_fix_task_complete, rollback_fix_dispatch
 
+# Import task index for O(1) task lookups and integer-indexed dependency sweeps
+from task_index import TaskIndex, TaskGraph
+
+# Import timing spans (no-op unless ORCHESTRATION_TRACE / --trace is set)
+from tracing import enable_tracing, span, traced, TRACE_ENV_VAR
+from profiling import add_profiling_arguments, profiling_from_args
+
+# Import content-addressed storage of large output, error and finding text
+from blob_store import BlobStore, FINDING_BLOB_FIELDS, TASK_BLOB_FIELDS, blob_dir_for, clear_blob_ref, inline_blob_fields
+
+# Import coalesced state writes
+from state_store import StateWriter, attach_detached_fields, load_state_file, write_state_file, STATE_FORMAT_ENV_VAR
+
+# Import lifecycle timing records and metrics export
+from lifecycle_metrics import (
+    record_execution_timings,
+    export_metrics_for_state_file,
+    utc_now,
+    METRICS_ENV_VAR,
+)
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -250,18 +271,45 @@ class DispatchResult:
     errors: List[str] = field(default_factory=list)
 
 
-def load_agent_state(state_file: str) -> Dict[str, Any]:
-    """Load AGENT_STATE.json"""
-    with open(state_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+@traced("state.load")
+def load_agent_state(state_file: str, detached: bool = True) -> Dict[str, Any]:
+    """Load AGENT_STATE.json (detached=False skips detached task output/history)"""
+    return load_state_file(state_file, detached=detached)
 
 
+@traced("state.save")
 def save_agent_state(state_file: str, state: Dict[str, Any]) -> None:
     """Save AGENT_STATE.json atomically"""
-    tmp_file = state_file + ".tmp"
-    with open(tmp_file, 'w', encoding='utf-8') as f:
-        json.dump(state, f, indent=2)
-    os.replace(tmp_file, state_file)
+    write_state_file(state_file, state)
+
+
+def load_fix_task_text(state_file: str, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Restore the full text that fix prompts and human fallbacks quote.
+    
+    Fix prompts quote the task output; escalation prompts and human
+    fallback decisions quote every review round kept in review_history.
+    Attaches the detached fields of fix_required tasks and inlines their
+    stored output, error and finding details.
+    
+    Args:
+        state_file: Path to AGENT_STATE.json
+        state: AGENT_STATE loaded with detached=False (modified in place)
+    
+    Returns:
+        The fix_required tasks
+    """
+    fix_tasks = get_fix_required_tasks(state)
+    if not fix_tasks:
+        return fix_tasks
+    attach_detached_fields(state_file, fix_tasks)
+    blob_store = BlobStore(blob_dir_for(state_file))
+    inline_blob_fields(blob_store, fix_tasks, TASK_BLOB_FIELDS)
+    for task in fix_tasks:
+        for entry in task.get("review_history", []):
+            if isinstance(entry, dict):
+                inline_blob_fields(blob_store, entry.get("findings", []), FINDING_BLOB_FIELDS)
+    return fix_tasks
 
 
 def get_completed_task_ids(state: Dict[str, Any], strict: bool = True) -> Set[str]:
@@ -303,6 +351,18 @@ def get_completed_task_ids(state: Dict[str, Any], strict: bool = True) -> Set[st
     return completed
 
 
+class _TaskLike:
+    """Slotted Task stand-in exposing the fields spec_parser helpers read"""
+    __slots__ = ("task_id", "subtasks", "dependencies", "status", "is_optional")
+    
+    def __init__(self, d: Dict[str, Any]):
+        self.task_id = d.get("task_id", "")
+        self.subtasks = d.get("subtasks", [])
+        self.dependencies = d.get("dependencies", [])
+        self.status = d.get("status", "not_started")
+        self.is_optional = d.get("is_optional", False)
+
+
 def _dict_to_task_like(task_dict: Dict[str, Any]) -> Any:
     """
     Convert a task dictionary to a Task-like object for use with spec_parser functions.
@@ -310,14 +370,7 @@ def _dict_to_task_like(task_dict: Dict[str, Any]) -> Any:
     This creates a simple object with the attributes needed by is_leaf_task() and
     expand_dependencies() without requiring a full Task dataclass.
     """
-    class TaskLike:
-        def __init__(self, d: Dict[str, Any]):
-            self.task_id = d.get("task_id", "")
-            self.subtasks = d.get("subtasks", [])
-            self.dependencies = d.get("dependencies", [])
-            self.status = d.get("status", "not_started")
-            self.is_optional = d.get("is_optional", False)
-    return TaskLike(task_dict)
+    return _TaskLike(task_dict)
 
 
 def get_ready_tasks(state: Dict[str, Any], strict_dependencies: bool = True) -> List[Dict[str, Any]]:
@@ -340,33 +393,26 @@ def get_ready_tasks(state: Dict[str, Any], strict_dependencies: bool = True) ->
     completed = get_completed_task_ids(state, strict=strict_dependencies)
     ready = []
     
-    # Build task map for dependency expansion
-    task_map = {}
-    for task_dict in state.get("tasks", []):
-        task_like = _dict_to_task_like(task_dict)
-        task_map[task_like.task_id] = task_like
+    # Integer-indexed graph: parent dependency expansion is memoized per parent
+    graph = TaskGraph(state.get("tasks", []))
+    satisfied = bytearray(task_id in completed for task_id in graph.ids)
     
-    for task_dict in state.get("tasks", []):
-        task_like = _dict_to_task_like(task_dict)
-        
+    for record in graph.records:
         # Skip parent tasks (they have subtasks) - Req 1.1, 1.2
-        if not is_leaf_task(task_like):
+        if not record.is_leaf:
             continue
         
         # Skip non-startable tasks
-        if task_dict.get("status") != "not_started":
+        if record.status != "not_started":
             continue
         
         # Skip optional tasks (marked with is_optional)
-        if task_dict.get("is_optional", False):
+        if record.is_optional:
             continue
         
         # Expand and check dependencies - Req 1.6, 1.7
-        dependencies = task_dict.get("dependencies", [])
-        expanded_deps = expand_dependencies(dependencies, task_map)
-        
-        if all(dep in completed for dep in expanded_deps):
-            ready.append(task_dict)
+        if all(satisfied[dep] for dep in graph.expanded_dependencies(record.index)):
+            ready.append(record.task)
     
     return ready
 
@@ -520,52 +566,64 @@ def invoke_codeagent_wrapper(
 def update_task_statuses(
     state: Dict[str, Any],
     task_ids: List[str],
-    new_status: str
+    new_status: str,
+    task_index: Optional[TaskIndex] = None
 ) -> None:
     """Update task statuses in state"""
-    for task in state.get("tasks", []):
-        if task["task_id"] in task_ids:
-            task["status"] = new_status
+    if task_index is None:
+        task_index = TaskIndex(state)
+    task_index.set_status(task_ids, new_status)
 
 
+@traced("dispatch.process_report")
 def process_execution_report(
     state: Dict[str, Any],
-    report: ExecutionReport
+    report: ExecutionReport,
+    task_index: Optional[TaskIndex] = None
 ) -> None:
     """
     Process execution report and update state.
     
     Requirement 9.4: Process Execution Report
+    
+    Uses a TaskIndex so processing is O(results) rather than O(results x tasks).
     """
+    if task_index is None:
+        task_index = TaskIndex(state)
+    
     for result in report.task_results:
         task_id = result.get("task_id")
         if not task_id:
             continue
         
         # Find and update task
-        for task in state.get("tasks", []):
-            if task["task_id"] == task_id:
-                # Update status based on result
-                if result.get("status") == "completed" or result.get("exit_code", 1) == 0:
-                    task["status"] = "pending_review"
-                elif result.get("status") == "blocked":
-                    task["status"] = "blocked"
-                
-                # Copy result fields
-                for field in ["exit_code", "output", "error", "files_changed", 
-                             "coverage", "coverage_num", "tests_passed", "tests_failed",
-                             "window_id", "pane_id"]:
-                    if field in result:
-                        task[field] = result[field]
-                
-                task["completed_at"] = datetime.utcnow().isoformat() + "Z"
-                break
+        task = task_index.get(task_id)
+        if task is None:
+            continue
+        
+        # Update status based on result
+        if result.get("status") == "completed" or result.get("exit_code", 1) == 0:
+            task["status"] = "pending_review"
+        elif result.get("status") == "blocked":
+            task["status"] = "blocked"
+        
+        # Copy result fields
+        for field in ["exit_code", "output", "error", "files_changed", 
+                     "coverage", "coverage_num", "tests_passed", "tests_failed",
+                     "window_id", "pane_id"]:
+            if field in result:
+                task[field] = result[field]
+                clear_blob_ref(task, field)
+        
+        task["completed_at"] = datetime.utcnow().isoformat() + "Z"
 
 
+@traced("dispatch_batch")
 def dispatch_batch(
     state_file: str,
     workdir: str = ".",
-    dry_run: bool = False
+    dry_run: bool = False,
+    compact_state: Optional[bool] = None
 ) -> DispatchResult:
     """
     Dispatch ready tasks to worker agents with file conflict detection.
@@ -575,10 +633,17 @@ def dispatch_batch(
     
     Also processes fix_required tasks through the fix loop before getting ready tasks.
     
+    State changes are coalesced by a StateWriter: the state file is written
+    once at the end of the cycle, and in between only when the writer's
+    time or change-count threshold is reached (so batches of long-running
+    agents are still persisted as they complete).
+    
     Args:
         state_file: Path to AGENT_STATE.json
         workdir: Working directory for tasks
         dry_run: If True, don't actually invoke codeagent-wrapper
+        compact_state: Write the state file without indentation
+            (default: compact unless $ORCHESTRATION_STATE_FORMAT=pretty)
     
     Returns:
         DispatchResult with execution details
@@ -590,7 +655,7 @@ def dispatch_batch(
     """
     # Load state
     try:
-        state = load_agent_state(state_file)
+        state = load_agent_state(state_file, detached=False)
     except Exception as e:
         return DispatchResult(
             success=False,
@@ -598,9 +663,15 @@ def dispatch_batch(
             errors=[str(e)]
         )
     
+    # Index tasks once; the task list is not replaced during dispatch
+    task_index = TaskIndex(state)
+    state_writer = StateWriter(state_file, state, compact=compact_state)
+    
+    load_fix_task_text(state_file, state)
+    
     # Process fix loop first (Req 3.1, 4.6)
     # This handles fix_required tasks and returns fix requests to dispatch
-    fix_requests = process_fix_loop(state)
+    fix_requests = process_fix_loop(state, task_index)
     fix_tasks_dispatched = 0
     fix_dispatch_failures = 0
     total_dispatched = 0
@@ -632,12 +703,15 @@ def dispatch_batch(
             if not dry_run:
                 # Invoke codeagent-wrapper for fix task
                 session_name = state.get("session_name", "orchestration")
-                report = invoke_codeagent_wrapper(
-                    [fix_config],
-                    session_name,
-                    state_file,
-                    dry_run=False
-                )
+                dispatched_at = utc_now()
+                started = time.monotonic()
+                with span("dispatch.wrapper", tasks=1, fix=True):
+                    report = invoke_codeagent_wrapper(
+                        [fix_config],
+                        session_name,
+                        state_file,
+                        dry_run=False
+                    )
                 
                 has_execution_report = True
                 total_completed += report.tasks_completed
@@ -648,14 +722,17 @@ def dispatch_batch(
                 if report.success:
                     fix_tasks_dispatched += 1
                     # Process the fix task result
-                    process_execution_report(state, report)
+                    process_execution_report(state, report, task_index)
+                    record_execution_timings(
+                        state, report.task_results, dispatched_at, time.monotonic() - started, task_index
+                    )
                     # Call on_fix_task_complete to increment fix_attempts and transition to pending_review (Req 7.1, 7.2, 7.3)
-                    on_fix_task_complete(state, task_id)
+                    on_fix_task_complete(state, task_id, task_index)
                 else:
                     overall_success = False
                     fix_dispatch_failures += 1
                     # Fix task dispatch failed - rollback status to fix_required (Req 7.4, 7.5)
-                    rollback_fix_dispatch(state, task_id)
+                    rollback_fix_dispatch(state, task_id, task_index)
                     logger.warning(f"Fix task {task_id} dispatch failed, rolled back to fix_required")
                     logger.error(f"Fix task {task_id} dispatch failed: {report.errors}")
                     if not report.errors:
@@ -664,19 +741,26 @@ def dispatch_batch(
                 fix_tasks_dispatched += 1
                 print(f"DRY RUN - Would dispatch fix task: {task_id}")
         
-        # Save state after fix loop processing
+        # Record fix loop changes (written with the rest of the cycle)
         if not dry_run:
-            save_agent_state(state_file, state)
+            state_writer.mark_dirty(len(fix_requests))
+    
+    # Bring parent statuses in line once per cycle, covering fix loop transitions.
+    # Batches below only propagate their own changes up the parent chain.
+    # (Req 1.3, 1.4, 1.5, 8.1, 8.2, 8.3)
+    if not dry_run:
+        update_parent_statuses(state, task_index)
     
     # Get ready tasks (not_started leaf tasks with satisfied dependencies)
-    ready_tasks = get_ready_tasks(state)
+    with span("dispatch.ready_tasks", tasks=len(task_index)) as s:
+        ready_tasks = get_ready_tasks(state)
+        s.set(ready=len(ready_tasks))
     
     if not ready_tasks:
         # No new tasks ready, but we may have dispatched fix tasks
-        # Always update parent statuses before returning (Req 8.1, 8.2, 8.3)
         if not dry_run:
-            update_parent_statuses(state)
-            save_agent_state(state_file, state)
+            state_writer.mark_dirty()
+            state_writer.flush()
         
         combined_report = None
         if has_execution_report:
@@ -718,7 +802,9 @@ def dispatch_batch(
         )
     
     # Partition tasks into conflict-free batches (Req 2.3, 2.4, 2.5, 2.6, 2.7)
-    batches = partition_by_conflicts(ready_tasks, logger)
+    with span("dispatch.partition", tasks=len(ready_tasks)) as s:
+        batches = partition_by_conflicts(ready_tasks, logger)
+        s.set(batches=len(batches))
     
     if len(batches) > 1:
         logger.info(f"Partitioned {len(ready_tasks)} tasks into {len(batches)} conflict-free batches")
@@ -737,12 +823,16 @@ def dispatch_batch(
         configs = build_task_configs(batch, spec_path, workdir)
         
         # Invoke codeagent-wrapper for this batch
-        report = invoke_codeagent_wrapper(
-            configs,
-            session_name,
-            state_file,
-            dry_run=dry_run
-        )
+        dispatched_at = utc_now()
+        started = time.monotonic()
+        with span("dispatch.wrapper", tasks=len(configs), batch=batch_idx + 1):
+            report = invoke_codeagent_wrapper(
+                configs,
+                session_name,
+                state_file,
+                dry_run=dry_run
+            )
+        elapsed = time.monotonic() - started
         
         has_execution_report = True
         total_dispatched += len(configs)
@@ -755,9 +845,10 @@ def dispatch_batch(
         if not dry_run:
             if report.success:
                 # Dispatch succeeded - update tasks to in_progress first
-                update_task_statuses(state, batch_task_ids, "in_progress")
+                update_task_statuses(state, batch_task_ids, "in_progress", task_index)
                 # Then process individual task results
-                process_execution_report(state, report)
+                process_execution_report(state, report, task_index)
+                record_execution_timings(state, report.task_results, dispatched_at, elapsed, task_index)
             else:
                 overall_success = False
                 # Dispatch failed - ensure tasks remain in not_started for retry
@@ -765,21 +856,26 @@ def dispatch_batch(
                 
                 # Process any partial results we did get
                 if report.task_results:
-                    update_task_statuses(state, list(tasks_with_results), "in_progress")
-                    process_execution_report(state, report)
+                    update_task_statuses(state, list(tasks_with_results), "in_progress", task_index)
+                    process_execution_report(state, report, task_index)
+                    record_execution_timings(state, report.task_results, dispatched_at, elapsed, task_index)
                 
                 # Log batch failure
                 logger.error(f"Batch {batch_idx + 1} failed: {report.errors}")
             
-            # Update parent statuses after each batch (Req 1.3, 1.4, 1.5)
-            update_parent_statuses(state)
+            # Propagate this batch's status changes to ancestors (Req 1.3, 1.4, 1.5)
+            propagate_parent_statuses(state, batch_task_ids, task_index)
             
-            # Save state after each batch
-            save_agent_state(state_file, state)
+            # Record this batch; written at the end of the cycle or once a threshold is reached
+            state_writer.mark_dirty(len(batch))
         
         # If batch failed, we might want to stop (but continue for now to process all batches)
         # Future enhancement: add option to stop on first failure
     
+    # One write for the whole cycle
+    if not dry_run:
+        state_writer.flush()
+    
     # Build combined execution report
     combined_report = ExecutionReport(
         success=overall_success,
@@ -842,39 +938,67 @@ def main():
         action="store_true",
         help="Output result as JSON"
     )
-    
-    args = parser.parse_args()
-    
-    result = dispatch_batch(
-        args.state_file,
-        workdir=args.workdir,
-        dry_run=args.dry_run
+    state_format = parser.add_mutually_exclusive_group()
+    state_format.add_argument(
+        "--pretty-state",
+        action="store_true",
+        help=f"Write AGENT_STATE.json indented instead of compact (or set {STATE_FORMAT_ENV_VAR}=pretty)"
+    )
+    state_format.add_argument(
+        "--compact-state",
+        action="store_true",
+        help=f"Write AGENT_STATE.json compact even if {STATE_FORMAT_ENV_VAR}=pretty (compact is the default)"
     )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help=f"Append timing spans to FILE as JSON lines (or set {TRACE_ENV_VAR})"
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="FILE",
+        help=f"Write per-task lifecycle metrics to FILE in OpenMetrics format (or set {METRICS_ENV_VAR})"
+    )
+    add_profiling_arguments(parser)
     
-    if args.json:
-        output = {
-            "success": result.success,
-            "message": result.message,
-            "tasks_dispatched": result.tasks_dispatched,
-            "errors": result.errors
-        }
-        if result.execution_report:
-            output["execution_report"] = {
-                "tasks_completed": result.execution_report.tasks_completed,
-                "tasks_failed": result.execution_report.tasks_failed,
+    args = parser.parse_args()
+    if args.trace:
+        enable_tracing(args.trace)
+    
+    with profiling_from_args("dispatch_batch", args):
+        result = dispatch_batch(
+            args.state_file,
+            workdir=args.workdir,
+            dry_run=args.dry_run,
+            compact_state=False if args.pretty_state else (True if args.compact_state else None)
+        )
+        if not args.dry_run:
+            export_metrics_for_state_file(args.state_file, args.metrics_file)
+        
+        if args.json:
+            output = {
+                "success": result.success,
+                "message": result.message,
+                "tasks_dispatched": result.tasks_dispatched,
+                "errors": result.errors
             }
-        print(json.dumps(output, indent=2))
-    else:
-        if result.success:
-            print(f"✅ {result.message}")
             if result.execution_report:
-                print(f"   Completed: {result.execution_report.tasks_completed}")
-                print(f"   Failed: {result.execution_report.tasks_failed}")
+                output["execution_report"] = {
+                    "tasks_completed": result.execution_report.tasks_completed,
+                    "tasks_failed": result.execution_report.tasks_failed,
+                }
+            print(json.dumps(output, indent=2))
         else:
-            print(f"❌ {result.message}")
-            for error in result.errors:
-                print(f"   - {error}")
-            sys.exit(1)
+            if result.success:
+                print(f"✅ {result.message}")
+                if result.execution_report:
+                    print(f"   Completed: {result.execution_report.tasks_completed}")
+                    print(f"   Failed: {result.execution_report.tasks_failed}")
+            else:
+                print(f"❌ {result.message}")
+                for error in result.errors:
+                    print(f"   - {error}")
+                sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -12,9 +12,9 @@ Requirements: 8.1, 8.2, 8.3, 8.4
 """
 
 import json
-import os
 import subprocess
 import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -26,6 +26,18 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Import fix loop functions for review completion handling (Req 3.1, 4.6)
 from fix_loop import on_review_complete, should_enter_fix_loop
 
+# Import task index for O(1) task lookups
+from task_index import TaskIndex
+
+# Import timing spans (no-op unless ORCHESTRATION_TRACE / --trace is set)
+from tracing import enable_tracing, span, traced, TRACE_ENV_VAR
+from profiling import add_profiling_arguments, profiling_from_args
+from blob_store import BlobStore, blob_dir_for, inline_blob_fields
+from state_store import attach_detached_fields, load_state_file, write_state_file
+
+# Import lifecycle timing records and metrics export
+from lifecycle_metrics import record_review_timings, export_metrics_for_state_file, METRICS_ENV_VAR
+
 
 # Review count by criticality (Requirement 8.5, 8.6)
 REVIEW_COUNT_BY_CRITICALITY = {
@@ -79,18 +91,16 @@ class ReviewDispatchResult:
     errors: List[str] = field(default_factory=list)
 
 
-def load_agent_state(state_file: str) -> Dict[str, Any]:
-    """Load AGENT_STATE.json"""
-    with open(state_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+@traced("state.load")
+def load_agent_state(state_file: str, detached: bool = True) -> Dict[str, Any]:
+    """Load AGENT_STATE.json (detached=False skips detached task output/history)"""
+    return load_state_file(state_file, detached=detached)
 
 
+@traced("state.save")
 def save_agent_state(state_file: str, state: Dict[str, Any]) -> None:
     """Save AGENT_STATE.json atomically"""
-    tmp_file = state_file + ".tmp"
-    with open(tmp_file, 'w', encoding='utf-8') as f:
-        json.dump(state, f, indent=2)
-    os.replace(tmp_file, state_file)
+    write_state_file(state_file, state)
 
 
 def get_tasks_pending_review(state: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -298,20 +308,29 @@ def invoke_codeagent_wrapper(
         )
 
 
-def update_task_to_under_review(state: Dict[str, Any], task_ids: List[str]) -> None:
+def update_task_to_under_review(
+    state: Dict[str, Any],
+    task_ids: List[str],
+    task_index: Optional[TaskIndex] = None
+) -> None:
     """Update tasks to under_review status"""
-    for task in state.get("tasks", []):
-        if task["task_id"] in task_ids:
-            task["status"] = "under_review"
+    if task_index is None:
+        task_index = TaskIndex(state)
+    task_index.set_status(task_ids, "under_review")
 
 
-def rollback_tasks_to_pending_review(state: Dict[str, Any], task_ids: List[str]) -> None:
+def rollback_tasks_to_pending_review(
+    state: Dict[str, Any],
+    task_ids: List[str],
+    task_index: Optional[TaskIndex] = None
+) -> None:
     """Rollback tasks to pending_review status (for failed dispatch)"""
-    for task in state.get("tasks", []):
-        if task["task_id"] in task_ids and task.get("status") == "under_review":
-            task["status"] = "pending_review"
+    if task_index is None:
+        task_index = TaskIndex(state)
+    task_index.set_status(task_ids, "pending_review", from_statuses=["under_review"])
 
 
+@traced("reviews.process_report")
 def add_review_findings(
     state: Dict[str, Any],
     report: ReviewReport
@@ -335,14 +354,36 @@ def add_review_findings(
         state.setdefault("review_findings", []).append(finding)
 
 
-def check_all_reviews_complete(state: Dict[str, Any], task_id: str) -> bool:
-    """Check if all required reviews are complete for a task"""
+def index_review_findings(state: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group review findings by task_id in a single pass.
+    
+    Lets callers that inspect many tasks look up findings in O(1) per task
+    instead of rescanning review_findings for each one.
+    """
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    for finding in state.get("review_findings", []):
+        index.setdefault(finding.get("task_id"), []).append(finding)
+    return index
+
+
+def check_all_reviews_complete(
+    state: Dict[str, Any],
+    task_id: str,
+    findings_index: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    task_index: Optional[TaskIndex] = None
+) -> bool:
+    """
+    Check if all required reviews are complete for a task.
+    
+    Pass a findings_index from index_review_findings() (and a TaskIndex)
+    when checking many tasks to avoid rescanning state on every call.
+    """
     # Find task
-    task = None
-    for t in state.get("tasks", []):
-        if t["task_id"] == task_id:
-            task = t
-            break
+    if task_index is not None:
+        task = task_index.get(task_id)
+    else:
+        task = next((t for t in state.get("tasks", []) if t["task_id"] == task_id), None)
     
     if not task:
         return False
@@ -350,10 +391,13 @@ def check_all_reviews_complete(state: Dict[str, Any], task_id: str) -> bool:
     required_count = get_review_count(task)
     
     # Count completed reviews
-    completed_count = sum(
-        1 for f in state.get("review_findings", [])
-        if f.get("task_id") == task_id
-    )
+    if findings_index is not None:
+        completed_count = len(findings_index.get(task_id, []))
+    else:
+        completed_count = sum(
+            1 for f in state.get("review_findings", [])
+            if f.get("task_id") == task_id
+        )
     
     return completed_count >= required_count
 
@@ -361,16 +405,19 @@ def check_all_reviews_complete(state: Dict[str, Any], task_id: str) -> bool:
 def update_completed_reviews_to_final(state: Dict[str, Any]) -> List[str]:
     """Update tasks with all reviews complete to final_review status"""
     updated = []
+    findings_index = index_review_findings(state)
     
     for task in state.get("tasks", []):
         if task.get("status") == "under_review":
-            if check_all_reviews_complete(state, task["task_id"]):
+            completed_count = len(findings_index.get(task["task_id"], []))
+            if completed_count >= get_review_count(task):
                 task["status"] = "final_review"
                 updated.append(task["task_id"])
     
     return updated
 
 
+@traced("dispatch_reviews")
 def dispatch_reviews(
     state_file: str,
     workdir: str = ".",
@@ -394,7 +441,7 @@ def dispatch_reviews(
     """
     # Load state
     try:
-        state = load_agent_state(state_file)
+        state = load_agent_state(state_file, detached=False)
     except Exception as e:
         return ReviewDispatchResult(
             success=False,
@@ -412,27 +459,35 @@ def dispatch_reviews(
             reviews_dispatched=0
         )
     
-    # Build review configs
+    # Build review configs (review prompts include the worker output)
+    attach_detached_fields(state_file, pending_tasks)
+    inline_blob_fields(BlobStore(blob_dir_for(state_file)), pending_tasks, ("output",))
     spec_path = state.get("spec_path", ".")
     session_name = state.get("session_name", "orchestration")
     configs = build_review_configs(pending_tasks, spec_path, workdir)
     task_ids = [t["task_id"] for t in pending_tasks]
     
     # Invoke codeagent-wrapper (don't update state until we know result)
-    report = invoke_codeagent_wrapper(
-        configs,
-        session_name,
-        state_file,
-        dry_run=dry_run
-    )
+    started = time.monotonic()
+    with span("reviews.wrapper", reviews=len(configs), tasks=len(pending_tasks)):
+        report = invoke_codeagent_wrapper(
+            configs,
+            session_name,
+            state_file,
+            dry_run=dry_run
+        )
+    elapsed = time.monotonic() - started
     
     # Process results based on success/failure
     if not dry_run:
+        # Index tasks once for the status and timing updates below
+        task_index = TaskIndex(state)
         if report.success:
             # Dispatch succeeded - update tasks to under_review
-            update_task_to_under_review(state, task_ids)
+            update_task_to_under_review(state, task_ids, task_index)
             # Process review findings
             add_review_findings(state, report)
+            record_review_timings(state, task_ids, elapsed, task_index)
             # Check if any tasks have all reviews complete
             update_completed_reviews_to_final(state)
         else:
@@ -456,8 +511,9 @@ def dispatch_reviews(
             
             # Only update tasks that got at least some results
             if tasks_with_results:
-                update_task_to_under_review(state, list(tasks_with_results))
+                update_task_to_under_review(state, list(tasks_with_results), task_index)
                 add_review_findings(state, report)
+                record_review_timings(state, tasks_with_results, elapsed, task_index)
                 update_completed_reviews_to_final(state)
             
             # Tasks without any results stay as pending_review (no change needed
@@ -500,39 +556,55 @@ def main():
         action="store_true",
         help="Output result as JSON"
     )
-    
-    args = parser.parse_args()
-    
-    result = dispatch_reviews(
-        args.state_file,
-        workdir=args.workdir,
-        dry_run=args.dry_run
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help=f"Append timing spans to FILE as JSON lines (or set {TRACE_ENV_VAR})"
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="FILE",
+        help=f"Write per-task lifecycle metrics to FILE in OpenMetrics format (or set {METRICS_ENV_VAR})"
     )
+    add_profiling_arguments(parser)
     
-    if args.json:
-        output = {
-            "success": result.success,
-            "message": result.message,
-            "reviews_dispatched": result.reviews_dispatched,
-            "errors": result.errors
-        }
-        if result.review_report:
-            output["review_report"] = {
-                "reviews_completed": result.review_report.reviews_completed,
-                "reviews_failed": result.review_report.reviews_failed,
+    args = parser.parse_args()
+    if args.trace:
+        enable_tracing(args.trace)
+    
+    with profiling_from_args("dispatch_reviews", args):
+        result = dispatch_reviews(
+            args.state_file,
+            workdir=args.workdir,
+            dry_run=args.dry_run
+        )
+        if not args.dry_run:
+            export_metrics_for_state_file(args.state_file, args.metrics_file)
+        
+        if args.json:
+            output = {
+                "success": result.success,
+                "message": result.message,
+                "reviews_dispatched": result.reviews_dispatched,
+                "errors": result.errors
             }
-        print(json.dumps(output, indent=2))
-    else:
-        if result.success:
-            print(f"✅ {result.message}")
             if result.review_report:
-                print(f"   Completed: {result.review_report.reviews_completed}")
-                print(f"   Failed: {result.review_report.reviews_failed}")
+                output["review_report"] = {
+                    "reviews_completed": result.review_report.reviews_completed,
+                    "reviews_failed": result.review_report.reviews_failed,
+                }
+            print(json.dumps(output, indent=2))
         else:
-            print(f"❌ {result.message}")
-            for error in result.errors:
-                print(f"   - {error}")
-            sys.exit(1)
+            if result.success:
+                print(f"✅ {result.message}")
+                if result.review_report:
+                    print(f"   Completed: {result.review_report.reviews_completed}")
+                    print(f"   Failed: {result.review_report.reviews_failed}")
+            else:
+                print(f"❌ {result.message}")
+                for error in result.errors:
+                    print(f"   - {error}")
+                sys.exit(1)
 
 
 if __name__ == "__main__":
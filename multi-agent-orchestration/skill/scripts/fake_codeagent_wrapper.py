@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Fake codeagent-wrapper for Offline Benchmarks and Tests
+
+Stand-in for `codeagent-wrapper --parallel` that needs no tmux session or
+AI backend. It reads the ---TASK--- heredoc produced by
+TaskConfig.to_heredoc / ReviewTaskConfig.to_heredoc from stdin, simulates
+each task and prints the JSON execution (or review) report that
+dispatch_batch / dispatch_reviews parse.
+
+Simulation settings come from command line flags or, because the
+orchestration scripts invoke the wrapper with fixed arguments, from
+FAKE_CODEAGENT_* environment variables:
+- FAKE_CODEAGENT_LATENCY       mean per-task latency in seconds (default 0)
+- FAKE_CODEAGENT_LATENCY_DIST  fixed | uniform | exponential | lognormal
+- FAKE_CODEAGENT_WORKERS       parallel workers (default: all tasks at once)
+- FAKE_CODEAGENT_FAILURE_RATE  chance a worker task fails (default 0)
+- FAKE_CODEAGENT_SEVERITY      review severity weights, e.g.
+                               "none=0.7,minor=0.2,major=0.08,critical=0.02"
+- FAKE_CODEAGENT_SEED          random seed (default 0)
+- FAKE_CODEAGENT_LOG           JSONL file receiving one line per invocation
+
+Results are deterministic for a given seed: each task draws from a random
+stream keyed by its id and, for reviews, the task's fix_attempts read from
+--state-file (so a fixed task gets a fresh review outcome).
+
+Install by putting an executable named codeagent-wrapper that runs this
+script first on PATH (see install_fake_wrapper).
+"""
+
+import json
+import math
+import os
+import random
+import stat
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+ENV_PREFIX = "FAKE_CODEAGENT_"
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+DEFAULT_SEVERITY_WEIGHTS = {"none": 0.7, "minor": 0.2, "major": 0.08, "critical": 0.02}
+
+SEVERITY_SUMMARIES = {
+    "none": "No issues found",
+    "minor": "Minor style improvements suggested",
+    "major": "Significant bug in error handling",
+    "critical": "Security issue: unvalidated input reaches a shell command",
+}
+
+
+@dataclass
+class HeredocTask:
+    """One ---TASK--- block"""
+    task_id: str
+    backend: str = ""
+    workdir: str = "."
+    dependencies: List[str] = field(default_factory=list)
+    content: str = ""
+
+
+@dataclass
+class SimulationConfig:
+    """How the fake wrapper behaves"""
+    latency: float = 0.0
+    latency_dist: str = "fixed"
+    workers: int = 0                    # 0 = unlimited parallelism
+    failure_rate: float = 0.0
+    severity_weights: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_SEVERITY_WEIGHTS))
+    seed: int = 0
+    log_file: Optional[str] = None
+    sleep: bool = True                  # False: report latencies without waiting
+
+
+def parse_heredoc_tasks(text: str) -> List[HeredocTask]:
+    """
+    Parse codeagent-wrapper --parallel heredoc input.
+    
+    Blocks start with a "---TASK---" line, followed by "key: value" header
+    lines and a "---CONTENT---" line; everything up to the next
+    "---TASK---" line is content (the blank separator line between blocks
+    is dropped).
+    
+    Args:
+        text: Heredoc input
+    
+    Returns:
+        List of HeredocTask in input order
+    """
+    tasks: List[HeredocTask] = []
+    current: Optional[HeredocTask] = None
+    content_lines: Optional[List[str]] = None
+    
+    def finish() -> None:
+        if current is None:
+            return
+        if content_lines is not None:
+            lines = content_lines
+            if lines and lines[-1] == "":
+                lines = lines[:-1]
+            current.content = "\n".join(lines)
+        tasks.append(current)
+    
+    for line in text.split("\n"):
+        if line == "---TASK---":
+            finish()
+            current = HeredocTask(task_id="")
+            content_lines = None
+        elif current is None:
+            continue
+        elif content_lines is not None:
+            content_lines.append(line)
+        elif line == "---CONTENT---":
+            content_lines = []
+        elif ":" in line:
+            key, value = line.split(":", 1)
+            key, value = key.strip(), value.strip()
+            if key == "id":
+                current.task_id = value
+            elif key == "backend":
+                current.backend = value
+            elif key == "workdir":
+                current.workdir = value
+            elif key == "dependencies":
+                current.dependencies = [d.strip() for d in value.split(",") if d.strip()]
+    
+    finish()
+    return tasks
+
+
+def parse_severity_weights(spec: str) -> Dict[str, float]:
+    """Parse "none=0.7,minor=0.2,..." into a weight dict"""
+    weights = {}
+    for part in spec.split(","):
+        if "=" not in part:
+            continue
+        name, value = part.split("=", 1)
+        weights[name.strip()] = float(value)
+    if not weights or sum(weights.values()) <= 0:
+        raise ValueError(f"Invalid severity weights: {spec!r}")
+    return weights
+
+
+def config_from_env(environ: Optional[Dict[str, str]] = None) -> SimulationConfig:
+    """Build a SimulationConfig from FAKE_CODEAGENT_* variables"""
+    env = os.environ if environ is None else environ
+    
+    def get(name: str, default: str) -> str:
+        return env.get(ENV_PREFIX + name, default)
+    
+    config = SimulationConfig(
+        latency=float(get("LATENCY", "0")),
+        latency_dist=get("LATENCY_DIST", "fixed"),
+        workers=int(get("WORKERS", "0")),
+        failure_rate=float(get("FAILURE_RATE", "0")),
+        seed=int(get("SEED", "0")),
+        log_file=get("LOG", "") or None,
+    )
+    if get("SEVERITY", ""):
+        config.severity_weights = parse_severity_weights(get("SEVERITY", ""))
+    return config
+
+
+def config_to_env(config: SimulationConfig) -> Dict[str, str]:
+    """FAKE_CODEAGENT_* variables reproducing a SimulationConfig"""
+    env = {
+        ENV_PREFIX + "LATENCY": str(config.latency),
+        ENV_PREFIX + "LATENCY_DIST": config.latency_dist,
+        ENV_PREFIX + "WORKERS": str(config.workers),
+        ENV_PREFIX + "FAILURE_RATE": str(config.failure_rate),
+        ENV_PREFIX + "SEVERITY": ",".join(f"{k}={v}" for k, v in config.severity_weights.items()),
+        ENV_PREFIX + "SEED": str(config.seed),
+    }
+    if config.log_file:
+        env[ENV_PREFIX + "LOG"] = config.log_file
+    return env
+
+
+def sample_latency(rng: random.Random, config: SimulationConfig) -> float:
+    """Draw one task latency (seconds) with the configured mean"""
+    mean = config.latency
+    if mean <= 0:
+        return 0.0
+    if config.latency_dist == "uniform":
+        return rng.uniform(0, 2 * mean)
+    if config.latency_dist == "exponential":
+        return rng.expovariate(1 / mean)
+    if config.latency_dist == "lognormal":
+        sigma = 0.5
+        return rng.lognormvariate(math.log(mean) - sigma * sigma / 2, sigma)
+    return mean
+
+
+def schedule_makespan(latencies: List[float], workers: int) -> float:
+    """Makespan of running tasks in order on `workers` parallel slots"""
+    if not latencies:
+        return 0.0
+    if workers <= 0 or workers >= len(latencies):
+        return max(latencies)
+    slots = [0.0] * workers
+    for latency in latencies:
+        slot = min(range(workers), key=slots.__getitem__)
+        slots[slot] += latency
+    return max(slots)
+
+
+def _fix_attempts_by_task(state_file: Optional[str]) -> Dict[str, int]:
+    """fix_attempts per task from AGENT_STATE.json (empty if unreadable)"""
+    if not state_file:
+        return {}
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {t.get("task_id"): t.get("fix_attempts", 0) for t in state.get("tasks", [])}
+
+
+def _files_changed(task: HeredocTask) -> List[str]:
+    """Files declared with _writes: in the task content, or a synthetic path"""
+    files: List[str] = []
+    for line in task.content.split("\n"):
+        stripped = line.strip().lstrip("-").strip()
+        if stripped.lower().startswith("_writes:"):
+            files.extend(f.strip() for f in stripped[len("_writes:"):].split(",") if f.strip())
+    return files or [f"src/{task.task_id.replace('.', '_')}.py"]
+
+
+def simulate_execution(
+    tasks: List[HeredocTask],
+    config: SimulationConfig
+) -> Tuple[Dict[str, Any], List[float]]:
+    """
+    Simulate worker tasks.
+    
+    Returns:
+        Tuple of (execution report dict, per-task latencies)
+    """
+    results = []
+    latencies = []
+    for task in tasks:
+        rng = random.Random(f"{config.seed}:task:{task.task_id}:{task.content}")
+        latency = sample_latency(rng, config)
+        latencies.append(latency)
+        failed = rng.random() < config.failure_rate
+        result: Dict[str, Any] = {
+            "task_id": task.task_id,
+            "status": "failed" if failed else "completed",
+            "exit_code": 1 if failed else 0,
+            "duration_ms": round(latency * 1000, 3),
+        }
+        if failed:
+            result["error"] = "Simulated worker failure"
+        else:
+            result["output"] = f"Implemented {task.task_id} via {task.backend or 'default'} backend"
+            result["files_changed"] = _files_changed(task)
+            result["tests_passed"] = rng.randint(1, 20)
+            result["tests_failed"] = 0
+        results.append(result)
+    
+    failed_count = sum(1 for r in results if r["exit_code"] != 0)
+    report = {
+        "tasks_completed": len(results) - failed_count,
+        "tasks_failed": failed_count,
+        "task_results": results,
+        "errors": [f"Task {r['task_id']} failed" for r in results if r["exit_code"] != 0],
+    }
+    return report, latencies
+
+
+def simulate_reviews(
+    tasks: List[HeredocTask],
+    config: SimulationConfig,
+    fix_attempts: Dict[str, int]
+) -> Tuple[Dict[str, Any], List[float]]:
+    """
+    Simulate review tasks (review id in "id", reviewed task in "dependencies").
+    
+    Returns:
+        Tuple of (review report dict, per-review latencies)
+    """
+    severities = list(config.severity_weights)
+    weights = [config.severity_weights[s] for s in severities]
+    results = []
+    latencies = []
+    for task in tasks:
+        reviewed = task.dependencies[0] if task.dependencies else ""
+        attempt = fix_attempts.get(reviewed, 0)
+        rng = random.Random(f"{config.seed}:review:{task.task_id}:{attempt}")
+        latency = sample_latency(rng, config)
+        latencies.append(latency)
+        severity = rng.choices(severities, weights)[0]
+        results.append({
+            "review_id": task.task_id,
+            "task_id": reviewed,
+            "status": "completed",
+            "severity": severity,
+            "summary": SEVERITY_SUMMARIES.get(severity, f"{severity} findings"),
+            "details": f"Simulated review of {reviewed} (fix attempt {attempt})",
+            "duration_ms": round(latency * 1000, 3),
+        })
+    
+    report = {
+        "reviews_completed": len(results),
+        "reviews_failed": 0,
+        "review_results": results,
+        "errors": [],
+    }
+    return report, latencies
+
+
+def run_wrapper(
+    stdin_text: str,
+    config: SimulationConfig,
+    review: bool = False,
+    state_file: Optional[str] = None
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Simulate one codeagent-wrapper --parallel invocation.
+    
+    Sleeps for the simulated makespan (unless config.sleep is False) and
+    appends an invocation record to config.log_file if set.
+    
+    Returns:
+        Tuple of (report dict, process exit code)
+    """
+    started = time.time()
+    tasks = parse_heredoc_tasks(stdin_text)
+    
+    if review:
+        report, latencies = simulate_reviews(tasks, config, _fix_attempts_by_task(state_file))
+        exit_code = 0
+    else:
+        report, latencies = simulate_execution(tasks, config)
+        exit_code = 1 if report["tasks_failed"] else 0
+    
+    makespan = schedule_makespan(latencies, config.workers)
+    if config.sleep and makespan > 0:
+        time.sleep(makespan)
+    
+    if config.log_file:
+        record = {
+            "mode": "review" if review else "execute",
+            "tasks": len(tasks),
+            "started": started,
+            "finished": time.time(),
+            "simulated_makespan": makespan,
+            "simulated_task_seconds": sum(latencies),
+            "exit_code": exit_code,
+        }
+        with open(config.log_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+    
+    return report, exit_code
+
+
+def install_fake_wrapper(bin_dir: str) -> str:
+    """
+    Create an executable named codeagent-wrapper in bin_dir that runs this
+    script with the current interpreter. Prepend bin_dir to PATH to use it.
+    
+    Returns:
+        Path to the created executable
+    """
+    Path(bin_dir).mkdir(parents=True, exist_ok=True)
+    shim = Path(bin_dir) / "codeagent-wrapper"
+    shim.write_text(
+        "#!/bin/sh\n"
+        f"exec \"{sys.executable}\" \"{Path(__file__).resolve()}\" \"$@\"\n",
+        encoding="utf-8"
+    )
+    shim.chmod(shim.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return str(shim)
+
+
+def main():
+    """Command line entry point (codeagent-wrapper compatible arguments)"""
+    import argparse
+    
+    env_config = config_from_env()
+    
+    parser = argparse.ArgumentParser(
+        description="Fake codeagent-wrapper: simulates --parallel task execution offline"
+    )
+    parser.add_argument("--parallel", action="store_true", help="Accepted for compatibility")
+    parser.add_argument("--tmux-session", help="Accepted for compatibility")
+    parser.add_argument("--state-file", help="AGENT_STATE.json (read for fix attempts)")
+    parser.add_argument("--review", action="store_true", help="Simulate review tasks")
+    parser.add_argument("--latency", type=float, default=env_config.latency, help="Mean task latency (s)")
+    parser.add_argument(
+        "--latency-dist", choices=LATENCY_DISTRIBUTIONS, default=env_config.latency_dist,
+        help="Latency distribution"
+    )
+    parser.add_argument("--workers", type=int, default=env_config.workers, help="Parallel workers (0 = unlimited)")
+    parser.add_argument("--failure-rate", type=float, default=env_config.failure_rate, help="Worker failure probability")
+    parser.add_argument("--severity", help="Review severity weights, e.g. none=0.7,major=0.3")
+    parser.add_argument("--seed", type=int, default=env_config.seed, help="Random seed")
+    parser.add_argument("--log", default=env_config.log_file, help="Append invocation records (JSONL)")
+    parser.add_argument("--no-sleep", action="store_true", help="Report latencies without waiting")
+    
+    args = parser.parse_args()
+    
+    config = SimulationConfig(
+        latency=args.latency,
+        latency_dist=args.latency_dist,
+        workers=args.workers,
+        failure_rate=args.failure_rate,
+        severity_weights=parse_severity_weights(args.severity) if args.severity else env_config.severity_weights,
+        seed=args.seed,
+        log_file=args.log,
+        sleep=not args.no_sleep,
+    )
+    
+    report, exit_code = run_wrapper(sys.stdin.read(), config, review=args.review, state_file=args.state_file)
+    print(json.dumps(report, indent=2))
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
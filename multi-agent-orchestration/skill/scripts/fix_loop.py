@@ -23,7 +23,9 @@ from typing import List, Dict, Any, Optional, Set
 # Add script directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from spec_parser import expand_dependencies, Task
+from task_index import TaskIndex, TaskGraph, find_task
+from tracing import traced
+from review_retention import format_review_rollup
 
 
 # Constants
@@ -75,7 +77,11 @@ def should_enter_fix_loop(severity: str) -> bool:
     return severity in ["critical", "major"]
 
 
-def get_all_dependent_task_ids(state: Dict[str, Any], task_id: str) -> Set[str]:
+def get_all_dependent_task_ids(
+    state: Dict[str, Any],
+    task_id: str,
+    task_index: Optional[TaskIndex] = None
+) -> Set[str]:
     """
     Get all tasks that depend on the given task (transitive closure).
     
@@ -84,72 +90,43 @@ def get_all_dependent_task_ids(state: Dict[str, Any], task_id: str) -> Set[str]:
     - Transitive dependents (tasks depending on direct dependents)
     - Tasks depending on parent if task_id is a subtask
     
-    Uses BFS to find transitive closure of dependents.
+    Uses the TaskGraph dependent-closure cache. When a TaskIndex is passed,
+    its cached graph is reused, so repeated calls during one run only walk
+    each part of the reverse-dependency graph once.
     
     Requirements: 3.2
     
     Args:
         state: The AGENT_STATE dictionary
         task_id: The task ID to find dependents for
+        task_index: Optional TaskIndex whose cached graph is reused
         
     Returns:
         Set of task IDs that depend on the given task
     """
-    # Build task map for quick lookup
-    task_map = {}
-    for t in state.get("tasks", []):
-        tid = t.get("task_id")
-        if tid:
-            # Convert dict to Task-like object for expand_dependencies
-            task_map[tid] = type('Task', (), {
-                'task_id': tid,
-                'subtasks': t.get("subtasks", []),
-                'dependencies': t.get("dependencies", []),
-            })()
-    
-    # Build reverse dependency map (task -> tasks that depend on it)
-    reverse_deps: Dict[str, Set[str]] = {}
-    for t in state.get("tasks", []):
-        deps = t.get("dependencies", [])
-        # Expand dependencies to handle parent-subtask relationships
-        expanded_deps = expand_dependencies(deps, task_map)
-        for dep in expanded_deps:
-            if dep not in reverse_deps:
-                reverse_deps[dep] = set()
-            reverse_deps[dep].add(t["task_id"])
+    # Integer-indexed graph with parent dependencies expanded to leaves
+    graph = task_index.graph() if task_index is not None else TaskGraph(state.get("tasks", []))
     
     # Find the parent if this is a subtask
-    task = next((t for t in state.get("tasks", []) if t.get("task_id") == task_id), None)
+    task = find_task(state, task_id, task_index)
     parent_id = task.get("parent_id") if task else None
     
-    # BFS to find transitive closure
-    visited: Set[str] = set()
-    queue = [task_id]
-    
-    # Also start from parent if this is a subtask
-    if parent_id:
-        queue.append(parent_id)
-    
-    while queue:
-        current = queue.pop(0)
-        if current in visited:
-            continue
-        visited.add(current)
-        
-        # Add all tasks that depend on current
-        for dependent in reverse_deps.get(current, set()):
-            if dependent not in visited:
-                queue.append(dependent)
-    
-    # Remove the original task from results
-    visited.discard(task_id)
-    if parent_id:
-        visited.discard(parent_id)
+    # Union of cached transitive dependents of the task and its parent
+    mask = 0
+    for source in (task_id, parent_id):
+        if source in graph.position:
+            mask |= graph.dependents_mask(graph.position[source])
     
-    return visited
+    # Remove the original task (and its parent) from results
+    return set(graph.ids_from_mask(mask)) - {task_id, parent_id}
 
 
-def block_dependent_tasks(state: Dict[str, Any], task_id: str, reason: str) -> None:
+def block_dependent_tasks(
+    state: Dict[str, Any],
+    task_id: str,
+    reason: str,
+    task_index: Optional[TaskIndex] = None
+) -> None:
     """
     Block all tasks that depend on the failed task.
     
@@ -161,15 +138,19 @@ def block_dependent_tasks(state: Dict[str, Any], task_id: str, reason: str) -> N
         state: The AGENT_STATE dictionary
         task_id: The task ID that failed
         reason: Reason for blocking
+        task_index: Optional TaskIndex for cached lookups (built if omitted)
     """
-    dependent_ids = get_all_dependent_task_ids(state, task_id)
+    if task_index is None:
+        task_index = TaskIndex(state)
+    
+    dependent_ids = get_all_dependent_task_ids(state, task_id, task_index)
     
-    for t in state.get("tasks", []):
-        if t.get("task_id") in dependent_ids:
-            if t.get("status") not in ["completed", "blocked"]:
-                t["status"] = "blocked"
-                t["blocked_reason"] = reason
-                t["blocked_by"] = task_id
+    for dependent_id in dependent_ids:
+        t = task_index.get(dependent_id)
+        if t is not None and t.get("status") not in ["completed", "blocked"]:
+            t["status"] = "blocked"
+            t["blocked_reason"] = reason
+            t["blocked_by"] = task_id
     
     # Add to blocked_items
     if "blocked_items" not in state:
@@ -183,7 +164,13 @@ def block_dependent_tasks(state: Dict[str, Any], task_id: str, reason: str) -> N
     })
 
 
-def enter_fix_loop(state: Dict[str, Any], task_id: str, review_findings: List[Dict]) -> None:
+@traced("fix_loop.enter")
+def enter_fix_loop(
+    state: Dict[str, Any],
+    task_id: str,
+    review_findings: List[Dict],
+    task_index: Optional[TaskIndex] = None
+) -> None:
     """
     Enter fix loop for a task after review finds critical/major issues.
     
@@ -200,8 +187,9 @@ def enter_fix_loop(state: Dict[str, Any], task_id: str, review_findings: List[Di
         state: The AGENT_STATE dictionary
         task_id: The task ID that needs fixes
         review_findings: List of review findings (each with severity, summary, details)
+        task_index: Optional TaskIndex for O(1) task lookup
     """
-    task = next((t for t in state.get("tasks", []) if t.get("task_id") == task_id), None)
+    task = find_task(state, task_id, task_index)
     if not task:
         return
     
@@ -236,7 +224,11 @@ def enter_fix_loop(state: Dict[str, Any], task_id: str, review_findings: List[Di
     })
     
     # Block dependent tasks (Req 3.2)
-    block_dependent_tasks(state, task_id, f"Upstream task {task_id} requires fixes ({overall_severity})")
+    block_dependent_tasks(
+        state, task_id,
+        f"Upstream task {task_id} requires fixes ({overall_severity})",
+        task_index
+    )
 
 
 
@@ -275,7 +267,7 @@ def evaluate_fix_loop_action(task: Dict[str, Any], severity: str) -> FixLoopActi
 
 
 
-def format_review_history(history: List[Dict]) -> str:
+def format_review_history(history: List[Dict], rollup: Optional[Dict[str, Any]] = None) -> str:
     """
     Format review history for inclusion in escalation prompt.
     
@@ -283,14 +275,16 @@ def format_review_history(history: List[Dict]) -> str:
     
     Args:
         history: List of review history entries
+        rollup: The task's review_rollup (rounds archived by retention)
         
     Returns:
         Formatted string representation of review history
     """
+    archived = format_review_rollup(rollup)
     if not history:
-        return "No previous attempts."
+        return archived or "No previous attempts."
     
-    lines = []
+    lines = [archived, ""] if archived else []
     for entry in history:
         attempt = entry.get("attempt", 0)
         if attempt == 0:
@@ -322,7 +316,8 @@ def format_review_history(history: List[Dict]) -> str:
 def create_fix_request(
     state: Dict[str, Any],
     task_id: str,
-    findings: List[Dict]
+    findings: List[Dict],
+    task_index: Optional[TaskIndex] = None
 ) -> FixRequest:
     """
     Create fix request with review feedback.
@@ -333,11 +328,12 @@ def create_fix_request(
         state: The AGENT_STATE dictionary
         task_id: The task ID that needs fixes
         findings: List of review findings
+        task_index: Optional TaskIndex for O(1) task lookup
         
     Returns:
         FixRequest with all necessary information for fix prompt
     """
-    task = next((t for t in state.get("tasks", []) if t.get("task_id") == task_id), None)
+    task = find_task(state, task_id, task_index)
     if not task:
         raise ValueError(f"Task {task_id} not found in state")
     
@@ -408,7 +404,7 @@ def build_fix_prompt(fix_request: FixRequest, task: Dict[str, Any]) -> str:
     if fix_request.use_escalation_agent and fix_request.review_history:
         history_section = f"""
 ### Previous Fix Attempts History
-{format_review_history(fix_request.review_history)}
+{format_review_history(fix_request.review_history, task.get("review_rollup"))}
 """
         base_prompt += history_section
     
@@ -431,7 +427,11 @@ def get_fix_required_tasks(state: Dict[str, Any]) -> List[Dict[str, Any]]:
     return [t for t in state.get("tasks", []) if t.get("status") == "fix_required"]
 
 
-def on_fix_task_complete(state: Dict[str, Any], task_id: str) -> None:
+def on_fix_task_complete(
+    state: Dict[str, Any],
+    task_id: str,
+    task_index: Optional[TaskIndex] = None
+) -> None:
     """
     Called when a fix task completes.
     
@@ -444,8 +444,9 @@ def on_fix_task_complete(state: Dict[str, Any], task_id: str) -> None:
     Args:
         state: The AGENT_STATE dictionary
         task_id: The task ID that completed the fix
+        task_index: Optional TaskIndex for O(1) task lookup
     """
-    task = next((t for t in state.get("tasks", []) if t.get("task_id") == task_id), None)
+    task = find_task(state, task_id, task_index)
     if not task:
         return
     
@@ -459,7 +460,11 @@ def on_fix_task_complete(state: Dict[str, Any], task_id: str) -> None:
     # Review dispatch logic will pick this up
 
 
-def rollback_fix_dispatch(state: Dict[str, Any], task_id: str) -> None:
+def rollback_fix_dispatch(
+    state: Dict[str, Any],
+    task_id: str,
+    task_index: Optional[TaskIndex] = None
+) -> None:
     """
     Rollback task status after fix dispatch failure.
     
@@ -471,8 +476,9 @@ def rollback_fix_dispatch(state: Dict[str, Any], task_id: str) -> None:
     Args:
         state: The AGENT_STATE dictionary
         task_id: The task ID that failed to dispatch
+        task_index: Optional TaskIndex for O(1) task lookup
     """
-    task = next((t for t in state.get("tasks", []) if t.get("task_id") == task_id), None)
+    task = find_task(state, task_id, task_index)
     if not task:
         return
     
@@ -481,7 +487,12 @@ def rollback_fix_dispatch(state: Dict[str, Any], task_id: str) -> None:
         task["status"] = "fix_required"
 
 
-def on_review_complete(state: Dict[str, Any], task_id: str, review_findings: List[Dict]) -> None:
+def on_review_complete(
+    state: Dict[str, Any],
+    task_id: str,
+    review_findings: List[Dict],
+    task_index: Optional[TaskIndex] = None
+) -> None:
     """
     Called when a review completes.
     
@@ -498,8 +509,9 @@ def on_review_complete(state: Dict[str, Any], task_id: str, review_findings: Lis
         state: The AGENT_STATE dictionary
         task_id: The task ID that was reviewed
         review_findings: List of review findings
+        task_index: Optional TaskIndex for O(1) task lookup
     """
-    task = next((t for t in state.get("tasks", []) if t.get("task_id") == task_id), None)
+    task = find_task(state, task_id, task_index)
     if not task:
         return
     
@@ -514,13 +526,17 @@ def on_review_complete(state: Dict[str, Any], task_id: str, review_findings: Lis
     
     if should_enter_fix_loop(overall_severity):
         # Review failed - enter/continue fix loop
-        enter_fix_loop(state, task_id, review_findings)
+        enter_fix_loop(state, task_id, review_findings, task_index)
     else:
         # Review passed - exit fix loop
-        handle_fix_loop_success(state, task_id)
+        handle_fix_loop_success(state, task_id, task_index)
 
 
-def handle_fix_loop_success(state: Dict[str, Any], task_id: str) -> None:
+def handle_fix_loop_success(
+    state: Dict[str, Any],
+    task_id: str,
+    task_index: Optional[TaskIndex] = None
+) -> None:
     """
     Handle successful fix loop completion.
     
@@ -532,8 +548,9 @@ def handle_fix_loop_success(state: Dict[str, Any], task_id: str) -> None:
     Args:
         state: The AGENT_STATE dictionary
         task_id: The task ID that passed review
+        task_index: Optional TaskIndex for O(1) task lookup
     """
-    task = next((t for t in state.get("tasks", []) if t.get("task_id") == task_id), None)
+    task = find_task(state, task_id, task_index)
     if not task:
         return
     
@@ -568,7 +585,11 @@ def unblock_dependent_tasks(state: Dict[str, Any], task_id: str) -> None:
     ]
 
 
-def process_fix_loop(state: Dict[str, Any]) -> List[Dict[str, Any]]:
+@traced("fix_loop.process")
+def process_fix_loop(
+    state: Dict[str, Any],
+    task_index: Optional[TaskIndex] = None
+) -> List[Dict[str, Any]]:
     """
     Process all tasks in fix_required status.
     
@@ -584,6 +605,7 @@ def process_fix_loop(state: Dict[str, Any]) -> List[Dict[str, Any]]:
     
     Args:
         state: The AGENT_STATE dictionary
+        task_index: Optional TaskIndex for O(1) task lookup (built if omitted)
         
     Returns:
         List of fix request dictionaries ready for dispatch
@@ -591,6 +613,9 @@ def process_fix_loop(state: Dict[str, Any]) -> List[Dict[str, Any]]:
     fix_tasks = get_fix_required_tasks(state)
     fix_requests = []
     
+    if fix_tasks and task_index is None:
+        task_index = TaskIndex(state)
+    
     for task in fix_tasks:
         task_id = task["task_id"]
         severity = task.get("last_review_severity", "major")
@@ -600,7 +625,7 @@ def process_fix_loop(state: Dict[str, Any]) -> List[Dict[str, Any]]:
         action = evaluate_fix_loop_action(task, severity)
         
         if action == FixLoopAction.HUMAN_FALLBACK:
-            trigger_human_fallback(state, task_id)
+            trigger_human_fallback(state, task_id, task_index)
             continue
         
         if action == FixLoopAction.PASS:
@@ -612,7 +637,7 @@ def process_fix_loop(state: Dict[str, Any]) -> List[Dict[str, Any]]:
         latest_findings = review_history[-1].get("findings", []) if review_history else []
         
         try:
-            fix_request = create_fix_request(state, task_id, latest_findings)
+            fix_request = create_fix_request(state, task_id, latest_findings, task_index)
         except ValueError:
             continue
         
@@ -644,7 +669,11 @@ def process_fix_loop(state: Dict[str, Any]) -> List[Dict[str, Any]]:
 
 
 
-def trigger_human_fallback(state: Dict[str, Any], task_id: str) -> None:
+def trigger_human_fallback(
+    state: Dict[str, Any],
+    task_id: str,
+    task_index: Optional[TaskIndex] = None
+) -> None:
     """
     Suspend task and request human intervention.
     
@@ -655,8 +684,9 @@ def trigger_human_fallback(state: Dict[str, Any], task_id: str) -> None:
     Args:
         state: The AGENT_STATE dictionary
         task_id: The task ID that needs human intervention
+        task_index: Optional TaskIndex for O(1) task lookup
     """
-    task = next((t for t in state.get("tasks", []) if t.get("task_id") == task_id), None)
+    task = find_task(state, task_id, task_index)
     if not task:
         return
     
@@ -664,7 +694,7 @@ def trigger_human_fallback(state: Dict[str, Any], task_id: str) -> None:
     task["blocked_reason"] = "human_intervention_required"
     
     # Include review history in context
-    history_text = format_review_history(task.get("review_history", []))
+    history_text = format_review_history(task.get("review_history", []), task.get("review_rollup"))
     
     # Create pending decision entry (Req 3.8)
     if "pending_decisions" not in state:
@@ -696,4 +726,4 @@ Action Required:
     })
     
     # Block dependent tasks
-    block_dependent_tasks(state, task_id, "Upstream task requires human intervention")
+    block_dependent_tasks(state, task_id, "Upstream task requires human intervention", task_index)
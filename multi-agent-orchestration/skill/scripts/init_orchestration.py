@@ -6,6 +6,8 @@ Initializes multi-agent orchestration from a Kiro spec directory.
 - Parses tasks.md and validates spec files
 - Creates AGENT_STATE.json with tasks from tasks.md
 - Creates PROJECT_PULSE.md with mental model from design.md
+- With --reconcile, merges spec edits into an existing AGENT_STATE.json
+  while preserving task progress
 
 Requirements: 11.2, 11.4, 11.5, 11.6, 11.8
 """
@@ -31,6 +33,10 @@ from spec_parser import (
     extract_dependencies,
     load_tasks_from_spec,
 )
+from task_index import TaskIndex
+from tracing import enable_tracing, traced, TRACE_ENV_VAR
+from profiling import add_profiling_arguments, profiling_from_args
+from state_store import load_state_file, write_state_file
 
 
 # Agent assignment by task type (Requirement 1.3, 11.5)
@@ -103,6 +109,20 @@ class AgentState:
         return asdict(self)
 
 
+@dataclass
+class ReconcileResult:
+    """Task IDs touched when merging a re-parsed spec into existing state"""
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    restored: List[str] = field(default_factory=list)
+    parents_updated: List[str] = field(default_factory=list)
+    
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.removed or self.restored or self.parents_updated)
+
+
 @dataclass
 class InitResult:
     """Result of initialization"""
@@ -111,6 +131,7 @@ class InitResult:
     state_file: Optional[str] = None
     pulse_file: Optional[str] = None
     errors: List[str] = field(default_factory=list)
+    reconcile: Optional[ReconcileResult] = None
 
 
 def determine_criticality(task: Task) -> str:
@@ -186,61 +207,236 @@ def convert_task_to_entry(task: Task) -> TaskEntry:
     )
 
 
-def update_parent_statuses(state: Dict[str, Any]) -> None:
+# Subtask statuses that make a parent count as in progress (Req 1.4)
+PARENT_IN_PROGRESS_STATUSES = {"in_progress", "pending_review", "under_review", "final_review"}
+
+
+def derive_parent_status(subtask_statuses: List[str]) -> Optional[str]:
+    """
+    Derive a parent task status from its subtask statuses.
+    
+    Rules (in priority order):
+    - All subtasks completed → completed
+    - Any subtask blocked → blocked
+    - Any subtask fix_required → fix_required
+    - Any subtask in_progress/pending_review/under_review/final_review → in_progress
+    - Otherwise → not_started
+    
+    Requirements: 1.3, 1.4, 1.5
+    
+    Returns:
+        Derived status, or None if there are no subtask statuses
+    """
+    if not subtask_statuses:
+        return None
+    
+    if all(s == "completed" for s in subtask_statuses):
+        # All subtasks completed → parent completed (Req 1.3)
+        return "completed"
+    if "blocked" in subtask_statuses:
+        # Any subtask blocked → parent blocked (Req 1.5)
+        return "blocked"
+    if "fix_required" in subtask_statuses:
+        # Any subtask fix_required → parent fix_required
+        return "fix_required"
+    if any(s in PARENT_IN_PROGRESS_STATUSES for s in subtask_statuses):
+        # Any subtask in progress → parent in_progress (Req 1.4)
+        return "in_progress"
+    return "not_started"
+
+
+def _recompute_parent_status(task: Dict[str, Any], task_index: TaskIndex) -> bool:
+    """Recompute one parent's status from its subtasks. Returns True if it changed."""
+    subtask_statuses = []
+    for sid in task.get("subtasks", []):
+        subtask = task_index.get(sid)
+        if subtask is not None:
+            subtask_statuses.append(subtask.get("status", "not_started"))
+    
+    new_status = derive_parent_status(subtask_statuses)
+    if new_status is None or task.get("status") == new_status:
+        return False
+    task["status"] = new_status
+    return True
+
+
+def update_parent_statuses(
+    state: Dict[str, Any],
+    task_index: Optional[TaskIndex] = None
+) -> None:
     """
     Update parent task statuses based on subtask completion.
     
-    This function derives parent task status from the statuses of its subtasks.
-    It should be called after each batch completion to keep parent statuses in sync.
+    This function derives parent task status from the statuses of its subtasks
+    (see derive_parent_status). It recomputes every parent, deepest first, so
+    nested hierarchies resolve correctly regardless of task order in the file.
+    Use propagate_parent_statuses when only a few tasks changed.
     
-    Rules (in priority order):
-    - All subtasks completed → parent completed
-    - Any subtask blocked → parent blocked
-    - Any subtask fix_required → parent fix_required
-    - Any subtask in_progress/pending_review/under_review/final_review → parent in_progress
-    - Otherwise → parent not_started
+    Requirements: 1.3, 1.4, 1.5
+    
+    Args:
+        state: The AGENT_STATE dictionary containing tasks
+        task_index: Optional TaskIndex to reuse (built if omitted)
+    """
+    if task_index is None:
+        task_index = TaskIndex(state)
+    
+    parents = [t for t in state.get("tasks", []) if t.get("subtasks")]
+    # Children before parents: deepest parents first
+    parents.sort(key=lambda t: len(task_index.ancestors(t["task_id"])), reverse=True)
+    
+    for task in parents:
+        _recompute_parent_status(task, task_index)
+
+
+def propagate_parent_statuses(
+    state: Dict[str, Any],
+    changed_task_ids: List[str],
+    task_index: Optional[TaskIndex] = None
+) -> List[str]:
+    """
+    Recompute only the ancestors of tasks whose status changed.
+    
+    Walks each changed task's parent chain through the TaskIndex parent map
+    and recomputes the affected parents deepest first, so cost is
+    O(changed x depth) instead of a full sweep over all tasks.
     
     Requirements: 1.3, 1.4, 1.5
     
     Args:
         state: The AGENT_STATE dictionary containing tasks
+        changed_task_ids: Task IDs whose status may have changed
+        task_index: Optional TaskIndex to reuse (built if omitted)
+    
+    Returns:
+        List of parent task IDs whose status changed
+    """
+    if task_index is None:
+        task_index = TaskIndex(state)
+    
+    # Collect affected ancestors with their depth (distance from the root)
+    depth_by_parent: Dict[str, int] = {}
+    for task_id in dict.fromkeys(changed_task_ids):
+        chain = task_index.ancestors(task_id)
+        for distance, parent_id in enumerate(chain):
+            depth_by_parent[parent_id] = len(chain) - distance - 1
+    
+    updated = []
+    for parent_id in sorted(depth_by_parent, key=depth_by_parent.get, reverse=True):
+        parent = task_index.get(parent_id)
+        if parent is not None and _recompute_parent_status(parent, task_index):
+            updated.append(parent_id)
+    
+    return updated
+
+
+# Task fields derived from tasks.md; everything else (status, review
+# history, fix loop counters, timestamps, outputs) is runtime progress
+SPEC_DERIVED_FIELDS = (
+    "description",
+    "type",
+    "dependencies",
+    "criticality",
+    "is_optional",
+    "subtasks",
+    "parent_id",
+    "writes",
+    "reads",
+    "details",
+)
+
+# blocked_reason recorded on tasks that disappear from tasks.md
+REMOVED_FROM_SPEC_REASON = "Removed from tasks.md"
+
+
+def reconcile_state(
+    state: Dict[str, Any],
+    task_entries: List[TaskEntry]
+) -> ReconcileResult:
+    """
+    Merge re-parsed spec tasks into an existing AGENT_STATE by task_id.
+    
+    - New tasks are added with their initial spec status
+    - Existing tasks get SPEC_DERIVED_FIELDS refreshed; status, review
+      history and fix loop fields are preserved. owner_agent is only
+      re-assigned while the task has not started.
+    - Tasks missing from the spec are kept with removed_at set; unfinished
+      ones are blocked (REMOVED_FROM_SPEC_REASON) so they are not dispatched
+    - Removed tasks that reappear are restored to not_started
+    
+    Tasks are reordered to follow tasks.md, with removed tasks last. Only
+    ancestors of added, updated, removed or restored tasks get their
+    derived status recomputed.
+    
+    Requirements: 1.3, 1.4, 1.5, 11.4
+    
+    Args:
+        state: Existing AGENT_STATE dictionary (modified in place)
+        task_entries: Task entries converted from the re-parsed tasks.md
+    
+    Returns:
+        ReconcileResult listing affected task IDs
     """
-    # Build task map for quick lookup
-    task_map = {t["task_id"]: t for t in state.get("tasks", [])}
-    
-    # Process tasks in reverse order to handle nested hierarchies
-    # (children before parents)
-    for task in reversed(state.get("tasks", [])):
-        subtask_ids = task.get("subtasks", [])
-        if not subtask_ids:
-            continue  # Leaf task, skip
+    result = ReconcileResult()
+    existing = TaskIndex(state)
+    merged: List[Dict[str, Any]] = []
+    seen = set()
+    
+    for entry in task_entries:
+        new_task = entry.to_dict()
+        task_id = new_task["task_id"]
+        seen.add(task_id)
+        task = existing.get(task_id)
         
-        # Get subtask statuses
-        subtask_statuses = []
-        for sid in subtask_ids:
-            if sid in task_map:
-                subtask_statuses.append(task_map[sid].get("status", "not_started"))
+        if task is None:
+            merged.append(new_task)
+            result.added.append(task_id)
+            continue
         
-        if not subtask_statuses:
-            continue  # No valid subtasks found
+        if task.get("removed_at"):
+            task.pop("removed_at")
+            if task.get("blocked_reason") == REMOVED_FROM_SPEC_REASON:
+                task["status"] = "not_started"
+                task["blocked_reason"] = None
+            result.restored.append(task_id)
         
-        # Determine parent status from subtask statuses (Req 1.3, 1.4, 1.5)
-        if all(s == "completed" for s in subtask_statuses):
-            # All subtasks completed → parent completed (Req 1.3)
-            task["status"] = "completed"
-        elif any(s == "blocked" for s in subtask_statuses):
-            # Any subtask blocked → parent blocked (Req 1.5)
-            task["status"] = "blocked"
-        elif any(s == "fix_required" for s in subtask_statuses):
-            # Any subtask fix_required → parent fix_required
-            task["status"] = "fix_required"
-        elif any(s in ["in_progress", "pending_review", "under_review", "final_review"] 
-                 for s in subtask_statuses):
-            # Any subtask in progress → parent in_progress (Req 1.4)
-            task["status"] = "in_progress"
-        else:
-            # Otherwise → parent not_started
-            task["status"] = "not_started"
+        changed = False
+        for key in SPEC_DERIVED_FIELDS:
+            if task.get(key) != new_task[key]:
+                task[key] = new_task[key]
+                changed = True
+        if task.get("status") == "not_started" and task.get("owner_agent") != new_task["owner_agent"]:
+            task["owner_agent"] = new_task["owner_agent"]
+            changed = True
+        if changed:
+            result.updated.append(task_id)
+        merged.append(task)
+    
+    removed_at = datetime.utcnow().isoformat() + "Z"
+    for task in state.get("tasks", []):
+        task_id = task.get("task_id")
+        if task_id in seen:
+            continue
+        if not task.get("removed_at"):
+            task["removed_at"] = removed_at
+            if task.get("status") != "completed":
+                task["status"] = "blocked"
+                task["blocked_reason"] = REMOVED_FROM_SPEC_REASON
+            result.removed.append(task_id)
+        merged.append(task)
+    
+    state["tasks"] = merged
+    
+    # Only parents above touched tasks can change their derived status
+    touched = result.added + result.updated + result.removed + result.restored
+    if touched:
+        task_index = TaskIndex(state)
+        affected = list(touched)
+        for task_id in result.updated:
+            affected.extend(task_index.get(task_id).get("subtasks") or [])
+        result.parents_updated = propagate_parent_statuses(state, affected, task_index)
+    
+    return result
 
 
 def extract_mental_model_from_design(design_path: str) -> Dict[str, str]:
@@ -337,10 +533,13 @@ def generate_pulse_document(
     return pulse_content
 
 
+@traced("init_orchestration")
 def initialize_orchestration(
     spec_path: str,
     session_name: Optional[str] = None,
-    output_dir: Optional[str] = None
+    output_dir: Optional[str] = None,
+    use_cache: bool = True,
+    reconcile: bool = False
 ) -> InitResult:
     """
     Initialize orchestration from spec directory.
@@ -349,6 +548,10 @@ def initialize_orchestration(
         spec_path: Path to spec directory containing requirements.md, design.md, tasks.md
         session_name: Tmux session name (default: derived from spec path)
         output_dir: Output directory for state files (default: spec_path parent)
+        use_cache: Reuse the spec parse cache when tasks.md is unchanged
+        reconcile: Merge into an existing AGENT_STATE.json (see
+            reconcile_state) instead of replacing it; PROJECT_PULSE.md is
+            kept if present
     
     Returns:
         InitResult with success status and file paths
@@ -367,7 +570,7 @@ def initialize_orchestration(
         )
     
     # Parse tasks.md (Requirement 11.3, 11.4)
-    tasks_result, _ = load_tasks_from_spec(spec_path)
+    tasks_result, _ = load_tasks_from_spec(spec_path, use_cache=use_cache)
     if not tasks_result.success:
         return InitResult(
             success=False,
@@ -378,6 +581,19 @@ def initialize_orchestration(
     # Convert tasks to entries (Requirement 11.4, 11.5, 11.6)
     task_entries = [convert_task_to_entry(t) for t in tasks_result.tasks]
     
+    # Determine output directory
+    if output_dir:
+        out_path = Path(output_dir)
+    else:
+        out_path = Path(spec_path).parent
+    
+    out_path.mkdir(parents=True, exist_ok=True)
+    state_file = out_path / "AGENT_STATE.json"
+    pulse_file = out_path / "PROJECT_PULSE.md"
+    
+    if reconcile and state_file.exists():
+        return _reconcile_orchestration(state_file, pulse_file, spec_path, session_name, task_entries)
+    
     # Determine session name
     if not session_name:
         spec_name = Path(spec_path).name
@@ -390,19 +606,9 @@ def initialize_orchestration(
         tasks=[t.to_dict() for t in task_entries],
     )
     
-    # Determine output directory
-    if output_dir:
-        out_path = Path(output_dir)
-    else:
-        out_path = Path(spec_path).parent
-    
-    out_path.mkdir(parents=True, exist_ok=True)
-    
     # Write AGENT_STATE.json
-    state_file = out_path / "AGENT_STATE.json"
     try:
-        with open(state_file, 'w', encoding='utf-8') as f:
-            json.dump(agent_state.to_dict(), f, indent=2)
+        write_state_file(str(state_file), agent_state.to_dict())
     except Exception as e:
         errors.append(f"Failed to write AGENT_STATE.json: {e}")
     
@@ -412,7 +618,6 @@ def initialize_orchestration(
     
     # Generate and write PROJECT_PULSE.md
     pulse_content = generate_pulse_document(spec_path, mental_model, task_entries)
-    pulse_file = out_path / "PROJECT_PULSE.md"
     try:
         with open(pulse_file, 'w', encoding='utf-8') as f:
             f.write(pulse_content)
@@ -436,6 +641,68 @@ def initialize_orchestration(
     )
 
 
+def _reconcile_orchestration(
+    state_file: Path,
+    pulse_file: Path,
+    spec_path: str,
+    session_name: Optional[str],
+    task_entries: List[TaskEntry]
+) -> InitResult:
+    """Merge re-parsed tasks into an existing AGENT_STATE.json"""
+    try:
+        state = load_state_file(str(state_file))
+    except (OSError, ValueError, RuntimeError) as e:
+        return InitResult(
+            success=False,
+            message="Failed to read existing AGENT_STATE.json",
+            state_file=str(state_file),
+            errors=[str(e)]
+        )
+    
+    state["spec_path"] = os.path.abspath(spec_path)
+    if session_name:
+        state["session_name"] = session_name
+    
+    reconcile_result = reconcile_state(state, task_entries)
+    
+    errors = []
+    try:
+        write_state_file(str(state_file), state)
+    except Exception as e:
+        errors.append(f"Failed to write AGENT_STATE.json: {e}")
+    
+    # Keep the accumulated PULSE narrative; only create it if missing
+    if not pulse_file.exists():
+        mental_model = extract_mental_model_from_design(os.path.join(spec_path, "design.md"))
+        try:
+            with open(pulse_file, 'w', encoding='utf-8') as f:
+                f.write(generate_pulse_document(spec_path, mental_model, task_entries))
+        except Exception as e:
+            errors.append(f"Failed to write PROJECT_PULSE.md: {e}")
+    
+    if errors:
+        return InitResult(
+            success=False,
+            message="Reconciliation completed with errors",
+            state_file=str(state_file),
+            pulse_file=str(pulse_file),
+            errors=errors,
+            reconcile=reconcile_result
+        )
+    
+    return InitResult(
+        success=True,
+        message=(
+            f"Orchestration reconciled: {len(reconcile_result.added)} added, "
+            f"{len(reconcile_result.updated)} updated, {len(reconcile_result.removed)} removed, "
+            f"{len(reconcile_result.restored)} restored"
+        ),
+        state_file=str(state_file),
+        pulse_file=str(pulse_file),
+        reconcile=reconcile_result
+    )
+
+
 def main():
     """Command line entry point"""
     import argparse
@@ -460,34 +727,57 @@ def main():
         action="store_true",
         help="Output result as JSON"
     )
-    
-    args = parser.parse_args()
-    
-    result = initialize_orchestration(
-        args.spec_path,
-        session_name=args.session,
-        output_dir=args.output
+    parser.add_argument(
+        "--reconcile",
+        action="store_true",
+        help="Merge spec edits into an existing AGENT_STATE.json, preserving task progress"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse tasks.md instead of using the spec parse cache"
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help=f"Append timing spans to FILE as JSON lines (or set {TRACE_ENV_VAR})"
+    )
+    add_profiling_arguments(parser)
     
-    if args.json:
-        output = {
-            "success": result.success,
-            "message": result.message,
-            "state_file": result.state_file,
-            "pulse_file": result.pulse_file,
-            "errors": result.errors
-        }
-        print(json.dumps(output, indent=2))
-    else:
-        if result.success:
-            print(f"✅ {result.message}")
-            print(f"   State file: {result.state_file}")
-            print(f"   PULSE file: {result.pulse_file}")
+    args = parser.parse_args()
+    if args.trace:
+        enable_tracing(args.trace)
+    
+    with profiling_from_args("init_orchestration", args):
+        result = initialize_orchestration(
+            args.spec_path,
+            session_name=args.session,
+            output_dir=args.output,
+            use_cache=not args.no_cache,
+            reconcile=args.reconcile
+        )
+        
+        if args.json:
+            output = {
+                "success": result.success,
+                "message": result.message,
+                "state_file": result.state_file,
+                "pulse_file": result.pulse_file,
+                "errors": result.errors
+            }
+            if result.reconcile is not None:
+                output["reconcile"] = asdict(result.reconcile)
+            print(json.dumps(output, indent=2))
         else:
-            print(f"❌ {result.message}")
-            for error in result.errors:
-                print(f"   - {error}")
-            sys.exit(1)
+            if result.success:
+                print(f"✅ {result.message}")
+                print(f"   State file: {result.state_file}")
+                print(f"   PULSE file: {result.pulse_file}")
+            else:
+                print(f"❌ {result.message}")
+                for error in result.errors:
+                    print(f"   - {error}")
+                sys.exit(1)
 
 
 if __name__ == "__main__":
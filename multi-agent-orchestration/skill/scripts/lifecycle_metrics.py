@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Per-Task Lifecycle Metrics for Multi-Agent Orchestration
+
+Records lifecycle timings on AGENT_STATE.json tasks while dispatching and
+exports them, with status and fix loop counts, as an OpenMetrics text file
+that node_exporter's textfile collector can scrape.
+- dispatched_at: first dispatch of the task (queue wait ends here)
+- execution_seconds: worker time summed over all executions (fix rounds included)
+- review_seconds: review time summed over all review rounds
+- Queue wait runs from the later of created_at and the dependencies'
+  completed_at to dispatched_at (parent dependencies expanded to their
+  leaf tasks, since parents never get completed_at)
+- Only leaf tasks are measured; parent statuses are derived
+
+Usage:
+    lifecycle_metrics.py AGENT_STATE.json [more states...] -o /var/lib/node_exporter/orchestration.prom
+"""
+
+import math
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from task_index import TaskIndex
+from state_store import load_state_file
+
+
+METRICS_ENV_VAR = "ORCHESTRATION_METRICS_FILE"
+
+METRIC_PREFIX = "orchestration"
+
+# Histogram upper bounds
+DURATION_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0, 7200.0)
+FIX_ATTEMPT_BUCKETS = (0.0, 1.0, 2.0, 3.0, 5.0)
+
+# owner_agent -> backend label (mirrors dispatch_batch.AGENT_TO_BACKEND)
+AGENT_BACKENDS = {
+    "kiro-cli": "kiro-cli",
+    "gemini": "gemini",
+    "codex-review": "codex",
+}
+
+HUMAN_FALLBACK_REASON = "human_intervention_required"
+
+
+def utc_now() -> str:
+    """Timestamp in the format used throughout AGENT_STATE.json"""
+    return datetime.utcnow().isoformat() + "Z"
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an AGENT_STATE timestamp ('...Z' or with offset); naive means UTC"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+def record_execution_timings(
+    state: Dict[str, Any],
+    task_results: List[Dict[str, Any]],
+    dispatched_at: str,
+    elapsed: float,
+    task_index: Optional[TaskIndex] = None
+) -> None:
+    """
+    Record one wrapper execution for every task that reported a result.
+    
+    Uses the result's duration_ms when the wrapper reports it, otherwise
+    the wall time of the (synchronous) wrapper call.
+    
+    Args:
+        state: AGENT_STATE data (modified in place)
+        task_results: task_results from the execution report
+        dispatched_at: Timestamp taken just before the wrapper was invoked
+        elapsed: Wall time of the wrapper call in seconds
+        task_index: Optional TaskIndex for O(1) task lookup
+    """
+    if task_index is None:
+        task_index = TaskIndex(state)
+    for result in task_results:
+        task = task_index.get(result.get("task_id"))
+        if task is None:
+            continue
+        task.setdefault("dispatched_at", dispatched_at)
+        duration_ms = result.get("duration_ms")
+        seconds = duration_ms / 1000.0 if isinstance(duration_ms, (int, float)) else elapsed
+        task["execution_seconds"] = round(task.get("execution_seconds", 0.0) + seconds, 3)
+
+
+def record_review_timings(
+    state: Dict[str, Any],
+    task_ids: Iterable[str],
+    elapsed: float,
+    task_index: Optional[TaskIndex] = None
+) -> None:
+    """
+    Add one review round's wall time to each reviewed task.
+    
+    Args:
+        state: AGENT_STATE data (modified in place)
+        task_ids: Tasks that received review results
+        elapsed: Wall time of the review wrapper call in seconds
+        task_index: Optional TaskIndex for O(1) task lookup
+    """
+    if task_index is None:
+        task_index = TaskIndex(state)
+    for task_id in dict.fromkeys(task_ids):
+        task = task_index.get(task_id)
+        if task is not None:
+            task["review_seconds"] = round(task.get("review_seconds", 0.0) + elapsed, 3)
+
+
+# =============================================================================
+# Collection
+# =============================================================================
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket histogram"""
+    buckets: Tuple[float, ...]
+    counts: List[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+    
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * len(self.buckets)
+    
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.total += value
+        self.count += 1
+
+
+@dataclass
+class LifecycleMetrics:
+    """Metric values keyed by label tuples"""
+    tasks: Dict[Tuple[str, str, str], int] = field(default_factory=dict)                 # (session, backend, status)
+    queue_wait: Dict[Tuple[str, str], Histogram] = field(default_factory=dict)           # (session, backend)
+    execution: Dict[Tuple[str, str], Histogram] = field(default_factory=dict)
+    review: Dict[Tuple[str, str], Histogram] = field(default_factory=dict)
+    fix_attempts: Dict[Tuple[str, str], Histogram] = field(default_factory=dict)
+    escalations: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    human_fallbacks: Dict[Tuple[str, str], int] = field(default_factory=dict)
+
+
+def task_backend(task: Dict[str, Any]) -> str:
+    """Backend label for a task (its original agent if it was escalated)"""
+    agent = task.get("original_agent") or task.get("owner_agent") or "unknown"
+    return AGENT_BACKENDS.get(agent, agent)
+
+
+def _observe(series: Dict[Tuple[str, str], Histogram], key: Tuple[str, str], buckets, value: float) -> None:
+    histogram = series.get(key)
+    if histogram is None:
+        histogram = series[key] = Histogram(buckets)
+    histogram.observe(value)
+
+
+def _queue_wait_seconds(task: Dict[str, Any], task_index: TaskIndex) -> Optional[float]:
+    dispatched = parse_timestamp(task.get("dispatched_at"))
+    ready = parse_timestamp(task.get("created_at"))
+    if dispatched is None or ready is None:
+        return None
+    graph = task_index.graph()
+    index = graph.position.get(task.get("task_id"))
+    dependencies = graph.expanded_dependencies(index) if index is not None and graph.is_task(index) else ()
+    for dep in dependencies:
+        if not graph.is_task(dep):
+            continue
+        completed = parse_timestamp(graph.records[dep].task.get("completed_at"))
+        if completed is not None and completed > ready:
+            ready = completed
+    return max(0.0, (dispatched - ready).total_seconds())
+
+
+def collect_metrics(states: Iterable[Dict[str, Any]], metrics: Optional[LifecycleMetrics] = None) -> LifecycleMetrics:
+    """
+    Aggregate lifecycle metrics over one or more AGENT_STATE documents.
+    
+    States sharing a session_name are merged into the same series.
+    
+    Args:
+        states: AGENT_STATE dicts
+        metrics: Existing metrics to add to (default: new)
+    
+    Returns:
+        LifecycleMetrics
+    """
+    if metrics is None:
+        metrics = LifecycleMetrics()
+    
+    for state in states:
+        session = state.get("session_name", "orchestration")
+        task_index = TaskIndex(state)
+        fallback_ids = {
+            d.get("task_id") for d in state.get("pending_decisions", [])
+            if str(d.get("id", "")).startswith("human-fallback-")
+        }
+        
+        for task in task_index:
+            if task.get("subtasks"):
+                continue
+            backend = task_backend(task)
+            key = (session, backend)
+            status_key = (session, backend, task.get("status", "unknown"))
+            metrics.tasks[status_key] = metrics.tasks.get(status_key, 0) + 1
+            
+            wait = _queue_wait_seconds(task, task_index)
+            if wait is not None:
+                _observe(metrics.queue_wait, key, DURATION_BUCKETS, wait)
+            if "execution_seconds" in task:
+                _observe(metrics.execution, key, DURATION_BUCKETS, task["execution_seconds"])
+            if "review_seconds" in task:
+                _observe(metrics.review, key, DURATION_BUCKETS, task["review_seconds"])
+            _observe(metrics.fix_attempts, key, FIX_ATTEMPT_BUCKETS, task.get("fix_attempts", 0))
+            
+            if task.get("escalated"):
+                metrics.escalations[key] = metrics.escalations.get(key, 0) + 1
+            if task.get("blocked_reason") == HUMAN_FALLBACK_REASON or task.get("task_id") in fallback_ids:
+                metrics.human_fallbacks[key] = metrics.human_fallbacks.get(key, 0) + 1
+    
+    return metrics
+
+
+# =============================================================================
+# OpenMetrics Rendering
+# =============================================================================
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_number(value: float) -> str:
+    if isinstance(value, int) or (isinstance(value, float) and value.is_integer() and not math.isinf(value)):
+        return str(int(value))
+    return repr(float(value))
+
+
+def _render_gauge(lines: List[str], name: str, help_text: str, label_names, series) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} gauge")
+    for labels in sorted(series):
+        lines.append(f"{name}{_labels(label_names, labels)} {_format_number(series[labels])}")
+
+
+def _render_histogram(lines: List[str], name: str, help_text: str, unit: str, series) -> None:
+    label_names = ("session", "backend")
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    if unit:
+        lines.append(f"# UNIT {name} {unit}")
+    for labels in sorted(series):
+        histogram = series[labels]
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            le = 'le="' + _format_number(bound) + '"'
+            lines.append(f"{name}_bucket{_labels(label_names, labels, le)} {count}")
+        inf = 'le="+Inf"'
+        lines.append(f"{name}_bucket{_labels(label_names, labels, inf)} {histogram.count}")
+        lines.append(f"{name}_sum{_labels(label_names, labels)} {_format_number(round(histogram.total, 6))}")
+        lines.append(f"{name}_count{_labels(label_names, labels)} {histogram.count}")
+
+
+def render_openmetrics(metrics: LifecycleMetrics) -> str:
+    """Render metrics in the OpenMetrics text format (ends with # EOF)"""
+    p = METRIC_PREFIX
+    lines: List[str] = []
+    _render_gauge(lines, f"{p}_tasks", "Leaf tasks by backend and status.",
+                  ("session", "backend", "status"), metrics.tasks)
+    _render_histogram(lines, f"{p}_task_queue_wait_seconds",
+                      "Time from a task becoming ready to its first dispatch.", "seconds", metrics.queue_wait)
+    _render_histogram(lines, f"{p}_task_execution_seconds",
+                      "Worker execution time per task, summed over fix rounds.", "seconds", metrics.execution)
+    _render_histogram(lines, f"{p}_task_review_seconds",
+                      "Review time per task, summed over review rounds.", "seconds", metrics.review)
+    _render_histogram(lines, f"{p}_task_fix_attempts",
+                      "Fix loop iterations per task.", "", metrics.fix_attempts)
+    _render_gauge(lines, f"{p}_task_escalations", "Tasks escalated to codex during the fix loop.",
+                  ("session", "backend"), metrics.escalations)
+    _render_gauge(lines, f"{p}_task_human_fallbacks", "Tasks suspended for human intervention.",
+                  ("session", "backend"), metrics.human_fallbacks)
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics_textfile(path: str, states: Iterable[Dict[str, Any]]) -> LifecycleMetrics:
+    """
+    Write lifecycle metrics for the given states to an OpenMetrics text file.
+    
+    The file is replaced atomically so the textfile collector never reads a
+    partial file.
+    
+    Returns:
+        The collected LifecycleMetrics
+    """
+    metrics = collect_metrics(states)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_file = path + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(render_openmetrics(metrics))
+    os.replace(tmp_file, path)
+    return metrics
+
+
+def export_metrics_for_state_file(state_file: str, metrics_file: Optional[str] = None) -> Optional[str]:
+    """
+    Export metrics for one state file if a metrics file is configured.
+    
+    Args:
+        state_file: Path to AGENT_STATE.json
+        metrics_file: Target path (default: $ORCHESTRATION_METRICS_FILE)
+    
+    Metrics are best effort: a state file that cannot be read or a metrics
+    file that cannot be written is reported on stderr, not raised.
+    
+    Returns:
+        Path written, or None if nothing was written
+    """
+    metrics_file = metrics_file or os.environ.get(METRICS_ENV_VAR)
+    if not metrics_file:
+        return None
+    try:
+        state = load_state_file(state_file, detached=False)
+        write_metrics_textfile(metrics_file, [state])
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Warning: failed to export metrics to {metrics_file}: {e}", file=sys.stderr)
+        return None
+    return metrics_file
+
+
+def main():
+    """Command line entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="Export per-task lifecycle metrics as an OpenMetrics text file"
+    )
+    parser.add_argument("state_files", nargs="+", help="AGENT_STATE.json file(s)")
+    parser.add_argument("-o", "--output", help="Output .prom file (default: stdout)")
+    
+    args = parser.parse_args()
+    
+    states = [load_state_file(state_file, detached=False) for state_file in args.state_files]
+    
+    if args.output:
+        write_metrics_textfile(args.output, states)
+        print(f"✅ Wrote metrics for {len(states)} state file(s) to {args.output}")
+    else:
+        sys.stdout.write(render_openmetrics(collect_metrics(states)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Profiling Mode for Orchestration CLI Entry Points
+
+Shared --profile / --profile-memory options for the orchestration scripts.
+- --profile runs the command under cProfile and saves the pstats file
+- --profile-memory traces allocations with tracemalloc and saves the top-N
+  allocation sites, plus current/peak traced memory
+- Every profiled run gets its own directory under --profile-dir
+  (default: $ORCHESTRATION_PROFILE_DIR or ./orchestration-profiles)
+  holding run.json, cprofile.pstats and memory.json / memory_top.txt
+- `profiling.py report DIR...` merges the profiles of many runs
+
+Usage:
+    dispatch_batch.py AGENT_STATE.json --profile --profile-memory
+    profiling.py report orchestration-profiles --command dispatch_batch
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+
+PROFILE_DIR_ENV_VAR = "ORCHESTRATION_PROFILE_DIR"
+DEFAULT_PROFILE_DIR = "orchestration-profiles"
+DEFAULT_TOP_N = 25
+
+RUN_FILE = "run.json"
+PSTATS_FILE = "cprofile.pstats"
+MEMORY_FILE = "memory.json"
+MEMORY_TEXT_FILE = "memory_top.txt"
+
+
+def add_profiling_arguments(parser) -> None:
+    """Add the shared profiling options to an argparse parser"""
+    group = parser.add_argument_group("profiling")
+    group.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the run with cProfile and save pstats to the profile directory"
+    )
+    group.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Trace allocations with tracemalloc and save the top allocation sites"
+    )
+    group.add_argument(
+        "--profile-dir",
+        metavar="DIR",
+        help=f"Directory for profile runs (default: ${PROFILE_DIR_ENV_VAR} or ./{DEFAULT_PROFILE_DIR})"
+    )
+    group.add_argument(
+        "--profile-top",
+        type=int,
+        default=DEFAULT_TOP_N,
+        metavar="N",
+        help=f"Number of allocation sites to keep with --profile-memory (default: {DEFAULT_TOP_N})"
+    )
+
+
+def _run_directory(base_dir: str, command: str) -> Path:
+    stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+    Path(base_dir).mkdir(parents=True, exist_ok=True)
+    name = f"{command}-{stamp}-{os.getpid()}"
+    for attempt in range(1, 1000):
+        run_dir = Path(base_dir) / (name if attempt == 1 else f"{name}-{attempt}")
+        try:
+            run_dir.mkdir()
+            return run_dir
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No free run directory for {name} in {base_dir}")
+
+
+def _memory_top(snapshot: "tracemalloc.Snapshot", top_n: int) -> List[Dict[str, Any]]:
+    top = []
+    for stat in snapshot.statistics("lineno")[:top_n]:
+        frame = stat.traceback[0]
+        top.append({
+            "location": f"{frame.filename}:{frame.lineno}",
+            "size": stat.size,
+            "count": stat.count,
+        })
+    return top
+
+
+@contextmanager
+def profile_run(
+    command: str,
+    profile: bool = False,
+    memory: bool = False,
+    profile_dir: Optional[str] = None,
+    top_n: int = DEFAULT_TOP_N
+) -> Iterator[Optional[Path]]:
+    """
+    Profile the enclosed block and write the results to a new run directory.
+    
+    Results are written even if the block exits via sys.exit or raises.
+    Does nothing (yields None) when neither profile nor memory is set.
+    
+    Args:
+        command: Command name used in the run directory name
+        profile: Collect cProfile stats
+        memory: Collect tracemalloc statistics
+        profile_dir: Base directory (default: $ORCHESTRATION_PROFILE_DIR or ./orchestration-profiles)
+        top_n: Number of allocation sites to keep
+    
+    Yields:
+        The run directory, or None when profiling is off
+    """
+    if not (profile or memory):
+        yield None
+        return
+    
+    base_dir = profile_dir or os.environ.get(PROFILE_DIR_ENV_VAR) or DEFAULT_PROFILE_DIR
+    run_dir = _run_directory(base_dir, command)
+    
+    profiler = cProfile.Profile() if profile else None
+    started_tracemalloc = memory and not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    
+    started = time.time()
+    wall_start = time.perf_counter()
+    exit_status: Any = 0
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield run_dir
+    except SystemExit as e:
+        exit_status = e.code if e.code is not None else 0
+        raise
+    except BaseException as e:
+        exit_status = type(e).__name__
+        raise
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        wall_seconds = time.perf_counter() - wall_start
+        
+        run_info: Dict[str, Any] = {
+            "command": command,
+            "argv": sys.argv[1:],
+            "started": started,
+            "wall_seconds": round(wall_seconds, 6),
+            "exit_status": exit_status,
+            "profile": bool(profile),
+            "profile_memory": bool(memory),
+        }
+        
+        if profiler is not None:
+            profiler.dump_stats(str(run_dir / PSTATS_FILE))
+        
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            if started_tracemalloc:
+                tracemalloc.stop()
+            top = _memory_top(snapshot, top_n)
+            run_info["memory_current"] = current
+            run_info["memory_peak"] = peak
+            with open(run_dir / MEMORY_FILE, 'w', encoding='utf-8') as f:
+                json.dump({"current": current, "peak": peak, "top": top}, f, indent=2)
+            with open(run_dir / MEMORY_TEXT_FILE, 'w', encoding='utf-8') as f:
+                f.write(f"current: {current / 1024:.1f} KiB  peak: {peak / 1024:.1f} KiB\n")
+                for entry in top:
+                    f.write(f"{entry['size'] / 1024:>10.1f} KiB {entry['count']:>8} blocks  {entry['location']}\n")
+        
+        with open(run_dir / RUN_FILE, 'w', encoding='utf-8') as f:
+            json.dump(run_info, f, indent=2)
+
+
+def profiling_from_args(command: str, args) -> ContextManager[Optional[Path]]:
+    """profile_run configured from add_profiling_arguments options"""
+    return profile_run(
+        command,
+        profile=getattr(args, "profile", False),
+        memory=getattr(args, "profile_memory", False),
+        profile_dir=getattr(args, "profile_dir", None),
+        top_n=getattr(args, "profile_top", DEFAULT_TOP_N),
+    )
+
+
+# =============================================================================
+# Reports Across Runs
+# =============================================================================
+
+@dataclass
+class ProfileReport:
+    """Merged profiles of several runs"""
+    runs: List[Dict[str, Any]] = field(default_factory=list)
+    stats: Optional[pstats.Stats] = None
+    memory_sites: List[Dict[str, Any]] = field(default_factory=list)
+    peak_memory: int = 0
+
+
+def find_runs(paths: List[str], command: Optional[str] = None) -> List[Path]:
+    """
+    Locate run directories: each path is a run directory or a directory
+    containing run directories.
+    """
+    runs = []
+    for path in paths:
+        base = Path(path)
+        if (base / RUN_FILE).is_file():
+            candidates = [base]
+        elif base.is_dir():
+            candidates = sorted(p for p in base.iterdir() if (p / RUN_FILE).is_file())
+        else:
+            candidates = []
+        for run_dir in candidates:
+            if command is not None:
+                with open(run_dir / RUN_FILE, 'r', encoding='utf-8') as f:
+                    if json.load(f).get("command") != command:
+                        continue
+            runs.append(run_dir)
+    return runs
+
+
+def merge_profiles(run_dirs: List[Path]) -> ProfileReport:
+    """
+    Merge cProfile stats and allocation sites of the given runs.
+    
+    Allocation sizes are averaged over the runs that traced memory; the
+    peak is the largest peak of any run.
+    """
+    report = ProfileReport()
+    sites: Dict[str, Dict[str, Any]] = {}
+    memory_runs = 0
+    
+    for run_dir in run_dirs:
+        with open(run_dir / RUN_FILE, 'r', encoding='utf-8') as f:
+            report.runs.append({"dir": str(run_dir), **json.load(f)})
+        
+        pstats_file = run_dir / PSTATS_FILE
+        if pstats_file.is_file():
+            if report.stats is None:
+                report.stats = pstats.Stats(str(pstats_file), stream=sys.stdout)
+            else:
+                report.stats.add(str(pstats_file))
+        
+        memory_file = run_dir / MEMORY_FILE
+        if memory_file.is_file():
+            with open(memory_file, 'r', encoding='utf-8') as f:
+                memory = json.load(f)
+            memory_runs += 1
+            report.peak_memory = max(report.peak_memory, memory.get("peak", 0))
+            for entry in memory.get("top", []):
+                site = sites.setdefault(entry["location"], {"location": entry["location"], "size": 0, "count": 0, "runs": 0})
+                site["size"] += entry["size"]
+                site["count"] += entry["count"]
+                site["runs"] += 1
+    
+    for site in sites.values():
+        site["size"] = site["size"] // max(1, memory_runs)
+        site["count"] = site["count"] // max(1, memory_runs)
+    report.memory_sites = sorted(sites.values(), key=lambda s: s["size"], reverse=True)
+    return report
+
+
+def main():
+    """Command line entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Merge orchestration profiles across runs")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    report_parser = subparsers.add_parser("report", help="Merge and print profiles")
+    report_parser.add_argument("paths", nargs="+", help="Run directories or directories containing runs")
+    report_parser.add_argument("--command", dest="only_command", help="Only runs of this command (e.g. dispatch_batch)")
+    report_parser.add_argument(
+        "--sort", default="cumulative", choices=["cumulative", "tottime", "ncalls"],
+        help="pstats sort key (default: cumulative)"
+    )
+    report_parser.add_argument("--limit", type=int, default=30, help="Rows to print (default: 30)")
+    
+    args = parser.parse_args()
+    
+    runs = find_runs(args.paths, args.only_command)
+    if not runs:
+        print("❌ No profile runs found")
+        sys.exit(1)
+    
+    report = merge_profiles(runs)
+    wall = [r.get("wall_seconds", 0.0) for r in report.runs]
+    print(f"Runs: {len(report.runs)}  wall time: total {sum(wall):.3f} s, max {max(wall):.3f} s")
+    
+    if report.stats is not None:
+        print()
+        report.stats.sort_stats(args.sort).print_stats(args.limit)
+    
+    if report.memory_sites:
+        print(f"Peak traced memory: {report.peak_memory / 1024:.1f} KiB")
+        print("Top allocation sites (mean per run):")
+        for site in report.memory_sites[:args.limit]:
+            print(f"{site['size'] / 1024:>10.1f} KiB {site['count']:>8} blocks  {site['runs']:>3} run(s)  {site['location']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+../../../skills/agent-pulse-coordination/scripts/pulse_engine.py
\ No newline at end of file
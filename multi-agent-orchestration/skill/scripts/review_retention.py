@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Review History and Findings Retention
+
+Bounds the review data that grows with every review round:
+- task["review_history"] keeps the last REVIEW_HISTORY_KEEP rounds in full;
+  older rounds are rolled up into severity counts in task["review_rollup"]
+- state["review_findings"] entries of completed tasks (already summarized
+  by their final report) are rolled up the same way and removed
+- Everything removed is first appended to <state>.archive.jsonl; records
+  already there (from a run whose state save failed) are not appended again
+- state["review_archive_offset"] is the archive size the saved state has
+  accounted for; only records past it are checked for duplicates, so a
+  pass never rereads the committed archive
+
+consolidate_reviews applies the policy before each save.
+
+Usage:
+    review_retention.py AGENT_STATE.json [--keep 3]
+"""
+
+import json
+import os
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from state_store import load_state_file, write_state_file
+
+
+REVIEW_HISTORY_KEEP_ENV_VAR = "ORCHESTRATION_REVIEW_HISTORY_KEEP"
+REVIEW_HISTORY_KEEP = 3
+ROLLUP_KEY = "review_rollup"
+ARCHIVE_OFFSET_KEY = "review_archive_offset"
+
+
+@dataclass
+class RetentionResult:
+    """Result of applying the retention policy"""
+    rounds_archived: int = 0
+    findings_archived: int = 0
+    archive_file: Optional[str] = None
+
+
+def archive_path_for(state_file: str) -> str:
+    """Archive of removed review data: AGENT_STATE.archive.jsonl"""
+    base, _ = os.path.splitext(state_file)
+    return base + ".archive.jsonl"
+
+
+def review_history_keep() -> int:
+    """Rounds kept in full ($ORCHESTRATION_REVIEW_HISTORY_KEEP, at least 1)"""
+    try:
+        keep = int(os.environ.get(REVIEW_HISTORY_KEEP_ENV_VAR, REVIEW_HISTORY_KEEP))
+    except ValueError:
+        keep = REVIEW_HISTORY_KEEP
+    return max(1, keep)
+
+
+def _task_rollup(task: Dict[str, Any]) -> Dict[str, Any]:
+    return task.setdefault(ROLLUP_KEY, {
+        "archived_rounds": 0,
+        "rounds_by_severity": {},
+        "archived_findings": 0,
+        "findings_by_severity": {},
+    })
+
+
+def _count(counts: Dict[str, int], severity: Any) -> None:
+    key = severity if isinstance(severity, str) else "unknown"
+    counts[key] = counts.get(key, 0) + 1
+
+
+def _record_key(record: Dict[str, Any]) -> str:
+    """Identity of an archived round or finding, independent of archived_at"""
+    if record.get("kind") == "review_history":
+        entry = record.get("entry")
+        ident = [entry.get("attempt"), entry.get("reviewed_at")] if isinstance(entry, dict) else [entry]
+    else:
+        finding = record.get("finding")
+        ident = ([finding.get("reviewer"), finding.get("created_at"), finding.get("summary")]
+                 if isinstance(finding, dict) else [finding])
+    return json.dumps([record.get("kind"), record.get("task_id"), *ident], sort_keys=True, default=str)
+
+
+def _keys_after(f, offset: int) -> Set[str]:
+    """Keys of the archive records past offset (written by uncommitted runs)"""
+    end = f.seek(0, os.SEEK_END)
+    if not isinstance(offset, int) or not 0 <= offset <= end:
+        # Missing, or the archive was replaced: check all of it once
+        offset = 0
+    f.seek(offset)
+    keys: Set[str] = set()
+    for line in f.read().splitlines():
+        try:
+            keys.add(_record_key(json.loads(line)))
+        except (ValueError, AttributeError):
+            continue
+    return keys
+
+
+def _drop_torn_tail(f) -> None:
+    """Truncate an archive opened for appending back to its last complete line"""
+    end = f.seek(0, os.SEEK_END)
+    position = end
+    while position > 0:
+        start = max(0, position - 65536)
+        f.seek(start)
+        chunk = f.read(position - start)
+        newline = chunk.rfind(b"\n")
+        if newline >= 0:
+            position = start + newline + 1
+            break
+        position = start
+    if position < end:
+        f.truncate(position)
+    f.seek(0, os.SEEK_END)
+
+
+def _append_archive(archive_file: str, records: List[Dict[str, Any]], offset: int) -> int:
+    """
+    Append the records not already past offset; return the new archive size.
+    
+    Records before offset are covered by the saved state, which no longer
+    holds them, so only the uncommitted tail needs checking.
+    """
+    with open(archive_file, 'a+b') as f:
+        # A line cut short by a crash would swallow the first new record;
+        # its record was never committed and is appended again
+        _drop_torn_tail(f)
+        archived = _keys_after(f, offset)
+        records = [record for record in records if _record_key(record) not in archived]
+        f.seek(0, os.SEEK_END)
+        if records:
+            f.write(b"".join(json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n" for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+        return f.tell()
+
+
+def apply_review_retention(
+    state: Dict[str, Any],
+    state_file: str,
+    keep: Optional[int] = None
+) -> RetentionResult:
+    """
+    Archive old review rounds and settled findings, keeping rollups.
+    
+    The archive is written before the state is changed, so a failed
+    archive write leaves the state untouched. If the caller's save then
+    fails, the next run finds the same rounds in the state again; records
+    already in the archive past state["review_archive_offset"] are skipped,
+    so it holds each round and finding once. The offset moves to the end
+    of the archive in the same save. Tasks whose review_history is not
+    loaded (detached and not attached) are skipped.
+    
+    Args:
+        state: AGENT_STATE dictionary (modified in place)
+        state_file: Path to AGENT_STATE.json (locates the archive)
+        keep: Rounds to keep per task (default: review_history_keep())
+    
+    Returns:
+        RetentionResult with counts of archived rounds and findings
+    """
+    keep = max(1, keep if keep is not None else review_history_keep())
+    archived_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    records: List[Dict[str, Any]] = []
+    
+    trimmed_tasks = []
+    completed_tasks: Dict[str, Dict[str, Any]] = {}
+    for task in state.get("tasks", []):
+        if task.get("status") == "completed":
+            completed_tasks[task.get("task_id")] = task
+        history = task.get("review_history")
+        if isinstance(history, list) and len(history) > keep:
+            trimmed_tasks.append(task)
+            records.extend(
+                {"kind": "review_history", "task_id": task.get("task_id"), "archived_at": archived_at, "entry": entry}
+                for entry in history[:-keep]
+            )
+    
+    findings = state.get("review_findings", [])
+    settled = [f for f in findings if f.get("task_id") in completed_tasks]
+    records.extend(
+        {"kind": "review_finding", "task_id": f.get("task_id"), "archived_at": archived_at, "finding": f}
+        for f in settled
+    )
+    
+    if not records:
+        return RetentionResult()
+    
+    archive_file = archive_path_for(state_file)
+    state[ARCHIVE_OFFSET_KEY] = _append_archive(archive_file, records, state.get(ARCHIVE_OFFSET_KEY, 0))
+    
+    rounds_archived = 0
+    for task in trimmed_tasks:
+        old_rounds = task["review_history"][:-keep]
+        del task["review_history"][:-keep]
+        rollup = _task_rollup(task)
+        rollup["archived_rounds"] += len(old_rounds)
+        for entry in old_rounds:
+            _count(rollup["rounds_by_severity"], entry.get("severity") if isinstance(entry, dict) else None)
+        rounds_archived += len(old_rounds)
+    
+    for finding in settled:
+        rollup = _task_rollup(completed_tasks[finding.get("task_id")])
+        rollup["archived_findings"] += 1
+        _count(rollup["findings_by_severity"], finding.get("severity"))
+    if settled:
+        state["review_findings"] = [f for f in findings if f.get("task_id") not in completed_tasks]
+    
+    return RetentionResult(
+        rounds_archived=rounds_archived,
+        findings_archived=len(settled),
+        archive_file=archive_file
+    )
+
+
+def format_review_rollup(rollup: Optional[Dict[str, Any]]) -> str:
+    """One-line description of archived review rounds (empty if none)"""
+    if not rollup or not rollup.get("archived_rounds"):
+        return ""
+    counts = ", ".join(
+        f"{severity}: {count}" for severity, count in sorted(rollup.get("rounds_by_severity", {}).items())
+    )
+    return f"{rollup['archived_rounds']} earlier review round(s) archived ({counts})"
+
+
+def main():
+    """Command line entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Archive old review rounds and settled findings")
+    parser.add_argument("state_file", help="Path to AGENT_STATE.json")
+    parser.add_argument(
+        "--keep", type=int, default=None,
+        help=f"Review rounds kept per task (default: ${REVIEW_HISTORY_KEEP_ENV_VAR} or {REVIEW_HISTORY_KEEP})"
+    )
+    
+    args = parser.parse_args()
+    
+    state = load_state_file(args.state_file)
+    result = apply_review_retention(state, args.state_file, args.keep)
+    if result.archive_file:
+        write_state_file(args.state_file, state)
+        print(f"✅ Archived {result.rounds_archived} review round(s) and "
+              f"{result.findings_archived} finding(s) to {result.archive_file}")
+    else:
+        print("Nothing to archive")
+
+
+if __name__ == "__main__":
+    main()
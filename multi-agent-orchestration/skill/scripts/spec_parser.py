@@ -8,10 +8,13 @@ Agent will read requirements.md and design.md directly when executing tasks.
 Requirements: 1.2, 11.2, 11.3
 """
 
+import hashlib
+import io
+import json
 import re
 import os
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set, Tuple
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple
 from enum import Enum
 
 
@@ -121,6 +124,32 @@ class Task:
             "blocked_reason": self.blocked_reason,
             "blocked_by": self.blocked_by,
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Task":
+        """Rebuild a Task from to_dict() output"""
+        return cls(
+            task_id=data["task_id"],
+            description=data["description"],
+            task_type=TaskType(data.get("type", TaskType.CODE.value)),
+            status=TaskStatus(data.get("status", TaskStatus.NOT_STARTED.value)),
+            dependencies=list(data.get("dependencies", [])),
+            is_optional=data.get("is_optional", False),
+            parent_id=data.get("parent_id"),
+            subtasks=list(data.get("subtasks", [])),
+            details=list(data.get("details", [])),
+            writes=list(data.get("writes", [])),
+            reads=list(data.get("reads", [])),
+            fix_attempts=data.get("fix_attempts", 0),
+            max_fix_attempts=data.get("max_fix_attempts", 3),
+            escalated=data.get("escalated", False),
+            escalated_at=data.get("escalated_at"),
+            original_agent=data.get("original_agent"),
+            last_review_severity=data.get("last_review_severity"),
+            review_history=list(data.get("review_history", [])),
+            blocked_reason=data.get("blocked_reason"),
+            blocked_by=data.get("blocked_by"),
+        )
 
 
 @dataclass
@@ -207,6 +236,22 @@ class DependencyResult:
                 for tid, deps in self.missing_dependencies.items()]
 
 
+@dataclass
+class SpecLoadResult:
+    """Result of loading a spec directory (see load_spec)"""
+    tasks_result: TasksParseResult
+    validation: ValidationResult
+    dependencies: Optional[DependencyResult] = None
+    from_cache: bool = False
+
+
+# Bump whenever parsing output changes so stale cache entries are ignored
+PARSER_VERSION = 1
+
+# Parse cache stored next to tasks.md (compact JSON)
+SPEC_CACHE_FILENAME = ".spec_parse_cache.json"
+
+
 # Task status markers in tasks.md
 STATUS_MARKERS = {
     "[ ]": TaskStatus.NOT_STARTED,
@@ -216,6 +261,32 @@ STATUS_MARKERS = {
     "[~]": TaskStatus.BLOCKED,
 }
 
+# ============================================================================
+# Compiled patterns
+#
+# Line classification checks a cheap first character / substring before
+# running any of these:
+# - task lines start with '-' or '*'
+# - dependency details contain 'depend' (after lowercasing)
+# - file manifest details start with '_'
+# ============================================================================
+
+# Task checkbox line; supports task IDs like: 1, 1.1, 1.1.1, 1.1.1.1, etc.
+TASK_MARKER_RE = re.compile(r'[-*]\s*\[[xX\s~-]\]')
+TASK_LINE_RE = re.compile(r'[-*]\s*\[([xX\s~-])\](\*)?\s*(\d+(?:\.\d+)*)\s+(.+)$')
+TASK_LINE_START_CHARS = ('-', '*')
+
+# Dependency details (matched against the lowercased detail):
+# "dependencies: 1, 2" / "dependency 3" and "depends on: 1.1" / "depend on 2"
+DEPENDENCY_HINT = 'depend'
+DEPENDENCY_LIST_RE = re.compile(r'dependenc(?:y|ies)[:\s]+([^\n]+)')
+DEPENDS_ON_RE = re.compile(r'depends?\s+on[:\s]+([^\n]+)')
+DEPENDENCY_ID_RE = re.compile(r'(?:task[-_])?(\d+(?:\.\d+)?)')
+
+# File manifest markers (Requirement 2.2)
+WRITES_MARKER = '_writes:'
+READS_MARKER = '_reads:'
+
 # Keywords for task type detection
 UI_KEYWORDS = ["ui", "frontend", "component", "form", "page", "style", "css", "react", "vue"]
 
@@ -239,9 +310,7 @@ def _parse_task_line(line: str) -> Tuple[Optional[str], TaskStatus, bool, str]:
     
     Supports nested task IDs of any depth (e.g., 1, 1.1, 1.1.1, 1.1.1.1).
     """
-    # Pattern supports task IDs like: 1, 1.1, 1.1.1, 1.1.1.1, etc.
-    pattern = r'^[-*]\s*\[([xX\s~-])\](\*)?\s*(\d+(?:\.\d+)*)\s+(.+)$'
-    match = re.match(pattern, line.strip())
+    match = TASK_LINE_RE.match(line.strip())
     
     if not match:
         return None, TaskStatus.NOT_STARTED, False, ""
@@ -257,125 +326,161 @@ def _parse_task_line(line: str) -> Tuple[Optional[str], TaskStatus, bool, str]:
     return task_id, status, is_optional, description
 
 
-def parse_tasks(content: str) -> TasksParseResult:
+def _finish_task(task: Task, details: List[str]) -> Task:
+    """Attach details and derive type and file manifest (Requirement 2.2)"""
+    task.details = details
+    task.task_type = _detect_task_type(task.description, details)
+    task.writes, task.reads = _extract_file_manifest(details)
+    return task
+
+
+def iter_tasks(
+    lines: Iterable[str],
+    errors: Optional[List[ParseError]] = None
+) -> Iterator[Task]:
     """
-    Parse tasks.md content and extract task definitions.
+    Lazily parse task lines, yielding each Task once its details are complete.
     
-    Uses two-pass parsing to handle parent-subtask relationships correctly
-    regardless of order in the file (Requirement 14.1, 14.2, 14.3, 14.4).
+    Only the task currently being parsed is held in memory, so ``lines`` can
+    be an open file handle. Yielded tasks have parent_id set but empty
+    subtasks lists; link_subtasks() (used by parse_tasks_stream()) builds
+    parent-subtask relationships.
     
-    Pass 1: Collect all tasks with their basic properties
-    Pass 2: Build parent-subtask relationships
+    An invalid task line is reported and ends the previous task, which has
+    already been yielded; detail lines after it up to the next valid task
+    line are dropped rather than attached to the previous task.
     
     Args:
-        content: Markdown content of tasks.md
+        lines: Iterable of tasks.md lines (with or without line endings)
+        errors: Optional list that receives ParseError entries for invalid
+            task lines
         
-    Returns:
-        TasksParseResult: Parsed tasks and any errors
+    Yields:
+        Task objects in file order
     """
-    tasks: List[Task] = []
-    errors: List[ParseError] = []
-    
-    lines = content.split('\n')
     current_task: Optional[Task] = None
     current_details: List[str] = []
-    line_num = 0
     
-    # ========================================================================
-    # Pass 1: Collect all tasks with basic properties
-    # ========================================================================
-    for line in lines:
-        line_num += 1
+    for line_num, line in enumerate(lines, start=1):
         stripped = line.strip()
         
-        if not stripped or stripped.startswith('#'):
+        if not stripped:
+            continue
+        first = stripped[0]
+        if first == '#':
             continue
         
-        if re.match(r'^[-*]\s*\[[xX\s~-]\]', stripped):
-            # Save previous task
+        if first in TASK_LINE_START_CHARS and TASK_MARKER_RE.match(stripped):
+            # Emit previous task
             if current_task:
-                current_task.details = current_details
-                current_task.task_type = _detect_task_type(current_task.description, current_details)
-                # Extract file manifest from details (Requirement 2.2)
-                writes, reads = _extract_file_manifest(current_details)
-                current_task.writes = writes
-                current_task.reads = reads
-                tasks.append(current_task)
+                yield _finish_task(current_task, current_details)
+                current_task = None
                 current_details = []
             
-            # Parse new task
-            task_id, status, is_optional, description = _parse_task_line(stripped)
-            
-            if task_id is None:
-                errors.append(ParseError("tasks.md", line_num, f"Invalid task format: {stripped}"))
+            match = TASK_LINE_RE.match(stripped)
+            if not match:
+                if errors is not None:
+                    errors.append(ParseError("tasks.md", line_num, f"Invalid task format: {stripped}"))
                 continue
             
+            task_id = match.group(3)
             current_task = Task(
                 task_id=task_id,
-                description=description,
-                status=status,
-                is_optional=is_optional,
+                description=match.group(4).strip(),
+                status=STATUS_MARKERS.get(f"[{match.group(1)}]", TaskStatus.NOT_STARTED),
+                is_optional=match.group(2) == "*",
             )
             
             # Set parent_id for subtasks (e.g., 1.1 -> parent is 1, 1.1.1 -> parent is 1.1)
-            # Note: We only set parent_id here, subtasks list is built in Pass 2
+            # Note: subtasks lists are built by link_subtasks
             if '.' in task_id:
-                # Find the immediate parent (e.g., 1.1.1 -> 1.1, 1.1 -> 1)
-                parts = task_id.rsplit('.', 1)
-                current_task.parent_id = parts[0]
+                current_task.parent_id = task_id.rsplit('.', 1)[0]
         
-        elif current_task and stripped.startswith('-'):
+        elif current_task and first == '-':
             current_details.append(stripped[1:].strip())
         
-        elif current_task and stripped:
+        elif current_task:
             current_details.append(stripped)
     
     # Don't forget the last task
     if current_task:
-        current_task.details = current_details
-        current_task.task_type = _detect_task_type(current_task.description, current_details)
-        # Extract file manifest from details (Requirement 2.2)
-        writes, reads = _extract_file_manifest(current_details)
-        current_task.writes = writes
-        current_task.reads = reads
-        tasks.append(current_task)
-    
-    # ========================================================================
-    # Pass 2: Build parent-subtask relationships (order-independent)
-    # Requirement 14.1, 14.2, 14.3, 14.4
-    # ========================================================================
-    _build_parent_subtask_relationships(tasks)
-    
-    return TasksParseResult(success=len(errors) == 0, tasks=tasks, errors=errors)
+        yield _finish_task(current_task, current_details)
 
 
-def _build_parent_subtask_relationships(tasks: List[Task]) -> None:
+def link_subtasks(tasks: Iterable[Task]) -> List[Task]:
     """
-    Build parent-subtask relationships from parsed tasks.
-    
-    This is a post-processing step that links subtasks to their parents
-    regardless of the order they appear in tasks.md.
+    Collect streamed tasks and build parent-subtask relationships.
     
-    Handles nested subtasks (e.g., 1.1.1 is a subtask of 1.1, which is a subtask of 1).
+    Children are recorded by parent_id as tasks arrive, so linking needs no
+    rescan and works regardless of the order parents and subtasks appear
+    in tasks.md. Handles nested subtasks (e.g., 1.1.1 is a subtask of 1.1,
+    which is a subtask of 1). Subtask lists keep file order.
     
     Requirements: 14.1, 14.2, 14.3, 14.4
     
     Args:
-        tasks: List of parsed Task objects (modified in place)
+        tasks: Iterable of Task objects (e.g. from iter_tasks)
+        
+    Returns:
+        List of the same Task objects in input order, with subtasks set
     """
-    # Build task_id -> Task mapping
-    task_map: Dict[str, Task] = {t.task_id: t for t in tasks}
+    collected: List[Task] = []
+    task_map: Dict[str, Task] = {}
+    children: Dict[str, List[str]] = {}
     
-    # Clear any existing subtasks lists (in case of re-processing)
     for task in tasks:
+        collected.append(task)
+        task_map[task.task_id] = task
+        if task.parent_id:
+            children.setdefault(task.parent_id, []).append(task.task_id)
+    
+    # Clear any existing subtasks lists (in case of re-processing)
+    for task in collected:
         task.subtasks = []
     
-    # For each task with a parent_id, add it to the parent's subtasks list
-    for task in tasks:
-        if task.parent_id:
-            parent = task_map.get(task.parent_id)
-            if parent:
-                parent.subtasks.append(task.task_id)
+    for parent_id, subtask_ids in children.items():
+        parent = task_map.get(parent_id)
+        if parent:
+            parent.subtasks = subtask_ids
+    
+    return collected
+
+
+def parse_tasks_stream(stream: Iterable[str]) -> TasksParseResult:
+    """
+    Parse tasks.md from a file handle (or any iterable of lines).
+    
+    Reads line by line instead of loading the whole document, which keeps
+    memory flat for very large generated specs.
+    
+    Args:
+        stream: Open text file or iterable of lines
+        
+    Returns:
+        TasksParseResult: Parsed tasks and any errors
+    """
+    errors: List[ParseError] = []
+    tasks = link_subtasks(iter_tasks(stream, errors))
+    return TasksParseResult(success=len(errors) == 0, tasks=tasks, errors=errors)
+
+
+def parse_tasks(content: str) -> TasksParseResult:
+    """
+    Parse tasks.md content and extract task definitions.
+    
+    Handles parent-subtask relationships correctly regardless of order in
+    the file (Requirement 14.1, 14.2, 14.3, 14.4):
+    
+    Phase 1: Collect tasks with their basic properties (iter_tasks)
+    Phase 2: Build parent-subtask relationships (link_subtasks)
+    
+    Args:
+        content: Markdown content of tasks.md
+        
+    Returns:
+        TasksParseResult: Parsed tasks and any errors
+    """
+    return parse_tasks_stream(io.StringIO(content))
 
 
 def validate_spec_directory(spec_path: str) -> ValidationResult:
@@ -416,13 +521,15 @@ def _extract_dependencies_from_details(details: List[str]) -> List[str]:
     
     for detail in details:
         detail_lower = detail.lower()
+        # Fast path: both patterns need the 'depend' stem
+        if DEPENDENCY_HINT not in detail_lower:
+            continue
         
         # Pattern: dependencies: 1, 2 or depends on: 1.1
-        for pattern in [r'dependenc(?:y|ies)[:\s]+([^\n]+)', r'depends?\s+on[:\s]+([^\n]+)']:
-            match = re.search(pattern, detail_lower)
+        for pattern in (DEPENDENCY_LIST_RE, DEPENDS_ON_RE):
+            match = pattern.search(detail_lower)
             if match:
-                task_ids = re.findall(r'(?:task[-_])?(\d+(?:\.\d+)?)', match.group(1))
-                dependencies.extend(task_ids)
+                dependencies.extend(DEPENDENCY_ID_RE.findall(match.group(1)))
     
     return list(dict.fromkeys(dependencies))
 
@@ -451,20 +558,24 @@ def _extract_file_manifest(details: List[str]) -> Tuple[List[str], List[str]]:
     
     for detail in details:
         detail_stripped = detail.strip()
+        # Fast path: both markers start with '_'
+        if not detail_stripped.startswith('_'):
+            continue
+        marker = detail_stripped[:8].lower()
         
         # Parse _writes: marker
-        if detail_stripped.lower().startswith('_writes:'):
+        if marker == WRITES_MARKER:
             # Extract file list after the marker
-            files_str = detail_stripped[8:].strip()  # len('_writes:') = 8
+            files_str = detail_stripped[len(WRITES_MARKER):].strip()
             if files_str:
                 # Split by comma and clean up each file path
                 files = [f.strip() for f in files_str.split(',')]
                 writes.extend([f for f in files if f])
         
         # Parse _reads: marker
-        elif detail_stripped.lower().startswith('_reads:'):
+        elif marker.startswith(READS_MARKER):
             # Extract file list after the marker
-            files_str = detail_stripped[7:].strip()  # len('_reads:') = 7
+            files_str = detail_stripped[len(READS_MARKER):].strip()
             if files_str:
                 # Split by comma and clean up each file path
                 files = [f.strip() for f in files_str.split(',')]
@@ -655,31 +766,140 @@ def topological_sort(tasks: List[Task]) -> Tuple[List[Task], List[CircularDepend
     return sorted_tasks, [], []
 
 
-def load_tasks_from_spec(spec_path: str) -> Tuple[TasksParseResult, ValidationResult]:
+def file_sha256(path: str) -> str:
+    """SHA-256 hex digest of a file's bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _encode_spec_cache(tasks_sha256: str, tasks_result: TasksParseResult, dependencies: Optional[DependencyResult]) -> str:
+    """Serialize parse and dependency results as compact JSON"""
+    payload: Dict = {
+        "parser_version": PARSER_VERSION,
+        "tasks_sha256": tasks_sha256,
+        "success": tasks_result.success,
+        "tasks": [t.to_dict() for t in tasks_result.tasks],
+        "errors": [[e.file, e.line, e.message] for e in tasks_result.errors],
+    }
+    if dependencies is not None:
+        payload["dependencies"] = {
+            "edges": dependencies.graph.edges,
+            "circular": [c.cycle for c in dependencies.circular_dependencies],
+            "missing": dependencies.missing_dependencies,
+        }
+    return json.dumps(payload, separators=(',', ':'))
+
+
+def _decode_spec_cache(raw: str, tasks_sha256: str) -> Optional[Tuple[TasksParseResult, Optional[DependencyResult]]]:
+    """Deserialize a cache entry, or None if it is stale or malformed"""
+    try:
+        payload = json.loads(raw)
+        if payload.get("parser_version") != PARSER_VERSION or payload.get("tasks_sha256") != tasks_sha256:
+            return None
+        
+        tasks_result = TasksParseResult(
+            success=payload["success"],
+            tasks=[Task.from_dict(t) for t in payload["tasks"]],
+            errors=[ParseError(file, line, message) for file, line, message in payload["errors"]],
+        )
+        
+        dependencies = None
+        if "dependencies" in payload:
+            graph = DependencyGraph()
+            for task_id, deps in payload["dependencies"]["edges"].items():
+                graph.add_task(task_id, deps)
+            dependencies = DependencyResult(
+                graph=graph,
+                circular_dependencies=[CircularDependencyError(cycle=c) for c in payload["dependencies"]["circular"]],
+                missing_dependencies=payload["dependencies"]["missing"],
+            )
+    except (ValueError, KeyError, TypeError):
+        return None
+    
+    return tasks_result, dependencies
+
+
+def _write_spec_cache(cache_path: str, content: str) -> None:
+    """Write the cache atomically; failures (e.g. read-only spec dir) are ignored"""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_spec(spec_path: str, use_cache: bool = True) -> SpecLoadResult:
     """
-    Load and parse tasks from a spec directory.
+    Validate a spec directory, parse tasks.md and extract dependencies.
+    
+    With use_cache, results are stored in SPEC_CACHE_FILENAME inside the
+    spec directory, keyed by the SHA-256 of tasks.md and PARSER_VERSION.
+    Unchanged specs are then loaded without re-parsing. Directory
+    validation only stats files and is always re-run.
     
     Args:
         spec_path: Path to spec directory
+        use_cache: Read and write the on-disk parse cache
         
     Returns:
-        Tuple of (tasks_result, validation_result)
+        SpecLoadResult (dependencies is None if tasks.md failed to parse)
     """
     validation = validate_spec_directory(spec_path)
     if not validation.valid:
-        return TasksParseResult(success=False, errors=[]), validation
+        return SpecLoadResult(tasks_result=TasksParseResult(success=False, errors=[]), validation=validation)
     
     tasks_path = os.path.join(spec_path, "tasks.md")
-    with open(tasks_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    cache_path = os.path.join(spec_path, SPEC_CACHE_FILENAME)
+    tasks_sha256 = file_sha256(tasks_path) if use_cache else ""
+    
+    if use_cache:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = _decode_spec_cache(f.read(), tasks_sha256)
+        except OSError:
+            cached = None
+        if cached is not None:
+            tasks_result, dependencies = cached
+            return SpecLoadResult(
+                tasks_result=tasks_result,
+                validation=validation,
+                dependencies=dependencies,
+                from_cache=True
+            )
     
-    tasks_result = parse_tasks(content)
+    with open(tasks_path, 'r', encoding='utf-8') as f:
+        tasks_result = parse_tasks_stream(f)
     
     # Extract dependencies
-    if tasks_result.success:
-        extract_dependencies(tasks_result.tasks)
+    dependencies = extract_dependencies(tasks_result.tasks) if tasks_result.success else None
+    
+    if use_cache:
+        _write_spec_cache(cache_path, _encode_spec_cache(tasks_sha256, tasks_result, dependencies))
     
-    return tasks_result, validation
+    return SpecLoadResult(tasks_result=tasks_result, validation=validation, dependencies=dependencies)
+
+
+def load_tasks_from_spec(spec_path: str, use_cache: bool = True) -> Tuple[TasksParseResult, ValidationResult]:
+    """
+    Load and parse tasks from a spec directory.
+    
+    Args:
+        spec_path: Path to spec directory
+        use_cache: Use the on-disk parse cache (see load_spec)
+        
+    Returns:
+        Tuple of (tasks_result, validation_result)
+    """
+    loaded = load_spec(spec_path, use_cache=use_cache)
+    return loaded.tasks_result, loaded.validation
 
 
 if __name__ == "__main__":
@@ -687,14 +907,14 @@ if __name__ == "__main__":
     import json
     
     if len(sys.argv) < 2:
-        print("Usage: spec_parser.py <spec_directory>")
+        print("Usage: spec_parser.py <spec_directory> [--json] [--no-cache]")
         print("       spec_parser.py <tasks.md>")
         sys.exit(1)
     
     path = sys.argv[1]
     
     if os.path.isdir(path):
-        tasks_result, validation = load_tasks_from_spec(path)
+        tasks_result, validation = load_tasks_from_spec(path, use_cache="--no-cache" not in sys.argv)
         
         if not validation.valid:
             print(f"❌ Validation failed: {validation.errors}")
@@ -709,8 +929,7 @@ if __name__ == "__main__":
     
     elif path.endswith("tasks.md"):
         with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        result = parse_tasks(content)
+            result = parse_tasks_stream(f)
         extract_dependencies(result.tasks)
         
         print(f"Parsed {len(result.tasks)} tasks:")
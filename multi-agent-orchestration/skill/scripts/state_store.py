@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+AGENT_STATE.json Persistence
+
+Encoding, atomic writes and a dirty-tracking writer for the state file.
+- JSON codecs: orjson or ujson when installed, stdlib json otherwise
+  (override with $ORCHESTRATION_JSON_CODEC=orjson|ujson|json); integers
+  beyond 64 bits are not supported
+- load_state_file / write_state_file: one load/save path for every script;
+  writes are compact unless $ORCHESTRATION_STATE_FORMAT=pretty
+- Detached task fields: large per-task output, error and review_history
+  are kept in <state>.detached/<task_id>.json and referenced from the task,
+  so commands that do not need them load a small file
+  (load_state_file(..., detached=False)) and attach them per task on demand
+- Large worker output/error and finding details go to the content-addressed
+  blob store (blob_store.py) on save; the state keeps summaries and refs
+- StateWriter: callers mark the in-memory state dirty after each mutation
+  step; the file is written when the cycle ends (flush) or when a time or
+  change-count threshold is reached, so long-running cycles still persist
+  their progress regularly
+- zstd snapshots (optional `zstandard` package) for archiving finished
+  runs; load_state_file reads them transparently
+
+Usage:
+    state_store.py snapshot AGENT_STATE.json [-o run.json.zst]
+    state_store.py cat run.json.zst [--pretty]
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Optional
+from urllib.parse import quote
+
+from blob_store import BlobStore, blob_dir_for, externalize_blobs, inline_all_blobs
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+JSON_CODEC_ENV_VAR = "ORCHESTRATION_JSON_CODEC"
+STATE_FORMAT_ENV_VAR = "ORCHESTRATION_STATE_FORMAT"
+
+# A dirty state is written at least this often during a cycle (seconds)
+STATE_FLUSH_INTERVAL = 5.0
+
+# ... and after this many marked changes (tasks touched), whichever is first
+STATE_MAX_PENDING_CHANGES = 256
+
+# Per-task fields that grow with the run; detached into a side file once
+# their encoded size reaches DETACH_MIN_BYTES
+DETACHABLE_TASK_FIELDS = ("output", "error", "review_history")
+DETACH_MIN_BYTES = 1024
+DETACHED_KEY = "detached"
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+DEFAULT_ZSTD_LEVEL = 10
+
+
+# =============================================================================
+# JSON Codecs
+# =============================================================================
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """A JSON implementation: loads(bytes) and dumps(obj, compact) -> bytes"""
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any, bool], bytes]
+
+
+def _stdlib_dumps(obj: Any, compact: bool) -> bytes:
+    if compact:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# orjson rejects some values stdlib json accepts (integers beyond 64 bits,
+# lone surrogates); those fall back to stdlib json. Loading integers beyond
+# 64 bits is not supported: orjson reads them as floats. State files only
+# hold counters and timestamps, so this never applies to them
+def _orjson_loads(data: bytes) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def _orjson_dumps(obj: Any, compact: bool) -> bytes:
+    option = orjson.OPT_NON_STR_KEYS
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(obj, option=option)
+    except orjson.JSONEncodeError:
+        return _stdlib_dumps(obj, compact)
+
+
+def _ujson_dumps(obj: Any, compact: bool) -> bytes:
+    text = ujson.dumps(obj, indent=0 if compact else 2, ensure_ascii=False, escape_forward_slashes=False)
+    return text.encode("utf-8")
+
+
+def _build_codecs() -> Dict[str, JsonCodec]:
+    codecs = {}
+    if orjson is not None:
+        codecs["orjson"] = JsonCodec("orjson", _orjson_loads, _orjson_dumps)
+    if ujson is not None:
+        codecs["ujson"] = JsonCodec("ujson", ujson.loads, _ujson_dumps)
+    codecs["json"] = JsonCodec("json", json.loads, _stdlib_dumps)
+    return codecs
+
+
+# Installed codecs, fastest first
+CODECS = _build_codecs()
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Select a JSON codec.
+    
+    Args:
+        name: "orjson", "ujson", "json" or "auto" (default: $ORCHESTRATION_JSON_CODEC or auto)
+    
+    Returns:
+        The requested codec, or the fastest installed one for auto
+    
+    Raises:
+        ValueError: If the requested codec is unknown or not installed
+    """
+    name = name or os.environ.get(JSON_CODEC_ENV_VAR) or "auto"
+    if name == "auto":
+        return next(iter(CODECS.values()))
+    if name not in CODECS:
+        raise ValueError(f"JSON codec {name!r} is not available (installed: {', '.join(CODECS)})")
+    return CODECS[name]
+
+
+def default_compact() -> bool:
+    """Whether state files are written compact ($ORCHESTRATION_STATE_FORMAT != pretty)"""
+    return os.environ.get(STATE_FORMAT_ENV_VAR, "compact") != "pretty"
+
+
+# =============================================================================
+# Load and Save
+# =============================================================================
+
+def _decompress(data: bytes) -> bytes:
+    if zstandard is None:
+        raise RuntimeError("Reading a zstd state snapshot requires the 'zstandard' package")
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+def load_state_file(
+    state_file: str,
+    codec: Optional[JsonCodec] = None,
+    detached: bool = True
+) -> Dict[str, Any]:
+    """
+    Load AGENT_STATE.json (or a zstd snapshot of it).
+    
+    Args:
+        state_file: Path to the state file or snapshot
+        codec: JSON codec (default: get_codec())
+        detached: Also load detached task fields; with False, tasks keep
+            only their "detached" reference and attach_detached_fields()
+            loads the fields of the tasks that need them
+    
+    Returns:
+        Parsed state
+    """
+    codec = codec or get_codec()
+    with open(state_file, 'rb') as f:
+        data = f.read()
+    if data.startswith(ZSTD_MAGIC):
+        data = _decompress(data)
+    state = codec.loads(data)
+    if detached and isinstance(state, dict):
+        attach_detached_fields(state_file, state.get("tasks", []), codec)
+    return state
+
+
+def _write_atomic(path: str, data: bytes, durable: bool) -> None:
+    tmp_file = path + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+
+def write_state_file(
+    state_file: str,
+    state: Dict[str, Any],
+    compact: Optional[bool] = None,
+    durable: bool = False,
+    codec: Optional[JsonCodec] = None,
+    detach: bool = True,
+    blobs: bool = True
+) -> None:
+    """
+    Write AGENT_STATE.json atomically.
+    
+    Blobs and detached task fields are written first, so the state file
+    never references a file that does not exist yet. Moving text to the
+    blob store replaces it with a summary in the given state too.
+    
+    Args:
+        state_file: Path to AGENT_STATE.json
+        state: State to write
+        compact: Write without indentation (default: default_compact())
+        durable: fsync the data before the rename
+        codec: JSON codec (default: get_codec())
+        detach: Move large task fields to side files
+        blobs: Move large output/error/details text to the blob store
+    """
+    if compact is None:
+        compact = default_compact()
+    codec = codec or get_codec()
+    if blobs:
+        externalize_blobs(state, BlobStore(blob_dir_for(state_file)))
+    if detach:
+        state = _detach_task_fields(state_file, state, codec, durable)
+    _write_atomic(state_file, codec.dumps(state, compact), durable)
+
+
+# =============================================================================
+# Detached Task Fields
+# =============================================================================
+
+def detached_dir_for(state_file: str) -> str:
+    """Side file directory for detached task fields: AGENT_STATE.detached/"""
+    base, _ = os.path.splitext(state_file)
+    return base + ".detached"
+
+
+def _detached_path(state_file: str, task_id: str) -> str:
+    return os.path.join(detached_dir_for(state_file), quote(str(task_id), safe="") + ".json")
+
+
+def _read_detached(state_file: str, task_id: str, codec: JsonCodec) -> Dict[str, Any]:
+    try:
+        with open(_detached_path(state_file, task_id), 'rb') as f:
+            return codec.loads(f.read())
+    except FileNotFoundError:
+        return {}
+
+
+def attach_detached_fields(
+    state_file: str,
+    tasks: Iterable[Dict[str, Any]],
+    codec: Optional[JsonCodec] = None
+) -> int:
+    """
+    Load the detached fields of the given tasks into them.
+    
+    Fields already set on a task are kept (the wrapper may have written a
+    newer output into the state file itself).
+    
+    Args:
+        state_file: Path to AGENT_STATE.json the tasks were loaded from
+        tasks: Task dicts to complete
+        codec: JSON codec (default: get_codec())
+    
+    Returns:
+        Number of tasks whose side file was read
+    """
+    codec = codec or get_codec()
+    attached = 0
+    for task in tasks:
+        if not isinstance(task, dict) or DETACHED_KEY not in task or "task_id" not in task:
+            continue
+        for field_name, value in _read_detached(state_file, task["task_id"], codec).items():
+            task.setdefault(field_name, value)
+        attached += 1
+    return attached
+
+
+def _detach_task(state_file: str, task: Dict[str, Any], codec: JsonCodec, durable: bool) -> Dict[str, Any]:
+    """Return the task as written to the state file, writing its side file if needed"""
+    if not isinstance(task, dict) or "task_id" not in task:
+        return task
+    present = {name: task[name] for name in DETACHABLE_TASK_FIELDS if name in task}
+    marker = task.get(DETACHED_KEY)
+    if not present:
+        # Nothing loaded: the reference and its side file stay as they are
+        return task
+    
+    if marker and set(marker.get("fields", [])) - present.keys():
+        # Only some fields were attached or set; keep the others
+        for name, value in _read_detached(state_file, task["task_id"], codec).items():
+            present.setdefault(name, value)
+    
+    path = _detached_path(state_file, task["task_id"])
+    data = codec.dumps(present, True)
+    if len(data) < DETACH_MIN_BYTES:
+        task.update(present)
+        if task.pop(DETACHED_KEY, None) is not None:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        return task
+    
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    if not (marker and marker.get("digest") == digest and os.path.exists(path)):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _write_atomic(path, data, durable)
+    task[DETACHED_KEY] = {"fields": sorted(present), "digest": digest, "bytes": len(data)}
+    return {name: value for name, value in task.items() if name not in present}
+
+
+def _detach_task_fields(
+    state_file: str,
+    state: Dict[str, Any],
+    codec: JsonCodec,
+    durable: bool
+) -> Dict[str, Any]:
+    """State as written to the state file: large task fields replaced by references"""
+    tasks = state.get("tasks")
+    if not isinstance(tasks, list):
+        return state
+    
+    written_tasks = [_detach_task(state_file, task, codec, durable) for task in tasks]
+    if all(written is task for written, task in zip(written_tasks, tasks)):
+        return state
+    return {**state, "tasks": written_tasks}
+
+
+def snapshot_path_for(state_file: str) -> str:
+    """Default snapshot path: AGENT_STATE.<UTC timestamp>.json.zst next to the state file"""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    base, _ = os.path.splitext(state_file)
+    return f"{base}.{stamp}.json.zst"
+
+
+def write_state_snapshot(
+    state_file: str,
+    snapshot_file: Optional[str] = None,
+    level: int = DEFAULT_ZSTD_LEVEL
+) -> str:
+    """
+    Archive a state file as a compact, zstd-compressed snapshot.
+    
+    Detached task fields and blobs are included, so the snapshot is
+    self-contained.
+    
+    Args:
+        state_file: Path to AGENT_STATE.json
+        snapshot_file: Output path (default: snapshot_path_for(state_file))
+        level: zstd compression level
+    
+    Returns:
+        Path of the snapshot
+    """
+    if zstandard is None:
+        raise RuntimeError("Writing a zstd state snapshot requires the 'zstandard' package")
+    codec = get_codec()
+    state = load_state_file(state_file, codec)
+    inline_all_blobs(state, BlobStore(blob_dir_for(state_file)))
+    snapshot_file = snapshot_file or snapshot_path_for(state_file)
+    for task in state.get("tasks", []):
+        if isinstance(task, dict):
+            task.pop(DETACHED_KEY, None)
+    data = zstandard.ZstdCompressor(level=level).compress(codec.dumps(state, True))
+    _write_atomic(snapshot_file, data, durable=True)
+    return snapshot_file
+
+
+# =============================================================================
+# Coalesced Writes
+# =============================================================================
+
+class StateWriter:
+    """
+    Unit of work over one loaded AGENT_STATE.json.
+    
+    mark_dirty() records that the in-memory state changed; flush() writes
+    it if anything changed since the last write. A dirty state is also
+    written from mark_dirty() once flush_interval seconds have passed since
+    the last write (or since loading), or once max_pending changes have
+    accumulated.
+    """
+    
+    def __init__(
+        self,
+        state_file: str,
+        state: Dict[str, Any],
+        compact: Optional[bool] = None,
+        flush_interval: Optional[float] = STATE_FLUSH_INTERVAL,
+        max_pending: Optional[int] = STATE_MAX_PENDING_CHANGES,
+        durable: bool = True
+    ):
+        self.state_file = state_file
+        self.state = state
+        self.compact = compact
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.durable = durable
+        self.pending = 0
+        self.dirty = False
+        self.writes = 0
+        self._last_write = time.monotonic()
+    
+    def mark_dirty(self, changes: int = 1) -> bool:
+        """
+        Record a change to the state.
+        
+        Args:
+            changes: Number of changed items (e.g. tasks in a batch)
+        
+        Returns:
+            True if the change triggered a write
+        """
+        self.dirty = True
+        self.pending += max(1, changes)
+        if self._threshold_reached():
+            return self.flush()
+        return False
+    
+    def _threshold_reached(self) -> bool:
+        if self.max_pending is not None and self.pending >= self.max_pending:
+            return True
+        if self.flush_interval is not None and time.monotonic() - self._last_write >= self.flush_interval:
+            return True
+        return False
+    
+    def flush(self) -> bool:
+        """
+        Write the state if it changed since the last write.
+        
+        Returns:
+            True if the file was written
+        """
+        if not self.dirty:
+            return False
+        write_state_file(self.state_file, self.state, compact=self.compact, durable=self.durable)
+        self.dirty = False
+        self.pending = 0
+        self.writes += 1
+        self._last_write = time.monotonic()
+        return True
+    
+    def __enter__(self) -> "StateWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.flush()
+        return False
+
+
+def main():
+    """Command line entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Snapshot and inspect AGENT_STATE.json files")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    snapshot_parser = subparsers.add_parser("snapshot", help="Archive a state file as a zstd snapshot")
+    snapshot_parser.add_argument("state_file", help="Path to AGENT_STATE.json")
+    snapshot_parser.add_argument("-o", "--output", help="Snapshot path (default: AGENT_STATE.<timestamp>.json.zst)")
+    snapshot_parser.add_argument("--level", type=int, default=DEFAULT_ZSTD_LEVEL, help="zstd level (default: %(default)s)")
+    
+    cat_parser = subparsers.add_parser("cat", help="Print a state file or snapshot as JSON")
+    cat_parser.add_argument("state_file", help="State file or .json.zst snapshot")
+    cat_parser.add_argument("--pretty", action="store_true", help="Indent the output")
+    
+    args = parser.parse_args()
+    
+    try:
+        if args.command == "snapshot":
+            snapshot_file = write_state_snapshot(args.state_file, args.output, args.level)
+            print(f"✅ Wrote {snapshot_file} ({os.path.getsize(snapshot_file)} bytes, "
+                  f"from {os.path.getsize(args.state_file)} bytes)")
+        else:
+            codec = get_codec()
+            state = load_state_file(args.state_file, codec)
+            sys.stdout.write(codec.dumps(state, not args.pretty).decode("utf-8") + "\n")
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
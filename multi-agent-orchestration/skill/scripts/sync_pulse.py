@@ -7,22 +7,72 @@ Synchronizes AGENT_STATE.json to PROJECT_PULSE.md:
 - Updates Narrative Delta with recent completions
 - Updates Risks & Debt with blocked items and pending decisions
 - Escalates 24h+ pending decisions
+- Skips the write when the regenerated document is unchanged, and writes
+  atomically (temp file + rename) when it does change
+- Optionally watches AGENT_STATE.json (--watch) and re-renders only the
+  sections whose inputs changed
 
 Requirements: 6.1, 6.3, 6.4, 6.6
 """
 
+import heapq
 import json
 import os
-import re
+import select
+import struct
 import sys
+import time
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import List, Dict, Any, Callable, Optional, Set, Tuple
 
 # Add script directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# pulse_engine.py is a symlink to the agent-pulse-coordination skill's copy
+_PULSE_ENGINE = Path(__file__).parent / "pulse_engine.py"
+if not _PULSE_ENGINE.is_file():
+    raise ImportError(
+        f"{_PULSE_ENGINE} is missing or does not resolve to "
+        "skills/agent-pulse-coordination/scripts/pulse_engine.py; install the "
+        "agent-pulse-coordination skill alongside this one or copy the file in place (cp -L)"
+    )
+
+from pulse_engine import (
+    MentalModel,
+    RisksAndDebt,
+    SemanticAnchor,
+    PulseDocument,
+    SectionMemo,
+    SECTION_PATTERNS,
+    SECTION_ORDER,
+    PULSE_PREAMBLE,
+    content_hash,
+    extract_mermaid,
+    find_section_layout,
+    find_section_spans,
+    find_sections,
+    generate_pulse,
+    parse_risks_and_debt,
+    parse_semantic_anchors,
+    render_mental_model,
+    render_narrative_delta,
+    render_risks_and_debt,
+    render_semantic_anchors,
+    sync_pulse_paths,
+    write_text_atomic,
+)
+
+from state_store import load_state_file
+from tracing import enable_tracing, traced, TRACE_ENV_VAR
+from profiling import add_profiling_arguments, profiling_from_args
+
+
+# Rendered sections keyed by (section_name, inputs_fingerprint, section_text_hash)
+_section_memo = SectionMemo(limit=256)
+
 
 @dataclass
 class SyncResult:
@@ -31,47 +81,23 @@ class SyncResult:
     message: str
     pulse_updated: bool = False
     errors: List[str] = field(default_factory=list)
+    sections_updated: List[str] = field(default_factory=list)
 
 
 @dataclass
-class MentalModel:
-    """Mental Model section data"""
-    description: str
-    mermaid_diagram: str
-
-
-@dataclass
-class RisksAndDebt:
-    """Risks & Debt section data"""
-    cognitive_warnings: List[str] = field(default_factory=list)
-    technical_debt: List[str] = field(default_factory=list)
-    pending_decisions: List[str] = field(default_factory=list)
-
-
-@dataclass
-class SemanticAnchor:
-    """Semantic anchor entry"""
-    module: str
-    path: str
-    symbol: str
-
-
-@dataclass
-class PulseDocument:
-    """Complete PULSE document structure"""
-    mental_model: MentalModel
-    narrative_delta: str
-    risks_and_debt: RisksAndDebt
-    semantic_anchors: List[SemanticAnchor]
-
-
-# Section header patterns
-SECTION_PATTERNS = {
-    'mental_model': r'^##\s*🟢?\s*Mental\s*Model',
-    'narrative_delta': r'^##\s*🟡?\s*Narrative\s*Delta',
-    'risks_and_debt': r'^##\s*🔴?\s*Risks\s*[&＆]\s*Debt',
-    'semantic_anchors': r'^##\s*🔗?\s*Semantic\s*Anchors',
-}
+class StateSummary:
+    """Task statistics shared by the PULSE section builders (see summarize_state)"""
+    total: int = 0
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    agent_counts: Dict[str, int] = field(default_factory=dict)
+    completed: List[Dict[str, Any]] = field(default_factory=list)
+    in_progress: List[Dict[str, Any]] = field(default_factory=list)
+    blocked: List[Dict[str, Any]] = field(default_factory=list)
+    recent_completions: List[Dict[str, Any]] = field(default_factory=list)
+    
+    def count(self, status: str) -> int:
+        """Number of tasks with the given status"""
+        return self.status_counts.get(status, 0)
 
 
 def parse_datetime(dt_str: str) -> Optional[datetime]:
@@ -103,39 +129,10 @@ def is_older_than_24h(dt_str: str) -> bool:
     return (now - dt) > timedelta(hours=24)
 
 
-def _find_sections(content: str) -> Dict[str, str]:
-    """Find positions and content of each section in the document"""
-    lines = content.split('\n')
-    sections = {}
-    current_section = None
-    current_lines = []
-    
-    for line in lines:
-        found_section = None
-        for section_name, pattern in SECTION_PATTERNS.items():
-            if re.match(pattern, line, re.IGNORECASE):
-                found_section = section_name
-                break
-        
-        if found_section:
-            if current_section:
-                sections[current_section] = '\n'.join(current_lines)
-            current_section = found_section
-            current_lines = [line]
-        elif current_section:
-            current_lines.append(line)
-    
-    if current_section:
-        sections[current_section] = '\n'.join(current_lines)
-    
-    return sections
-
-
 def _parse_mental_model(content: str) -> MentalModel:
     """Parse Mental Model section"""
     # Extract Mermaid diagram
-    mermaid_match = re.search(r'```mermaid\s*(.*?)```', content, re.DOTALL)
-    mermaid_diagram = mermaid_match.group(1).strip() if mermaid_match else ''
+    mermaid_diagram = extract_mermaid(content) or ''
     
     # Extract description (text before mermaid, excluding header)
     lines_before = content.split('```mermaid')[0] if '```mermaid' in content else content
@@ -154,74 +151,14 @@ def _parse_narrative_delta(content: str) -> str:
     """Parse Narrative Delta section"""
     lines = []
     for line in content.split('\n'):
-        if not re.match(r'^##', line):
+        if not line.startswith('##'):
             lines.append(line)
     return '\n'.join(lines).strip()
 
 
-def _parse_risks_and_debt(content: str) -> RisksAndDebt:
-    """Parse Risks & Debt section"""
-    cognitive_warnings = []
-    technical_debt = []
-    pending_decisions = []
-    
-    current_subsection = None
-    
-    for line in content.split('\n'):
-        line_stripped = line.strip()
-        line_lower = line_stripped.lower()
-        
-        if line_stripped.startswith('###') or line_stripped.startswith('**'):
-            if 'cognitive' in line_lower:
-                current_subsection = 'cognitive'
-                continue
-            elif 'technical debt' in line_lower:
-                current_subsection = 'debt'
-                continue
-            elif 'pending' in line_lower:
-                current_subsection = 'pending'
-                continue
-        
-        list_match = re.match(r'^[-*]\s+(.+)', line_stripped)
-        if list_match and current_subsection:
-            item = list_match.group(1).strip()
-            if item.lower() == 'none':
-                continue
-            if current_subsection == 'cognitive':
-                cognitive_warnings.append(item)
-            elif current_subsection == 'debt':
-                technical_debt.append(item)
-            elif current_subsection == 'pending':
-                pending_decisions.append(item)
-    
-    return RisksAndDebt(
-        cognitive_warnings=cognitive_warnings,
-        technical_debt=technical_debt,
-        pending_decisions=pending_decisions
-    )
-
-
-def _parse_semantic_anchors(content: str) -> List[SemanticAnchor]:
-    """Parse Semantic Anchors section"""
-    anchors = []
-    anchor_pattern = r'\[([^\]]+)\]\s*`?([^`\s]+)`?\s*->\s*`?([^`\s]+)`?'
-    
-    for line in content.split('\n'):
-        if line.strip().startswith('-') or line.strip().startswith('*'):
-            match = re.search(anchor_pattern, line)
-            if match:
-                anchors.append(SemanticAnchor(
-                    module=match.group(1).strip(),
-                    path=match.group(2).strip(),
-                    symbol=match.group(3).strip()
-                ))
-    
-    return anchors
-
-
 def parse_pulse(content: str) -> Optional[PulseDocument]:
     """Parse PULSE document from markdown content"""
-    sections = _find_sections(content)
+    sections = find_sections(content)
     
     required = ['mental_model', 'narrative_delta', 'risks_and_debt', 'semantic_anchors']
     for section in required:
@@ -231,75 +168,11 @@ def parse_pulse(content: str) -> Optional[PulseDocument]:
     return PulseDocument(
         mental_model=_parse_mental_model(sections['mental_model']),
         narrative_delta=_parse_narrative_delta(sections['narrative_delta']),
-        risks_and_debt=_parse_risks_and_debt(sections['risks_and_debt']),
-        semantic_anchors=_parse_semantic_anchors(sections['semantic_anchors'])
+        risks_and_debt=parse_risks_and_debt(sections['risks_and_debt']),
+        semantic_anchors=parse_semantic_anchors(sections['semantic_anchors'])
     )
 
 
-def generate_pulse(document: PulseDocument) -> str:
-    """Generate PULSE document markdown from structured data"""
-    lines = ['# PROJECT_PULSE', '']
-    
-    # Mental Model
-    lines.append('## 🟢 Mental Model')
-    lines.append('')
-    if document.mental_model.description:
-        lines.append(document.mental_model.description)
-        lines.append('')
-    if document.mental_model.mermaid_diagram:
-        lines.append('```mermaid')
-        lines.append(document.mental_model.mermaid_diagram)
-        lines.append('```')
-        lines.append('')
-    
-    # Narrative Delta
-    lines.append('## 🟡 Narrative Delta')
-    lines.append('')
-    if document.narrative_delta:
-        lines.append(document.narrative_delta)
-    lines.append('')
-    
-    # Risks & Debt
-    lines.append('## 🔴 Risks & Debt')
-    lines.append('')
-    
-    lines.append('### Cognitive Load Warnings')
-    if document.risks_and_debt.cognitive_warnings:
-        for warning in document.risks_and_debt.cognitive_warnings:
-            lines.append(f'- {warning}')
-    else:
-        lines.append('- None')
-    lines.append('')
-    
-    lines.append('### Technical Debt')
-    if document.risks_and_debt.technical_debt:
-        for debt in document.risks_and_debt.technical_debt:
-            lines.append(f'- {debt}')
-    else:
-        lines.append('- None')
-    lines.append('')
-    
-    lines.append('### Pending Decisions')
-    if document.risks_and_debt.pending_decisions:
-        for decision in document.risks_and_debt.pending_decisions:
-            lines.append(f'- {decision}')
-    else:
-        lines.append('- None')
-    lines.append('')
-    
-    # Semantic Anchors
-    lines.append('## 🔗 Semantic Anchors')
-    lines.append('')
-    if document.semantic_anchors:
-        for anchor in document.semantic_anchors:
-            lines.append(f'- [{anchor.module}] `{anchor.path}` -> `{anchor.symbol}`')
-    else:
-        lines.append('- None')
-    
-    return '\n'.join(lines)
-
-
-
 def format_blocked_item(item: Dict[str, Any]) -> str:
     """Format blocked item for PULSE display"""
     task_id = item.get("task_id", "unknown")
@@ -358,21 +231,75 @@ def get_blocked_tasks(agent_state: Dict[str, Any]) -> List[Dict[str, Any]]:
     return [t for t in tasks if t.get("status") == "blocked"]
 
 
-def build_narrative_delta(agent_state: Dict[str, Any], existing_narrative: str) -> str:
+def summarize_state(agent_state: Dict[str, Any], recent_limit: int = 5) -> StateSummary:
+    """
+    Summarize agent state tasks in a single pass.
+    
+    Collects status and per-agent counts plus the completed, in-progress and
+    blocked task lists (in file order). The most recent completions are
+    picked with a bounded heap instead of sorting every completed task;
+    ordering matches sorted(..., reverse=True)[:recent_limit].
+    
+    Args:
+        agent_state: AGENT_STATE.json data
+        recent_limit: Number of recent completions to keep
+    
+    Returns:
+        StateSummary for the PULSE builders
+    """
+    summary = StateSummary()
+    status_counts: Counter = Counter()
+    agent_counts: Counter = Counter()
+    buckets = {
+        "completed": summary.completed,
+        "in_progress": summary.in_progress,
+        "blocked": summary.blocked,
+    }
+    
+    for task in agent_state.get("tasks", []):
+        status = task.get("status")
+        status_counts[status] += 1
+        owner = task.get("owner_agent", "")
+        if owner:
+            agent_counts[owner] += 1
+        bucket = buckets.get(status)
+        if bucket is not None:
+            bucket.append(task)
+    
+    summary.total = sum(status_counts.values())
+    summary.status_counts = dict(status_counts)
+    summary.agent_counts = dict(agent_counts)
+    summary.recent_completions = heapq.nlargest(
+        recent_limit, summary.completed, key=lambda t: t.get("completed_at", "")
+    )
+    return summary
+
+
+def build_narrative_delta(
+    agent_state: Dict[str, Any],
+    existing_narrative: str,
+    summary: Optional[StateSummary] = None
+) -> str:
     """
     Build updated Narrative Delta section.
     
     Requirement 6.1: Update Narrative Delta with recent completions
+    
+    Args:
+        agent_state: AGENT_STATE.json data
+        existing_narrative: Current Narrative Delta text (replaced)
+        summary: Optional precomputed StateSummary (built if omitted)
     """
+    if summary is None:
+        summary = summarize_state(agent_state)
     lines = []
     
     # Get task statistics
-    tasks = agent_state.get("tasks", [])
-    total = len(tasks)
-    completed = len([t for t in tasks if t.get("status") == "completed"])
-    in_progress = len([t for t in tasks if t.get("status") == "in_progress"])
-    blocked = len([t for t in tasks if t.get("status") == "blocked"])
-    pending_review = len([t for t in tasks if t.get("status") == "pending_review"])
+    total = summary.total
+    completed = summary.count("completed")
+    in_progress = summary.count("in_progress")
+    blocked = summary.count("blocked")
+    pending_review = summary.count("pending_review")
     
     # Add spec path info
     spec_path = agent_state.get("spec_path", "unknown")
@@ -388,27 +315,19 @@ def build_narrative_delta(agent_state: Dict[str, Any], existing_narrative: str)
     lines.append(f"- Blocked: {blocked}")
     lines.append("")
     
-    # Add recent completions
-    completed_tasks = get_completed_tasks(agent_state)
-    if completed_tasks:
+    # Add recent completions (latest 5 by completed_at)
+    if summary.recent_completions:
         lines.append("**Recent Completions:**")
-        # Sort by completed_at if available, take last 5
-        sorted_tasks = sorted(
-            completed_tasks,
-            key=lambda t: t.get("completed_at", ""),
-            reverse=True
-        )[:5]
-        for task in sorted_tasks:
+        for task in summary.recent_completions:
             task_id = task.get("task_id", "unknown")
             desc = task.get("description", "")[:50]
             lines.append(f"- ✅ {task_id}: {desc}")
         lines.append("")
     
     # Add in-progress tasks
-    in_progress_tasks = get_in_progress_tasks(agent_state)
-    if in_progress_tasks:
+    if summary.in_progress:
         lines.append("**Currently In Progress:**")
-        for task in in_progress_tasks[:5]:
+        for task in summary.in_progress[:5]:
             task_id = task.get("task_id", "unknown")
             desc = task.get("description", "")[:50]
             owner = task.get("owner_agent", "unknown")
@@ -420,7 +339,8 @@ def build_narrative_delta(agent_state: Dict[str, Any], existing_narrative: str)
 
 def build_risks_and_debt(
     agent_state: Dict[str, Any],
-    existing_risks: RisksAndDebt
+    existing_risks: RisksAndDebt,
+    summary: Optional[StateSummary] = None
 ) -> RisksAndDebt:
     """
     Build updated Risks & Debt section.
@@ -428,6 +348,11 @@ def build_risks_and_debt(
     Requirements:
     - 6.1: Update Risks & Debt with blocked items and pending decisions
     - 6.6: Escalate 24h+ pending decisions
+    
+    Args:
+        agent_state: AGENT_STATE.json data
+        existing_risks: Current Risks & Debt (warnings and debt are kept)
+        summary: Optional precomputed StateSummary (blocked tasks are scanned if omitted)
     """
     cognitive_warnings = list(existing_risks.cognitive_warnings)
     technical_debt = list(existing_risks.technical_debt)
@@ -438,12 +363,12 @@ def build_risks_and_debt(
     blocked_task_ids = {item.get("task_id") for item in blocked_items}
     
     for item in blocked_items:
-        formatted = format_blocked_item(item)
-        if formatted not in cognitive_warnings:
-            cognitive_warnings.append(f"🚫 BLOCKED: {formatted}")
+        warning = f"🚫 BLOCKED: {format_blocked_item(item)}"
+        if warning not in cognitive_warnings:
+            cognitive_warnings.append(warning)
     
     # Also check tasks with blocked status that might not have blocked_items entry
-    blocked_tasks = get_blocked_tasks(agent_state)
+    blocked_tasks = summary.blocked if summary is not None else get_blocked_tasks(agent_state)
     for task in blocked_tasks:
         task_id = task.get("task_id")
         if task_id and task_id not in blocked_task_ids:
@@ -476,18 +401,24 @@ def build_risks_and_debt(
 
 def build_semantic_anchors(
     agent_state: Dict[str, Any],
-    existing_anchors: List[SemanticAnchor]
+    existing_anchors: List[SemanticAnchor],
+    summary: Optional[StateSummary] = None
 ) -> List[SemanticAnchor]:
     """
     Build updated Semantic Anchors section.
     
     Adds anchors for files changed by completed tasks.
+    
+    Args:
+        agent_state: AGENT_STATE.json data
+        existing_anchors: Current anchors (kept, deduplicated by path)
+        summary: Optional precomputed StateSummary (completed tasks are scanned if omitted)
     """
     anchors = list(existing_anchors)
     existing_paths = {a.path for a in anchors}
     
     # Add anchors for files changed in completed tasks
-    completed_tasks = get_completed_tasks(agent_state)
+    completed_tasks = summary.completed if summary is not None else get_completed_tasks(agent_state)
     for task in completed_tasks:
         files_changed = task.get("files_changed", [])
         task_id = task.get("task_id", "unknown")
@@ -510,7 +441,8 @@ def build_semantic_anchors(
 
 def build_mental_model(
     agent_state: Dict[str, Any],
-    existing_model: MentalModel
+    existing_model: MentalModel,
+    summary: Optional[StateSummary] = None
 ) -> MentalModel:
     """
     Build updated Mental Model section from agent state.
@@ -521,22 +453,24 @@ def build_mental_model(
     - Architecture information from design.md (if available)
     
     Requirement 6.1: Update Mental Model if architecture changed
+    
+    Args:
+        agent_state: AGENT_STATE.json data
+        existing_model: Current Mental Model (replaced)
+        summary: Optional precomputed StateSummary (built if omitted)
     """
+    if summary is None:
+        summary = summarize_state(agent_state)
     spec_path = agent_state.get("spec_path", "")
     session_name = agent_state.get("session_name", "orchestration")
     tasks = agent_state.get("tasks", [])
     
     # Build description from state
-    total_tasks = len(tasks)
-    completed = len([t for t in tasks if t.get("status") == "completed"])
-    in_progress = len([t for t in tasks if t.get("status") == "in_progress"])
+    total_tasks = summary.total
+    completed = summary.count("completed")
     
     # Get unique agents involved
-    agents = set()
-    for task in tasks:
-        owner = task.get("owner_agent", "")
-        if owner:
-            agents.add(owner)
+    agents = summary.agent_counts
     
     agents_str = ", ".join(sorted(agents)) if agents else "none assigned"
     
@@ -595,6 +529,175 @@ def build_mental_model(
     )
 
 
+def _digest(payload: Any) -> str:
+    """Stable SHA-256 digest of a JSON-serializable payload"""
+    return content_hash(json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str))
+
+
+def section_input_fingerprints(
+    agent_state: Dict[str, Any],
+    update_mental_model: bool = False
+) -> Dict[str, str]:
+    """
+    Fingerprint the AGENT_STATE inputs of each PULSE section.
+    
+    Each digest covers exactly what that section's builder reads, so a
+    section only needs re-rendering when its digest changes. Pending
+    decisions include their current 24h escalation flag, which changes
+    with time rather than with the state file.
+    
+    Args:
+        agent_state: AGENT_STATE.json data
+        update_mental_model: Whether the mental model section is regenerated
+    
+    Returns:
+        Dict of section name -> hex digest
+    """
+    # One pass over tasks, projecting the fields each section reads
+    mental_model_tasks = []
+    narrative_tasks = []
+    risk_tasks = []
+    anchor_tasks = []
+    for task in agent_state.get("tasks", []):
+        task_id = task.get("task_id")
+        status = task.get("status")
+        description = task.get("description")
+        owner = task.get("owner_agent")
+        mental_model_tasks.append([task_id, status, owner])
+        narrative_tasks.append([task_id, status, description, owner, task.get("completed_at")])
+        risk_tasks.append([task_id, status, description])
+        anchor_tasks.append([task_id, status, task.get("files_changed")])
+    
+    if update_mental_model:
+        mental_model_inputs = [
+            True,
+            agent_state.get("spec_path"),
+            agent_state.get("session_name"),
+            mental_model_tasks,
+        ]
+    else:
+        mental_model_inputs = [False]
+    
+    return {
+        "mental_model": _digest(mental_model_inputs),
+        "narrative_delta": _digest([agent_state.get("spec_path"), narrative_tasks]),
+        "risks_and_debt": _digest([
+            agent_state.get("blocked_items", []),
+            risk_tasks,
+            agent_state.get("deferred_fixes", []),
+            [
+                [decision, is_older_than_24h(decision.get("created_at", ""))]
+                for decision in agent_state.get("pending_decisions", [])
+            ],
+        ]),
+        "semantic_anchors": _digest(anchor_tasks),
+    }
+
+
+def fingerprint_sync_inputs(
+    agent_state: Dict[str, Any],
+    update_mental_model: bool = False
+) -> str:
+    """
+    Fingerprint the AGENT_STATE inputs that PULSE sync reads.
+    
+    Combines the per-section digests from section_input_fingerprints.
+    Other state such as review findings, outputs and window mapping is
+    ignored.
+    
+    Args:
+        agent_state: AGENT_STATE.json data
+        update_mental_model: Whether the mental model section is regenerated
+    
+    Returns:
+        Hex digest that changes whenever the synced PULSE content could
+    """
+    return _digest(section_input_fingerprints(agent_state, update_mental_model))
+
+
+def _update_section(
+    name: str,
+    section_text: str,
+    agent_state: Dict[str, Any],
+    summary: StateSummary,
+    update_mental_model: bool = False
+) -> str:
+    """Parse one existing section, rebuild it from agent state and render it"""
+    if name == 'mental_model':
+        mental_model = _parse_mental_model(section_text)
+        if update_mental_model:
+            mental_model = build_mental_model(agent_state, mental_model, summary)
+        lines = render_mental_model(mental_model)
+    elif name == 'narrative_delta':
+        narrative = build_narrative_delta(agent_state, _parse_narrative_delta(section_text), summary)
+        lines = render_narrative_delta(narrative)
+    elif name == 'risks_and_debt':
+        risks = build_risks_and_debt(agent_state, parse_risks_and_debt(section_text), summary)
+        lines = render_risks_and_debt(risks)
+    else:
+        anchors = build_semantic_anchors(agent_state, parse_semantic_anchors(section_text), summary)
+        lines = render_semantic_anchors(anchors)
+    return '\n'.join(lines)
+
+
+@traced("pulse.render")
+def sync_pulse_sections(
+    pulse_content: str,
+    agent_state: Dict[str, Any],
+    update_mental_model: bool = False
+) -> Tuple[Optional[str], List[str]]:
+    """
+    Regenerate the PULSE sections that changed and splice them into the text.
+    
+    Each section's rendering is memoized on (section, digest of its state
+    inputs, digest of its current text), so a section is only parsed and
+    rebuilt when one of those changes. When the document has exactly the
+    four sections in canonical order, the new sections are spliced in after
+    the existing title block; otherwise the document is rebuilt in
+    canonical form (the last copy of a repeated section is used).
+    
+    Args:
+        pulse_content: Current PULSE document content
+        agent_state: AGENT_STATE.json data
+        update_mental_model: Whether to update mental model section
+    
+    Returns:
+        Tuple of (updated_content, changed section names), or (None, [])
+        if a required section is missing
+    """
+    layout = find_section_layout(pulse_content)
+    spans = {name: (start, end) for name, start, end in layout}
+    if any(name not in spans for name in SECTION_ORDER):
+        return None, []
+    
+    keys = section_input_fingerprints(agent_state, update_mental_model)
+    summaries: List[StateSummary] = []
+    
+    def render(name: str, section_text: str) -> str:
+        if not summaries:
+            summaries.append(summarize_state(agent_state))
+        return _update_section(name, section_text, agent_state, summaries[0], update_mental_model)
+    
+    rendered = []
+    changed = []
+    for name in SECTION_ORDER:
+        start, end = spans[name]
+        section_text = pulse_content[start:end]
+        text = _section_memo.get_or_render(
+            (name, keys[name], content_hash(section_text)),
+            lambda: render(name, section_text)
+        )
+        if text != section_text:
+            changed.append(name)
+        rendered.append(text)
+    
+    if tuple(name for name, _, _ in layout) == SECTION_ORDER:
+        preamble = pulse_content[:layout[0][1]]
+    else:
+        preamble = PULSE_PREAMBLE
+    return preamble + '\n'.join(rendered), changed
+
+
 def sync_pulse_from_state(
     pulse_content: str,
     agent_state: Dict[str, Any],
@@ -603,6 +706,9 @@ def sync_pulse_from_state(
     """
     Synchronize PULSE document from agent state.
     
+    Only sections whose inputs changed are regenerated (see
+    sync_pulse_sections).
+    
     Args:
         pulse_content: Current PULSE document content
         agent_state: AGENT_STATE.json data
@@ -613,41 +719,13 @@ def sync_pulse_from_state(
     
     Requirements: 6.1, 6.3, 6.4, 6.6
     """
-    # Parse existing PULSE document
-    document = parse_pulse(pulse_content)
-    if not document:
+    updated_content, _ = sync_pulse_sections(pulse_content, agent_state, update_mental_model)
+    if updated_content is None:
         return pulse_content, False
-    
-    # Update Mental Model if requested (Requirement 6.1)
-    if update_mental_model:
-        new_mental_model = build_mental_model(agent_state, document.mental_model)
-    else:
-        new_mental_model = document.mental_model
-    
-    # Update Narrative Delta (Requirement 6.1)
-    new_narrative = build_narrative_delta(agent_state, document.narrative_delta)
-    
-    # Update Risks & Debt (Requirements 6.1, 6.6)
-    new_risks = build_risks_and_debt(agent_state, document.risks_and_debt)
-    
-    # Update Semantic Anchors
-    new_anchors = build_semantic_anchors(agent_state, document.semantic_anchors)
-    
-    # Create updated document
-    updated_document = PulseDocument(
-        mental_model=new_mental_model,
-        narrative_delta=new_narrative,
-        risks_and_debt=new_risks,
-        semantic_anchors=new_anchors
-    )
-    
-    # Generate updated content
-    updated_content = generate_pulse(updated_document)
-    
     return updated_content, True
 
 
-
+@traced("pulse.sync")
 def sync_pulse_files(
     state_file_path: str,
     pulse_file_path: str,
@@ -657,6 +735,11 @@ def sync_pulse_files(
     """
     Synchronize PULSE document from state file.
     
+    File handling goes through pulse_engine.sync_pulse_paths: the output is
+    only rewritten when its content changes, writes go through a temp file
+    + rename, and repeated syncs with the same PULSE content and state
+    inputs (see fingerprint_sync_inputs) skip regeneration.
+    
     Args:
         state_file_path: Path to AGENT_STATE.json
         pulse_file_path: Path to PROJECT_PULSE.md
@@ -664,81 +747,194 @@ def sync_pulse_files(
         update_mental_model: Whether to update mental model section
     
     Returns:
-        SyncResult with success status
+        SyncResult with success status (pulse_updated is False when the
+        output was already up to date)
     
     Requirements: 6.1, 6.3, 6.4, 6.6
     """
-    errors = []
-    
-    # Read AGENT_STATE.json
-    try:
-        with open(state_file_path, 'r', encoding='utf-8') as f:
-            agent_state = json.load(f)
-    except FileNotFoundError:
-        return SyncResult(
-            success=False,
-            message=f"State file not found: {state_file_path}",
-            errors=[f"File not found: {state_file_path}"]
-        )
-    except json.JSONDecodeError as e:
-        return SyncResult(
-            success=False,
-            message=f"Invalid JSON in state file: {e}",
-            errors=[str(e)]
-        )
-    except Exception as e:
-        return SyncResult(
-            success=False,
-            message=f"Failed to read state file: {e}",
-            errors=[str(e)]
-        )
+    changed_sections: List[str] = []
     
-    # Read PROJECT_PULSE.md
-    try:
-        with open(pulse_file_path, 'r', encoding='utf-8') as f:
-            pulse_content = f.read()
-    except FileNotFoundError:
-        return SyncResult(
-            success=False,
-            message=f"PULSE file not found: {pulse_file_path}",
-            errors=[f"File not found: {pulse_file_path}"]
-        )
-    except Exception as e:
-        return SyncResult(
-            success=False,
-            message=f"Failed to read PULSE file: {e}",
-            errors=[str(e)]
+    def transform(pulse_content: str, agent_state: Dict[str, Any]):
+        updated_content, changed = sync_pulse_sections(
+            pulse_content, agent_state, update_mental_model=update_mental_model
         )
+        changed_sections.extend(changed)
+        return updated_content, []
+    
+    outcome = sync_pulse_paths(
+        pulse_path=pulse_file_path,
+        state_path=state_file_path,
+        transform=transform,
+        output_path=output_path,
+        inputs_key=lambda agent_state: fingerprint_sync_inputs(agent_state, update_mental_model),
+        load_state=lambda path: load_state_file(path, detached=False)
+    )
     
-    # Sync
-    updated_content, was_updated = sync_pulse_from_state(
-        pulse_content, agent_state, update_mental_model=update_mental_model
+    return SyncResult(
+        success=outcome.success,
+        message=outcome.message,
+        pulse_updated=outcome.written,
+        errors=outcome.errors,
+        sections_updated=changed_sections if outcome.success else []
     )
+
+
+class _MtimePoller:
+    """Detects changes to one file by polling its (mtime, size, inode)"""
     
-    if not was_updated:
-        return SyncResult(
-            success=False,
-            message="Failed to parse PULSE document",
-            errors=["Could not parse PULSE document structure"]
-        )
+    def __init__(self, path: str, interval: float):
+        self.path = path
+        self.interval = interval
+        self._signature = self._stat()
     
-    # Write output
-    output_file = output_path or pulse_file_path
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
-    except Exception as e:
-        return SyncResult(
-            success=False,
-            message=f"Failed to write output file: {e}",
-            errors=[str(e)]
-        )
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    def wait(self, timeout: Optional[float]) -> bool:
+        """Block until the file changes (True) or timeout seconds pass (False)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            signature = self._stat()
+            if signature != self._signature:
+                self._signature = signature
+                return True
+            if deadline is None:
+                time.sleep(self.interval)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.interval, remaining))
     
-    return SyncResult(
-        success=True,
-        message=f"Successfully synchronized PULSE document to {output_file}",
-        pulse_updated=True
-    )
+    def close(self) -> None:
+        pass
+
+
+class _InotifyWatcher:
+    """
+    Detects changes to one file with Linux inotify (via ctypes, no extra deps).
+    
+    Watches the parent directory rather than the file, since atomic saves
+    (temp file + os.replace) swap the inode and would drop a file watch.
+    """
+    
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    EVENT_HEADER = struct.Struct("iIII")
+    
+    def __init__(self, path: str):
+        import ctypes
+        import ctypes.util
+        
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+        self._name = os.fsencode(os.path.basename(path))
+    
+    def wait(self, timeout: Optional[float]) -> bool:
+        """Block until the file changes (True) or timeout seconds pass (False)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                return False
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            
+            # Events for other files in the directory are ignored
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if name == self._name:
+                    return True
+    
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def open_file_watcher(path: str, poll_interval: float = 1.0, use_inotify: bool = True):
+    """
+    Open a change watcher for one file.
+    
+    Uses inotify on Linux, falling back to mtime polling elsewhere or if
+    inotify is unavailable. The watcher has wait(timeout) -> bool and close().
+    """
+    if use_inotify and sys.platform.startswith("linux"):
+        try:
+            return _InotifyWatcher(path)
+        except (OSError, AttributeError):
+            pass
+    return _MtimePoller(path, poll_interval)
+
+
+def watch_pulse(
+    state_file_path: str,
+    pulse_file_path: str,
+    output_path: Optional[str] = None,
+    update_mental_model: bool = False,
+    debounce: float = 0.5,
+    poll_interval: float = 1.0,
+    use_inotify: bool = True,
+    on_sync: Optional[Callable[[SyncResult], None]] = None,
+    max_syncs: Optional[int] = None
+) -> None:
+    """
+    Keep PROJECT_PULSE.md in sync with AGENT_STATE.json until interrupted.
+    
+    Syncs once at startup, then after each burst of state writes: once a
+    change is seen, further changes keep extending the wait until the file
+    has been quiet for `debounce` seconds.
+    
+    Args:
+        state_file_path: Path to AGENT_STATE.json
+        pulse_file_path: Path to PROJECT_PULSE.md
+        output_path: Output path (default: overwrite pulse_file_path)
+        update_mental_model: Whether to update mental model section
+        debounce: Quiet period in seconds before syncing after a change
+        poll_interval: Polling interval in seconds when inotify is unavailable
+        use_inotify: Set False to force mtime polling
+        on_sync: Callback receiving each SyncResult
+        max_syncs: Stop after this many syncs (default: run until interrupted)
+    """
+    watcher = open_file_watcher(state_file_path, poll_interval, use_inotify)
+    syncs = 0
+    
+    try:
+        while max_syncs is None or syncs < max_syncs:
+            if syncs > 0:
+                if not watcher.wait(None):
+                    continue
+                while watcher.wait(debounce):
+                    pass
+            result = sync_pulse_files(
+                state_file_path, pulse_file_path, output_path, update_mental_model
+            )
+            syncs += 1
+            if on_sync:
+                on_sync(result)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
 
 
 def sync_pulse(
@@ -761,20 +957,23 @@ def sync_pulse(
     
     Requirements: 6.1, 6.3, 6.4, 6.6
     """
+    # One pass over tasks shared by all builders
+    summary = summarize_state(agent_state)
+    
     # Update Mental Model if requested (Requirement 6.1)
     if update_mental_model:
-        new_mental_model = build_mental_model(agent_state, pulse_document.mental_model)
+        new_mental_model = build_mental_model(agent_state, pulse_document.mental_model, summary)
     else:
         new_mental_model = pulse_document.mental_model
     
     # Update Narrative Delta
-    new_narrative = build_narrative_delta(agent_state, pulse_document.narrative_delta)
+    new_narrative = build_narrative_delta(agent_state, pulse_document.narrative_delta, summary)
     
     # Update Risks & Debt
-    new_risks = build_risks_and_debt(agent_state, pulse_document.risks_and_debt)
+    new_risks = build_risks_and_debt(agent_state, pulse_document.risks_and_debt, summary)
     
     # Update Semantic Anchors
-    new_anchors = build_semantic_anchors(agent_state, pulse_document.semantic_anchors)
+    new_anchors = build_semantic_anchors(agent_state, pulse_document.semantic_anchors, summary)
     
     return PulseDocument(
         mental_model=new_mental_model,
@@ -813,32 +1012,92 @@ def main():
         action="store_true",
         help="Output result as JSON"
     )
-    
-    args = parser.parse_args()
-    
-    result = sync_pulse_files(
-        args.state_file,
-        args.pulse_file,
-        args.output,
-        update_mental_model=args.update_mental_model
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-sync whenever the state file changes"
     )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.5,
+        help="Seconds the state file must be quiet before a watch sync (default: 0.5)"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Polling interval in seconds when inotify is unavailable (default: 1.0)"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Use mtime polling instead of inotify in watch mode"
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help=f"Append timing spans to FILE as JSON lines (or set {TRACE_ENV_VAR})"
+    )
+    add_profiling_arguments(parser)
     
-    if args.json:
-        output = {
-            "success": result.success,
-            "message": result.message,
-            "pulse_updated": result.pulse_updated,
-            "errors": result.errors
-        }
-        print(json.dumps(output, indent=2))
-    else:
-        if result.success:
-            print(f"✅ {result.message}")
+    args = parser.parse_args()
+    if args.trace:
+        enable_tracing(args.trace)
+    
+    with profiling_from_args("sync_pulse", args):
+        if args.watch:
+            def report(result: SyncResult) -> None:
+                if args.json:
+                    print(json.dumps({
+                        "success": result.success,
+                        "message": result.message,
+                        "pulse_updated": result.pulse_updated,
+                        "sections_updated": result.sections_updated,
+                        "errors": result.errors
+                    }), flush=True)
+                elif result.success:
+                    print(f"✅ {result.message}", flush=True)
+                else:
+                    print(f"❌ {result.message}", flush=True)
+                    for error in result.errors:
+                        print(f"   - {error}", flush=True)
+            
+            watch_pulse(
+                args.state_file,
+                args.pulse_file,
+                args.output,
+                update_mental_model=args.update_mental_model,
+                debounce=args.debounce,
+                poll_interval=args.poll_interval,
+                use_inotify=not args.poll,
+                on_sync=report
+            )
+            return
+        
+        result = sync_pulse_files(
+            args.state_file,
+            args.pulse_file,
+            args.output,
+            update_mental_model=args.update_mental_model
+        )
+        
+        if args.json:
+            output = {
+                "success": result.success,
+                "message": result.message,
+                "pulse_updated": result.pulse_updated,
+                "errors": result.errors
+            }
+            print(json.dumps(output, indent=2))
         else:
-            print(f"❌ {result.message}")
-            for error in result.errors:
-                print(f"   - {error}")
-            sys.exit(1)
+            if result.success:
+                print(f"✅ {result.message}")
+            else:
+                print(f"❌ {result.message}")
+                for error in result.errors:
+                    print(f"   - {error}")
+                sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Task Index for Multi-Agent Orchestration
+
+Keeps a task_id -> task mapping alongside AGENT_STATE.json tasks so that
+helpers touching individual tasks do not rescan the whole task list.
+- Indexes the task dicts in place (mutations are visible in state["tasks"])
+- Provides typed accessors for single and status-filtered lookups
+- Provides bulk status transitions over a list of task IDs
+- Provides compact slotted task records and an integer-indexed task graph
+  for dependency sweeps over large states
+"""
+
+import sys
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class TaskIndex:
+    """
+    Task-id keyed view over state["tasks"].
+
+    The index holds references to the same task dicts stored in the state,
+    so field updates made through it are reflected in the state directly.
+    Call add() for new tasks, or rebuild() if the task list is replaced.
+    """
+
+    def __init__(self, state: Dict[str, Any]):
+        self.state = state
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._parent_of: Optional[Dict[str, str]] = None
+        self._graph: Optional["TaskGraph"] = None
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Rebuild the index from state["tasks"]"""
+        self._by_id = {}
+        self.invalidate_structure()
+        for task in self.state.get("tasks", []):
+            task_id = task.get("task_id")
+            # Keep the first occurrence, matching a linear scan
+            if task_id and task_id not in self._by_id:
+                self._by_id[task_id] = task
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.state.get("tasks", []))
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a task by ID, or None if not present"""
+        return self._by_id.get(task_id)
+
+    def get_status(self, task_id: str) -> Optional[str]:
+        """Get a task's status by ID, or None if not present"""
+        task = self._by_id.get(task_id)
+        return task.get("status") if task else None
+
+    def with_status(self, *statuses: str) -> List[Dict[str, Any]]:
+        """Get tasks whose status is one of the given statuses, in file order"""
+        wanted = set(statuses)
+        return [t for t in self.state.get("tasks", []) if t.get("status") in wanted]
+
+    def add(self, task: Dict[str, Any]) -> None:
+        """Append a task to state["tasks"] and index it"""
+        self.state.setdefault("tasks", []).append(task)
+        task_id = task.get("task_id")
+        if task_id and task_id not in self._by_id:
+            self._by_id[task_id] = task
+        self.invalidate_structure()
+
+    def invalidate_structure(self) -> None:
+        """
+        Drop cached parent and dependency structures.
+
+        Call after editing any task's subtasks or dependencies in place.
+        Status changes do not require invalidation.
+        """
+        self._parent_of = None
+        self._graph = None
+
+    def graph(self) -> "TaskGraph":
+        """
+        Get the TaskGraph for the indexed tasks, built once and cached.
+
+        The cached graph (and its dependent-closure cache) is reused until
+        invalidate_structure() is called. Use it for structure only: its
+        TaskRecord.status values are a snapshot, so read live statuses from
+        the task dicts.
+        """
+        if self._graph is None:
+            self._graph = TaskGraph(self.state.get("tasks", []))
+        return self._graph
+
+    def parent_of(self, task_id: str) -> Optional[str]:
+        """
+        Get the parent task ID (the task listing task_id in its subtasks).
+
+        The child -> parent map is built lazily from subtasks lists on first
+        use and reused until the index is rebuilt or a task is added.
+        """
+        if self._parent_of is None:
+            parent_of: Dict[str, str] = {}
+            for parent_id, task in self._by_id.items():
+                for child_id in task.get("subtasks") or []:
+                    parent_of.setdefault(child_id, parent_id)
+            self._parent_of = parent_of
+        return self._parent_of.get(task_id)
+
+    def ancestors(self, task_id: str) -> List[str]:
+        """Get ancestor task IDs of a task, nearest parent first"""
+        chain: List[str] = []
+        seen = {task_id}
+        parent_id = self.parent_of(task_id)
+        while parent_id is not None and parent_id not in seen:
+            chain.append(parent_id)
+            seen.add(parent_id)
+            parent_id = self.parent_of(parent_id)
+        return chain
+
+    def set_status(
+        self,
+        task_ids: Iterable[str],
+        new_status: str,
+        from_statuses: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """
+        Set status on each listed task.
+
+        Args:
+            task_ids: Task IDs to update (unknown IDs are ignored)
+            new_status: Status to assign
+            from_statuses: If given, only tasks currently in one of these
+                           statuses are updated
+
+        Returns:
+            List of task IDs that were updated
+        """
+        allowed = set(from_statuses) if from_statuses is not None else None
+        updated = []
+        for task_id in dict.fromkeys(task_ids):
+            task = self._by_id.get(task_id)
+            if task is None:
+                continue
+            if allowed is not None and task.get("status") not in allowed:
+                continue
+            task["status"] = new_status
+            updated.append(task_id)
+        return updated
+
+
+def find_task(
+    state: Dict[str, Any],
+    task_id: str,
+    task_index: Optional[TaskIndex] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Find a task by ID.
+
+    Uses task_index when provided, otherwise falls back to a linear scan so
+    one-off callers don't pay for building an index.
+    """
+    if task_index is not None:
+        return task_index.get(task_id)
+    return next((t for t in state.get("tasks", []) if t.get("task_id") == task_id), None)
+
+
+class TaskRecord:
+    """
+    Compact, slotted view of one task for graph and dispatch sweeps.
+
+    Dependencies and subtasks are stored as integer node indices into the
+    owning TaskGraph; status strings are interned so equal statuses share
+    one object. The source dict is kept in `task` for callers that need the
+    full entry.
+    """
+
+    __slots__ = (
+        "task_id", "index", "status", "is_optional", "parent",
+        "subtasks", "dependencies", "task",
+    )
+
+    def __init__(
+        self,
+        task_id: str,
+        index: int,
+        status: str,
+        is_optional: bool,
+        task: Dict[str, Any]
+    ):
+        self.task_id = task_id
+        self.index = index
+        self.status = sys.intern(status)
+        self.is_optional = is_optional
+        self.parent = -1
+        self.subtasks: Tuple[int, ...] = ()
+        self.dependencies: Tuple[int, ...] = ()
+        self.task = task
+
+    @property
+    def is_leaf(self) -> bool:
+        return not self.subtasks
+
+
+class TaskGraph:
+    """
+    Integer-indexed task graph built from state["tasks"].
+
+    Each unique task_id gets a node index in file order. Dependency or
+    subtask IDs that don't match a task get extra "phantom" node indices
+    after the real tasks, so unresolved references behave the same as in
+    spec_parser.expand_dependencies (kept as-is, never satisfied).
+    """
+
+    __slots__ = ("ids", "position", "records", "_leaf_cache", "_reverse", "_dependents")
+
+    def __init__(self, tasks: Iterable[Dict[str, Any]]):
+        self.ids: List[str] = []
+        self.position: Dict[str, int] = {}
+        self.records: List[TaskRecord] = []
+        self._leaf_cache: Dict[int, Tuple[int, ...]] = {}
+        self._reverse: Optional[List[List[int]]] = None
+        self._dependents: Dict[int, int] = {}
+
+        sources = []
+        for task in tasks:
+            task_id = task.get("task_id")
+            if not task_id or task_id in self.position:
+                continue
+            self.position[task_id] = len(self.ids)
+            self.ids.append(task_id)
+            self.records.append(TaskRecord(
+                task_id=task_id,
+                index=len(self.records),
+                status=task.get("status") or "not_started",
+                is_optional=bool(task.get("is_optional", False)),
+                task=task,
+            ))
+            sources.append(task)
+
+        for record, task in zip(self.records, sources):
+            record.subtasks = tuple(self.node(s) for s in task.get("subtasks") or [])
+            record.dependencies = tuple(self.node(d) for d in task.get("dependencies") or [])
+
+        for record in self.records:
+            for child in record.subtasks:
+                if self.is_task(child) and self.records[child].parent < 0:
+                    self.records[child].parent = record.index
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def node(self, task_id: str) -> int:
+        """Get the node index for a task ID, allocating a phantom node if unknown"""
+        index = self.position.get(task_id)
+        if index is None:
+            index = len(self.ids)
+            self.position[task_id] = index
+            self.ids.append(task_id)
+        return index
+
+    def is_task(self, index: int) -> bool:
+        """True if the node index refers to a real task (not a phantom)"""
+        return index < len(self.records)
+
+    def leaves(self, index: int) -> Tuple[int, ...]:
+        """Leaf nodes under a node (the node itself if it is a leaf or phantom)"""
+        if not self.is_task(index) or not self.records[index].subtasks:
+            return (index,)
+        cached = self._leaf_cache.get(index)
+        if cached is None:
+            expanded: List[int] = []
+            for child in self.records[index].subtasks:
+                expanded.extend(self.leaves(child))
+            cached = tuple(dict.fromkeys(expanded))
+            self._leaf_cache[index] = cached
+        return cached
+
+    def expanded_dependencies(self, index: int) -> Tuple[int, ...]:
+        """
+        Dependencies of a task with parent dependencies expanded to leaves.
+
+        Node-index equivalent of spec_parser.expand_dependencies.
+        """
+        expanded: List[int] = []
+        for dep in self.records[index].dependencies:
+            expanded.extend(self.leaves(dep))
+        return tuple(dict.fromkeys(expanded))
+
+    def reverse_dependencies(self) -> List[List[int]]:
+        """Per-node list of tasks whose expanded dependencies include that node"""
+        if self._reverse is None:
+            reverse: List[List[int]] = [[] for _ in self.ids]
+            for record in self.records:
+                for dep in self.expanded_dependencies(record.index):
+                    reverse[dep].append(record.index)
+            self._reverse = reverse
+        return self._reverse
+
+    def dependents_mask(self, index: int) -> int:
+        """
+        Transitive dependents of a node as a bitset (bit i = node i).
+
+        Results are cached per node. A BFS that reaches a node whose closure
+        is already cached ORs that closure in instead of re-walking it, so
+        repeated queries share work.
+        """
+        cached = self._dependents.get(index)
+        if cached is not None:
+            return cached
+
+        reverse = self.reverse_dependencies()
+        mask = 0
+        queue = deque(reverse[index])
+        while queue:
+            node = queue.popleft()
+            bit = 1 << node
+            if mask & bit:
+                continue
+            mask |= bit
+            known = self._dependents.get(node)
+            if known is not None:
+                mask |= known
+            else:
+                queue.extend(reverse[node])
+
+        self._dependents[index] = mask
+        return mask
+
+    def ids_from_mask(self, mask: int) -> List[str]:
+        """Decode a node bitset into task IDs (ascending node order)"""
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(self.ids[low.bit_length() - 1])
+            mask ^= low
+        return ids
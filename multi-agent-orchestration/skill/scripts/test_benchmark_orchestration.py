@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Tests for the Orchestration Benchmark Harness
+
+Checks that synthetic fixtures have the requested shape and are valid
+orchestration inputs, and that baseline comparison flags regressions.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from hypothesis import given, strategies as st, settings
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from spec_parser import parse_tasks, extract_dependencies
+from dispatch_batch import get_ready_tasks
+from benchmark_orchestration import (
+    BENCHMARKS,
+    BenchmarkResult,
+    FixtureConfig,
+    find_regressions,
+    generate_fixture,
+    generate_tasks_md,
+    load_baseline,
+    results_to_baseline,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+# =============================================================================
+# Fixture Generation
+# =============================================================================
+
+@given(
+    task_count=st.integers(min_value=1, max_value=300),
+    depth=st.integers(min_value=1, max_value=4),
+    fanout=st.integers(min_value=1, max_value=5),
+    dependency_density=st.floats(min_value=0.0, max_value=1.0),
+    seed=st.integers(min_value=0, max_value=1000),
+)
+@settings(max_examples=50, deadline=None)
+def test_generated_spec_has_requested_shape(task_count, depth, fanout, dependency_density, seed):
+    """Generated tasks.md parses to exactly task_count tasks with a valid DAG."""
+    config = FixtureConfig(
+        task_count=task_count,
+        depth=depth,
+        fanout=fanout,
+        dependency_density=dependency_density,
+        seed=seed,
+    )
+    result = parse_tasks(generate_tasks_md(config))
+    
+    assert result.success
+    assert len(result.tasks) == task_count
+    assert max(t.task_id.count(".") for t in result.tasks) < depth
+    
+    dependencies = extract_dependencies(result.tasks)
+    assert dependencies.valid
+    for task in result.tasks:
+        for dep in task.dependencies:
+            assert not task.task_id.startswith(dep + ".")
+
+
+def test_generated_state_is_in_flight():
+    """Fixture state has completed work, ready tasks and review history."""
+    fixture = generate_fixture(FixtureConfig(task_count=200, review_history=3, manifest_overlap=0.5))
+    tasks = fixture.state["tasks"]
+    
+    assert len(tasks) == 200
+    assert any(t["status"] == "completed" for t in tasks)
+    assert any(t["status"] == "in_progress" for t in tasks)
+    assert all(len(t["review_history"]) == 3 for t in tasks)
+    assert get_ready_tasks(fixture.state)
+    
+    writes = [w for t in tasks for w in t["writes"]]
+    assert len(set(writes)) < len(writes)
+    assert fixture.pulse.startswith("# PROJECT_PULSE.md")
+
+
+def test_fixture_generation_is_deterministic():
+    """The same config and seed produce the same spec."""
+    config = FixtureConfig(task_count=150, dependency_density=0.5, seed=7)
+    
+    assert generate_tasks_md(config) == generate_tasks_md(config)
+    assert generate_tasks_md(config) != generate_tasks_md(FixtureConfig(task_count=150, dependency_density=0.5, seed=8))
+
+
+# =============================================================================
+# Benchmark Runs and Baselines
+# =============================================================================
+
+def test_run_benchmarks_covers_every_case():
+    """Every benchmark case runs at small sizes and reports a timing."""
+    results = run_benchmarks([10, 50], repeat=1)
+    
+    assert {(r.name, r.task_count) for r in results} == {
+        (case.name, size) for case in BENCHMARKS for size in (10, 50)
+    }
+    assert all(r.seconds >= 0 for r in results)
+
+
+def test_run_benchmarks_skips_sizes_above_case_limit():
+    """Quadratic cases are skipped above their max_tasks."""
+    limited = next(case for case in BENCHMARKS if case.max_tasks is not None)
+    original = limited.max_tasks
+    limited.max_tasks = 20
+    try:
+        results = run_benchmarks([10, 30], repeat=1, names=[limited.name])
+    finally:
+        limited.max_tasks = original
+    
+    assert [r.task_count for r in results] == [10]
+
+
+def test_find_regressions_respects_tolerance_and_noise_floor():
+    """Only slowdowns beyond both the tolerance and min_delta are flagged."""
+    baseline = results_to_baseline([
+        BenchmarkResult("parse_tasks", 1000, 0.100, 3),
+        BenchmarkResult("parse_tasks", 10, 0.0001, 3),
+        BenchmarkResult("get_ready_tasks", 1000, 0.050, 3),
+    ])
+    current = [
+        BenchmarkResult("parse_tasks", 1000, 0.200, 3),      # 2x: regression
+        BenchmarkResult("parse_tasks", 10, 0.0010, 3),       # 10x but under noise floor
+        BenchmarkResult("get_ready_tasks", 1000, 0.060, 3),  # within tolerance
+        BenchmarkResult("topological_sort", 1000, 5.0, 3),   # no baseline entry
+    ]
+    
+    regressions = find_regressions(current, baseline, tolerance=1.5)
+    
+    assert [(r.name, r.task_count) for r in regressions] == [("parse_tasks", 1000)]
+    assert regressions[0].ratio == 2.0
+
+
+def test_save_baseline_merges_into_existing_file():
+    """Saving a partial run keeps baseline entries for other sizes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "baseline.json")
+        assert load_baseline(path) is None
+        
+        save_baseline(path, [BenchmarkResult("parse_tasks", 10, 0.001, 1)])
+        save_baseline(path, [BenchmarkResult("parse_tasks", 100, 0.01, 1)])
+        
+        assert load_baseline(path)["results"] == {"parse_tasks": {"10": 0.001, "100": 0.01}}
+
+
+if __name__ == "__main__":
+    print("Running benchmark harness tests...")
+    print("=" * 60)
+    
+    tests = [
+        ("Generated Spec Has Requested Shape", test_generated_spec_has_requested_shape),
+        ("Generated State Is In Flight", test_generated_state_is_in_flight),
+        ("Fixture Generation Is Deterministic", test_fixture_generation_is_deterministic),
+        ("run_benchmarks Covers Every Case", test_run_benchmarks_covers_every_case),
+        ("run_benchmarks Skips Sizes Above Case Limit", test_run_benchmarks_skips_sizes_above_case_limit),
+        ("find_regressions Respects Tolerance and Noise Floor", test_find_regressions_respects_tolerance_and_noise_floor),
+        ("save_baseline Merges Into Existing File", test_save_baseline_merges_into_existing_file),
+    ]
+    
+    failed = []
+    for name, test in tests:
+        try:
+            print(f"\n{name}")
+            test()
+            print("  ✅ PASSED")
+        except Exception as e:
+            print(f"  ❌ FAILED: {e}")
+            failed.append((name, str(e)))
+    
+    print("\n" + "=" * 60)
+    if failed:
+        print(f"❌ {len(failed)} test(s) failed:")
+        for name, error in failed:
+            print(f"   - {name}: {error}")
+        sys.exit(1)
+    else:
+        print(f"✅ All {len(tests)} tests passed!")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Tests for the Content-Addressed Blob Store
+
+Checks deduplicated, compressed storage of large state text, the summaries
+and refs left in AGENT_STATE.json, and restoring full text on demand.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from hypothesis import given, strategies as st, settings
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from blob_store import (
+    BLOB_MIN_BYTES,
+    SUMMARY_CHARS,
+    BlobStore,
+    blob_dir_for,
+    inline_blob_fields,
+    inline_all_blobs,
+)
+from dispatch_batch import ExecutionReport, load_fix_task_text, process_execution_report
+from fix_loop import format_review_history
+from state_store import load_state_file, write_state_file
+
+
+def _details(n):
+    return f"Finding {n}: " + "the handler swallows the error. " * 40
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+@given(text=st.text(max_size=3000))
+@settings(max_examples=50, deadline=None)
+def test_put_get_round_trip_and_dedup(text):
+    """Any text reads back unchanged; storing it twice writes one blob."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = BlobStore(tmpdir)
+        
+        digest = store.put(text)
+        
+        assert store.put(text) == digest
+        assert store.writes == 1
+        assert store.get(digest) == text
+
+
+def test_blobs_are_compressed():
+    """Repetitive agent output is stored much smaller than the text."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = BlobStore(tmpdir)
+        text = "PASS tests/test_module.py::test_case\n" * 500
+        
+        digest = store.put(text)
+        
+        assert os.path.getsize(store.path(digest)) < len(text) // 10
+
+
+# =============================================================================
+# State Integration
+# =============================================================================
+
+def test_save_keeps_summaries_and_refs():
+    """Large output and details leave the state; shared details share a blob."""
+    details = _details(1)
+    finding = {"task_id": "1", "reviewer": "codex", "severity": "major", "summary": "Bug", "details": details}
+    state = {
+        "tasks": [
+            {"task_id": "1", "status": "fix_required", "output": "log line\n" * 200, "error": "short",
+             "review_history": [{"attempt": 0, "severity": "major", "findings": [dict(finding)]}]},
+        ],
+        "review_findings": [dict(finding)],
+    }
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        write_state_file(state_file, state)
+        
+        with open(state_file) as f:
+            on_disk = json.load(f)
+        task = on_disk["tasks"][0]
+        store = BlobStore(blob_dir_for(state_file))
+        
+        assert len(task["output"]) <= SUMMARY_CHARS + 2
+        assert store.get(task["output_ref"]) == "log line\n" * 200
+        assert task["error"] == "short" and "error_ref" not in task
+        assert task["review_history"][0]["findings"][0]["details_ref"] == on_disk["review_findings"][0]["details_ref"]
+        assert sum(len(files) for _, _, files in os.walk(store.root)) == 2
+        
+        loaded = load_state_file(state_file)
+        assert inline_all_blobs(loaded, store) == 3
+        assert loaded["review_findings"][0]["details"] == details
+        assert "details_ref" not in loaded["review_findings"][0]
+
+
+def test_new_result_replaces_stored_output():
+    """A new execution result drops the old ref instead of keeping its summary."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        write_state_file(state_file, {"tasks": [{"task_id": "1", "status": "in_progress", "output": "x" * BLOB_MIN_BYTES}]})
+        state = load_state_file(state_file)
+        
+        report = ExecutionReport(success=True, tasks_completed=1, tasks_failed=0,
+                                 task_results=[{"task_id": "1", "status": "completed", "exit_code": 0, "output": "fixed"}])
+        process_execution_report(state, report)
+        write_state_file(state_file, state)
+        
+        task = load_state_file(state_file)["tasks"][0]
+        assert task["output"] == "fixed"
+        assert "output_ref" not in task
+
+
+def test_fix_tasks_get_full_output_and_every_round():
+    """Fix prompts and fallbacks quote full output and all kept rounds' details."""
+    output = "FAIL tests/test_api.py::test_create\n" * 100
+    state = {
+        "tasks": [
+            {"task_id": "1", "status": "fix_required", "output": output,
+             "review_history": [
+                 {"attempt": n, "severity": "major",
+                  "findings": [{"severity": "major", "summary": f"Bug {n}", "details": _details(n)}]}
+                 for n in range(3)
+             ]},
+            {"task_id": "2", "status": "completed", "output": output},
+        ],
+    }
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        write_state_file(state_file, state)
+        loaded = load_state_file(state_file, detached=False)
+        
+        fix_tasks = load_fix_task_text(state_file, loaded)
+    
+    assert [t["task_id"] for t in fix_tasks] == ["1"]
+    task = fix_tasks[0]
+    assert task["output"] == output and "output_ref" not in task
+    history_text = format_review_history(task["review_history"])
+    assert all(_details(n) in history_text for n in range(3))
+    assert loaded["tasks"][1]["output"] != output
+
+
+def test_inline_skips_missing_blobs_and_strings():
+    """Unknown digests and legacy string findings are left alone."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        items = [{"details": "summary", "details_ref": "0" * 64}, "legacy finding"]
+        
+        assert inline_blob_fields(BlobStore(tmpdir), items, ("details",)) == 0
+        assert items[0]["details"] == "summary"
+
+
+if __name__ == "__main__":
+    print("Running blob store tests...")
+    print("=" * 60)
+    
+    tests = [
+        ("Put/Get Round Trip and Dedup", test_put_get_round_trip_and_dedup),
+        ("Blobs Are Compressed", test_blobs_are_compressed),
+        ("Save Keeps Summaries and Refs", test_save_keeps_summaries_and_refs),
+        ("New Result Replaces Stored Output", test_new_result_replaces_stored_output),
+        ("Fix Tasks Get Full Output and Every Round", test_fix_tasks_get_full_output_and_every_round),
+        ("Inline Skips Missing Blobs and Strings", test_inline_skips_missing_blobs_and_strings),
+    ]
+    
+    failed = []
+    for name, test in tests:
+        try:
+            print(f"\n{name}")
+            test()
+            print("  ✅ PASSED")
+        except Exception as e:
+            print(f"  ❌ FAILED: {e}")
+            failed.append((name, str(e)))
+    
+    print("\n" + "=" * 60)
+    if failed:
+        print(f"❌ {len(failed)} test(s) failed:")
+        for name, error in failed:
+            print(f"   - {name}: {error}")
+        sys.exit(1)
+    else:
+        print(f"✅ All {len(tests)} tests passed!")
@@ -32,7 +32,7 @@ from consolidate_reviews import (
     FinalReport,
     SEVERITY_ORDER,
 )
-from dispatch_reviews import REVIEW_COUNT_BY_CRITICALITY
+from dispatch_reviews import REVIEW_COUNT_BY_CRITICALITY, index_review_findings
 
 
 # =============================================================================
@@ -502,6 +502,26 @@ def test_summary_generation():
     assert "major" in summary.lower()
 
 
+def test_indexed_findings_match_linear_scan():
+    """Test that indexed lookup returns the same findings as a full scan."""
+    state = {
+        "review_findings": [
+            {"task_id": "1", "severity": "minor", "reviewer": "a"},
+            {"task_id": "2", "severity": "major", "reviewer": "b"},
+            {"task_id": "1", "severity": "critical", "reviewer": "c"},
+        ]
+    }
+    index = index_review_findings(state)
+    
+    for task_id in ["1", "2", "3"]:
+        assert get_review_findings_for_task(state, task_id, index) == \
+            get_review_findings_for_task(state, task_id)
+    
+    report = consolidate_findings(state, "1", index)
+    assert report.overall_severity == "critical"
+    assert report.finding_count == 2
+
+
 if __name__ == "__main__":
     print("Running property tests for review consolidation...")
     print("=" * 60)
@@ -517,6 +537,7 @@ if __name__ == "__main__":
         ("Integration: consolidate_reviews File", test_consolidate_reviews_file_integration),
         ("No Tasks to Consolidate", test_consolidate_no_tasks),
         ("Summary Generation", test_summary_generation),
+        ("Indexed Findings Match Linear Scan", test_indexed_findings_match_linear_scan),
     ]
     
     failed = []
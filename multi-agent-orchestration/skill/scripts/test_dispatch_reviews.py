@@ -22,6 +22,9 @@ from dispatch_reviews import (
     get_review_count,
     build_review_configs,
     get_tasks_pending_review,
+    index_review_findings,
+    check_all_reviews_complete,
+    update_completed_reviews_to_final,
     REVIEW_COUNT_BY_CRITICALITY,
     ReviewTaskConfig,
 )
@@ -288,6 +291,58 @@ def test_get_tasks_pending_review_filters_correctly():
     assert {t["task_id"] for t in pending} == {"3", "5"}
 
 
+def test_index_review_findings_groups_by_task():
+    """Test that findings are grouped by task_id preserving order."""
+    state = {
+        "review_findings": [
+            {"task_id": "1", "reviewer": "review-1-1"},
+            {"task_id": "2", "reviewer": "review-2-1"},
+            {"task_id": "1", "reviewer": "review-1-2"},
+        ]
+    }
+    
+    index = index_review_findings(state)
+    
+    assert [f["reviewer"] for f in index["1"]] == ["review-1-1", "review-1-2"]
+    assert [f["reviewer"] for f in index["2"]] == ["review-2-1"]
+    assert "3" not in index
+
+
+def test_update_completed_reviews_to_final_uses_review_counts():
+    """Test only tasks with enough findings move to final_review."""
+    state = {
+        "tasks": [
+            {"task_id": "1", "status": "under_review", "criticality": "standard"},
+            {"task_id": "2", "status": "under_review", "criticality": "complex"},
+            {"task_id": "3", "status": "under_review", "criticality": "complex"},
+            {"task_id": "4", "status": "pending_review", "criticality": "standard"},
+        ],
+        "review_findings": [
+            {"task_id": "1", "severity": "none"},
+            {"task_id": "2", "severity": "minor"},
+            {"task_id": "3", "severity": "none"},
+            {"task_id": "3", "severity": "minor"},
+            {"task_id": "4", "severity": "none"},
+        ],
+    }
+    
+    index = index_review_findings(state)
+    assert check_all_reviews_complete(state, "3", index)
+    assert not check_all_reviews_complete(state, "2", index)
+    assert check_all_reviews_complete(state, "2") == check_all_reviews_complete(state, "2", index)
+    
+    updated = update_completed_reviews_to_final(state)
+    
+    assert set(updated) == {"1", "3"}
+    statuses = {t["task_id"]: t["status"] for t in state["tasks"]}
+    assert statuses == {
+        "1": "final_review",
+        "2": "under_review",
+        "3": "final_review",
+        "4": "pending_review",
+    }
+
+
 if __name__ == "__main__":
     print("Running property tests for review dispatch...")
     print("=" * 60)
@@ -303,6 +358,8 @@ if __name__ == "__main__":
         ("Complex Criticality Multiple Reviews", test_complex_criticality_multiple_reviews),
         ("Security-Sensitive Multiple Reviews", test_security_sensitive_criticality_multiple_reviews),
         ("Get Tasks Pending Review Filters", test_get_tasks_pending_review_filters_correctly),
+        ("Index Review Findings Groups by Task", test_index_review_findings_groups_by_task),
+        ("Update Completed Reviews to Final", test_update_completed_reviews_to_final_uses_review_counts),
     ]
     
     failed = []
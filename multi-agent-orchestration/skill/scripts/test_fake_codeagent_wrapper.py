@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Tests for the Fake codeagent-wrapper and End-to-End Benchmark
+
+Checks that the fake wrapper understands the heredoc the dispatch scripts
+produce, returns reports they can parse, and that a full orchestration
+cycle runs against it through PATH.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from hypothesis import given, strategies as st, settings
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from dispatch_batch import TaskConfig, build_heredoc_input
+from dispatch_reviews import ReviewTaskConfig, build_heredoc_input as build_review_heredoc_input
+from benchmark_orchestration import FixtureConfig
+from benchmark_e2e import run_e2e_benchmark
+from fake_codeagent_wrapper import (
+    SimulationConfig,
+    config_from_env,
+    config_to_env,
+    install_fake_wrapper,
+    parse_heredoc_tasks,
+    run_wrapper,
+    schedule_makespan,
+)
+
+
+# =============================================================================
+# Heredoc Parsing and Reports
+# =============================================================================
+
+task_id_strategy = st.from_regex(r"[1-9][0-9]?(\.[1-9][0-9]?){0,2}", fullmatch=True)
+content_strategy = st.text(
+    alphabet=st.characters(blacklist_categories=("Cs",), blacklist_characters="\r\x0b\x0c\x1c\x1d\x1e\x85  "),
+    max_size=200,
+).filter(lambda s: "---TASK---" not in s and "---CONTENT---" not in s)
+
+
+@given(
+    tasks=st.lists(
+        st.tuples(task_id_strategy, content_strategy, st.lists(task_id_strategy, max_size=3)),
+        min_size=1,
+        max_size=5,
+    )
+)
+@settings(max_examples=50, deadline=None)
+def test_heredoc_round_trip(tasks):
+    """Every TaskConfig written by dispatch_batch is read back unchanged."""
+    configs = [
+        TaskConfig(task_id=tid, backend="codex", workdir="/w", content=content, dependencies=deps)
+        for tid, content, deps in tasks
+    ]
+    parsed = parse_heredoc_tasks(build_heredoc_input(configs))
+    
+    assert [(t.task_id, t.backend, t.workdir, t.dependencies, t.content) for t in parsed] == [
+        (c.task_id, c.backend, c.workdir, c.dependencies, c.content) for c in configs
+    ]
+
+
+def test_review_report_targets_reviewed_task():
+    """Review results carry the review id and the reviewed task id."""
+    configs = [
+        ReviewTaskConfig(review_id="review-1.1-1", task_id="1.1", content="Review 1.1"),
+        ReviewTaskConfig(review_id="review-1.2-1", task_id="1.2", content="Review 1.2"),
+    ]
+    config = SimulationConfig(severity_weights={"major": 1.0}, sleep=False)
+    
+    report, exit_code = run_wrapper(build_review_heredoc_input(configs), config, review=True)
+    
+    assert exit_code == 0
+    assert [(r["review_id"], r["task_id"], r["severity"]) for r in report["review_results"]] == [
+        ("review-1.1-1", "1.1", "major"),
+        ("review-1.2-1", "1.2", "major"),
+    ]
+
+
+def test_execution_report_is_deterministic():
+    """Same seed gives the same report; failures set the exit code."""
+    heredoc = build_heredoc_input([
+        TaskConfig(task_id=str(i), backend="codex", workdir=".", content=f"Task {i}\n_writes: src/m{i}.py")
+        for i in range(1, 21)
+    ])
+    config = SimulationConfig(latency=1.0, latency_dist="exponential", failure_rate=0.3, seed=3, sleep=False)
+    
+    report, exit_code = run_wrapper(heredoc, config)
+    again, _ = run_wrapper(heredoc, config)
+    
+    assert report == again
+    assert 0 < report["tasks_failed"] < 20
+    assert exit_code == 1
+    assert report["tasks_completed"] + report["tasks_failed"] == len(report["task_results"]) == 20
+    completed = next(r for r in report["task_results"] if r["exit_code"] == 0)
+    assert completed["files_changed"] == [f"src/m{completed['task_id']}.py"]
+
+
+@given(
+    latencies=st.lists(st.floats(min_value=0, max_value=100), max_size=30),
+    workers=st.integers(min_value=0, max_value=8),
+)
+@settings(max_examples=100)
+def test_schedule_makespan_bounds(latencies, workers):
+    """Makespan lies between the longest task and the serial total."""
+    makespan = schedule_makespan(latencies, workers)
+    
+    longest = max(latencies, default=0.0)
+    assert longest - 1e-9 <= makespan <= sum(latencies) + 1e-6
+    if workers == 0 or workers >= len(latencies):
+        assert makespan == longest
+
+
+def test_config_env_round_trip():
+    """Settings survive being passed to the wrapper through the environment."""
+    config = SimulationConfig(
+        latency=0.25, latency_dist="lognormal", workers=4, failure_rate=0.1,
+        severity_weights={"none": 0.5, "critical": 0.5}, seed=9, log_file="/tmp/x.jsonl",
+    )
+    
+    assert config_from_env(config_to_env(config)) == config
+
+
+# =============================================================================
+# Installed Wrapper and End-to-End Cycle
+# =============================================================================
+
+def test_installed_shim_runs_wrapper():
+    """The PATH shim answers like codeagent-wrapper --parallel."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        shim = install_fake_wrapper(os.path.join(tmpdir, "bin"))
+        heredoc = build_heredoc_input([TaskConfig(task_id="1", backend="codex", workdir=".", content="Do it")])
+        
+        result = subprocess.run(
+            [shim, "--parallel", "--tmux-session", "s", "--state-file", os.path.join(tmpdir, "state.json")],
+            input=heredoc,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "FAKE_CODEAGENT_SEED": "1"},
+            timeout=30,
+        )
+        
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout)["task_results"][0]["task_id"] == "1"
+
+
+def test_e2e_cycle_completes_tasks_and_runs_fix_loop():
+    """init -> dispatch -> review -> consolidate runs to a fixed point."""
+    fixture = FixtureConfig(task_count=12, depth=2, dependency_density=0.3, seed=1)
+    simulation = SimulationConfig(severity_weights={"none": 0.6, "major": 0.4}, seed=1)
+    
+    result = run_e2e_benchmark(fixture, simulation, max_cycles=20)
+    
+    assert result.task_count == 12
+    assert result.completed > 0
+    assert result.fix_attempts > 0
+    assert result.wrapper_invocations >= 2
+    assert result.cycles < 20
+    assert result.makespan >= result.wrapper_seconds
+
+
+if __name__ == "__main__":
+    print("Running fake codeagent-wrapper tests...")
+    print("=" * 60)
+    
+    tests = [
+        ("Heredoc Round Trip", test_heredoc_round_trip),
+        ("Review Report Targets Reviewed Task", test_review_report_targets_reviewed_task),
+        ("Execution Report Is Deterministic", test_execution_report_is_deterministic),
+        ("schedule_makespan Bounds", test_schedule_makespan_bounds),
+        ("Config Env Round Trip", test_config_env_round_trip),
+        ("Installed Shim Runs Wrapper", test_installed_shim_runs_wrapper),
+        ("E2E Cycle Completes Tasks and Runs Fix Loop", test_e2e_cycle_completes_tasks_and_runs_fix_loop),
+    ]
+    
+    failed = []
+    for name, test in tests:
+        try:
+            print(f"\n{name}")
+            test()
+            print("  ✅ PASSED")
+        except Exception as e:
+            print(f"  ❌ FAILED: {e}")
+            failed.append((name, str(e)))
+    
+    print("\n" + "=" * 60)
+    if failed:
+        print(f"❌ {len(failed)} test(s) failed:")
+        for name, error in failed:
+            print(f"   - {name}: {error}")
+        sys.exit(1)
+    else:
+        print(f"✅ All {len(tests)} tests passed!")
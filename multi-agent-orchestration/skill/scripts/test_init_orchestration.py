@@ -903,3 +903,199 @@ def test_property_2_parent_status_aggregation_rules(state):
         else:
             assert task["status"] == "not_started", \
                 f"Parent {task['task_id']} with all not_started subtasks should be not_started"
+
+
+# ============================================================================
+# Incremental Parent Status Propagation
+# Validates: Requirements 1.3, 1.4, 1.5
+# ============================================================================
+
+from init_orchestration import propagate_parent_statuses
+
+
+def _nested_state_parents_first():
+    """Three-level hierarchy listed parents before children (1 -> 1.1 -> 1.1.x)."""
+    return {
+        "tasks": [
+            {"task_id": "1", "status": "not_started", "subtasks": ["1.1", "1.2"]},
+            {"task_id": "1.1", "status": "not_started", "subtasks": ["1.1.1", "1.1.2"]},
+            {"task_id": "1.1.1", "status": "completed", "subtasks": []},
+            {"task_id": "1.1.2", "status": "completed", "subtasks": []},
+            {"task_id": "1.2", "status": "completed", "subtasks": []},
+            {"task_id": "2", "status": "not_started", "subtasks": ["2.1"]},
+            {"task_id": "2.1", "status": "not_started", "subtasks": []},
+        ]
+    }
+
+
+def test_update_parent_statuses_independent_of_file_order():
+    """Nested parents resolve in one sweep whatever order tasks appear in."""
+    forward = _nested_state_parents_first()
+    backward = {"tasks": list(reversed(_nested_state_parents_first()["tasks"]))}
+    
+    update_parent_statuses(forward)
+    update_parent_statuses(backward)
+    
+    for state in (forward, backward):
+        statuses = {t["task_id"]: t["status"] for t in state["tasks"]}
+        assert statuses["1.1"] == "completed"
+        assert statuses["1"] == "completed"
+        assert statuses["2"] == "not_started"
+
+
+def test_propagate_parent_statuses_updates_only_ancestor_chain():
+    """Propagation recomputes the changed leaf's ancestors and nothing else."""
+    state = _nested_state_parents_first()
+    update_parent_statuses(state)
+    tasks = {t["task_id"]: t for t in state["tasks"]}
+    
+    # Leaf change under 1.1; unrelated parent 2 is left deliberately stale
+    tasks["1.1.2"]["status"] = "blocked"
+    tasks["2"]["status"] = "stale"
+    
+    updated = propagate_parent_statuses(state, ["1.1.2"])
+    
+    assert updated == ["1.1", "1"]
+    assert tasks["1.1"]["status"] == "blocked"
+    assert tasks["1"]["status"] == "blocked"
+    assert tasks["2"]["status"] == "stale"
+
+
+@given(state=parent_with_subtasks_state_strategy(), data=st.data())
+@settings(max_examples=100, deadline=None)
+def test_propagate_matches_full_sweep(state, data):
+    """Propagating a leaf change yields the same statuses as a full sweep."""
+    update_parent_statuses(state)
+    leaves = [t for t in state["tasks"] if not t.get("subtasks")]
+    leaf = data.draw(st.sampled_from(leaves))
+    leaf["status"] = data.draw(st.sampled_from([
+        "not_started", "in_progress", "fix_required", "completed", "blocked"
+    ]))
+    
+    expected = json.loads(json.dumps(state))
+    update_parent_statuses(expected)
+    propagate_parent_statuses(state, [leaf["task_id"]])
+    
+    assert state == expected
+
+
+# ============================================================================
+# Tests for Reconciling Spec Edits into Existing State
+# Feature: orchestration-fixes
+# Validates: Requirements 1.3, 1.4, 1.5, 11.4
+# ============================================================================
+
+
+def _write_tasks_spec(spec_path: Path, tasks_md: str) -> None:
+    """Write a minimal spec directory with the given tasks.md"""
+    spec_path.mkdir(exist_ok=True)
+    (spec_path / "requirements.md").write_text("# Requirements\n\nTest requirements.")
+    (spec_path / "design.md").write_text("# Design\n\n## Overview\n\nTest design.")
+    (spec_path / "tasks.md").write_text(tasks_md)
+
+
+def test_reconcile_merges_spec_edits_and_preserves_progress():
+    """--reconcile adds, updates and removes tasks without losing progress."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        spec_path = Path(tmpdir) / "spec"
+        _write_tasks_spec(spec_path, """# Tasks
+
+- [ ] 1 Parent
+- [ ] 1.1 First subtask
+- [ ] 1.2 Second subtask
+- [ ] 2 Standalone task
+- [ ] 3 Task to drop
+""")
+        result = initialize_orchestration(str(spec_path), session_name="orch-live")
+        assert result.success
+        
+        with open(result.state_file) as f:
+            state = json.load(f)
+        tasks = {t["task_id"]: t for t in state["tasks"]}
+        tasks["1.1"]["status"] = "completed"
+        tasks["1.2"]["status"] = "completed"
+        tasks["1"]["status"] = "completed"
+        tasks["2"]["status"] = "under_review"
+        tasks["2"]["review_history"] = [{"severity": "minor"}]
+        tasks["2"]["output"] = "worker output"
+        with open(result.state_file, "w") as f:
+            json.dump(state, f)
+        
+        pulse_before = Path(result.pulse_file).read_text()
+        
+        _write_tasks_spec(spec_path, """# Tasks
+
+- [ ] 1 Parent
+- [ ] 1.1 First subtask
+- [ ] 1.2 Second subtask
+- [ ] 1.3 New subtask
+- [ ] 2 Standalone task, reworded
+  - dependencies: 1
+""")
+        result = initialize_orchestration(str(spec_path), reconcile=True)
+        
+        assert result.success, result.errors
+        assert result.reconcile.added == ["1.3"]
+        assert result.reconcile.updated == ["1", "2"]
+        assert result.reconcile.removed == ["3"]
+        assert result.reconcile.parents_updated == ["1"]
+        assert Path(result.pulse_file).read_text() == pulse_before
+        
+        with open(result.state_file) as f:
+            state = json.load(f)
+        assert state["session_name"] == "orch-live"
+        assert [t["task_id"] for t in state["tasks"]] == ["1", "1.1", "1.2", "1.3", "2", "3"]
+        tasks = {t["task_id"]: t for t in state["tasks"]}
+        
+        # Parent re-derived from the new, unfinished subtask
+        assert tasks["1"]["subtasks"] == ["1.1", "1.2", "1.3"]
+        assert tasks["1"]["status"] == "not_started"
+        assert tasks["1.1"]["status"] == "completed"
+        
+        # Spec fields refreshed, progress preserved
+        assert tasks["2"]["description"] == "Standalone task, reworded"
+        assert tasks["2"]["dependencies"] == ["1"]
+        assert tasks["2"]["status"] == "under_review"
+        assert tasks["2"]["review_history"] == [{"severity": "minor"}]
+        assert tasks["2"]["output"] == "worker output"
+        
+        # Removed task is kept but cannot be dispatched
+        assert tasks["3"]["status"] == "blocked"
+        assert tasks["3"]["removed_at"]
+        
+        # Reconciling an unchanged spec is a no-op
+        again = initialize_orchestration(str(spec_path), reconcile=True)
+        assert again.success
+        assert not again.reconcile.changed
+
+
+def test_reconcile_restores_task_readded_to_spec():
+    """A removed task that reappears in tasks.md becomes dispatchable again."""
+    from init_orchestration import reconcile_state, REMOVED_FROM_SPEC_REASON
+    
+    entries = [convert_task_to_entry(Task(task_id="1", description="Task one"))]
+    state = {"tasks": [e.to_dict() for e in entries]}
+    
+    removed = reconcile_state(state, [])
+    assert removed.removed == ["1"]
+    assert state["tasks"][0]["blocked_reason"] == REMOVED_FROM_SPEC_REASON
+    
+    restored = reconcile_state(state, entries)
+    assert restored.restored == ["1"]
+    assert state["tasks"][0]["status"] == "not_started"
+    assert state["tasks"][0]["blocked_reason"] is None
+    assert "removed_at" not in state["tasks"][0]
+
+
+def test_reconcile_without_existing_state_initializes():
+    """--reconcile falls back to a fresh initialization when no state exists."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        spec_path = Path(tmpdir) / "spec"
+        _write_tasks_spec(spec_path, "- [ ] 1 Only task\n")
+        
+        result = initialize_orchestration(str(spec_path), reconcile=True)
+        
+        assert result.success
+        assert result.reconcile is None
+        with open(result.state_file) as f:
+            assert [t["task_id"] for t in json.load(f)["tasks"]] == ["1"]
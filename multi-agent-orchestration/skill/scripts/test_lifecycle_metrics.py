@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Tests for Per-Task Lifecycle Metrics
+
+Checks the timings recorded during dispatch, the aggregation over state
+files and the OpenMetrics text output.
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+from hypothesis import given, strategies as st, settings
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_orchestration import FixtureConfig
+from benchmark_e2e import run_e2e_benchmark
+from fake_codeagent_wrapper import SimulationConfig
+from lifecycle_metrics import (
+    FIX_ATTEMPT_BUCKETS,
+    Histogram,
+    collect_metrics,
+    export_metrics_for_state_file,
+    record_execution_timings,
+    record_review_timings,
+    render_openmetrics,
+)
+
+
+def _task(task_id, **fields):
+    task = {
+        "task_id": task_id,
+        "owner_agent": "kiro-cli",
+        "status": "completed",
+        "dependencies": [],
+        "subtasks": [],
+        "created_at": "2026-01-01T00:00:00Z",
+    }
+    task.update(fields)
+    return task
+
+
+# =============================================================================
+# Recording and Collection
+# =============================================================================
+
+def test_record_timings_accumulate_across_rounds():
+    """Execution and review time add up over fix rounds; first dispatch is kept."""
+    state = {"tasks": [_task("1"), _task("2")]}
+    
+    record_execution_timings(state, [{"task_id": "1", "duration_ms": 1500}, {"task_id": "2"}],
+                             "2026-01-01T00:01:00Z", elapsed=4.0)
+    record_execution_timings(state, [{"task_id": "1", "duration_ms": 500}],
+                             "2026-01-01T00:05:00Z", elapsed=9.0)
+    record_review_timings(state, ["1", "1", "missing"], elapsed=2.5)
+    
+    first, second = state["tasks"]
+    assert first["dispatched_at"] == "2026-01-01T00:01:00Z"
+    assert first["execution_seconds"] == 2.0
+    assert second["execution_seconds"] == 4.0
+    assert first["review_seconds"] == 2.5
+    assert "review_seconds" not in second
+
+
+def test_collect_metrics_by_backend_and_status():
+    """Queue wait starts when dependencies complete; escalations and fallbacks are counted."""
+    state = {
+        "session_name": "run-1",
+        "tasks": [
+            _task("1", subtasks=["1.1", "1.2"]),
+            _task("1.1", completed_at="2026-01-01T00:10:00Z", dispatched_at="2026-01-01T00:00:20Z"),
+            _task("1.2", dependencies=["1.1"], dispatched_at="2026-01-01T00:10:45+00:00",
+                  status="blocked", blocked_reason="human_intervention_required", fix_attempts=3,
+                  escalated=True, original_agent="gemini", owner_agent="gemini"),
+        ],
+        "pending_decisions": [{"id": "human-fallback-1.2", "task_id": "1.2"}],
+    }
+    
+    metrics = collect_metrics([state, state])
+    
+    assert metrics.tasks == {
+        ("run-1", "kiro-cli", "completed"): 2,
+        ("run-1", "gemini", "blocked"): 2,
+    }
+    assert metrics.queue_wait[("run-1", "kiro-cli")].total == 40.0
+    assert metrics.queue_wait[("run-1", "gemini")].total == 90.0
+    assert metrics.escalations == {("run-1", "gemini"): 2}
+    assert metrics.human_fallbacks == {("run-1", "gemini"): 2}
+    assert metrics.fix_attempts[("run-1", "gemini")].total == 6
+
+
+def test_queue_wait_expands_parent_dependencies():
+    """A dependency on a parent waits for its last leaf, not the parent's created_at."""
+    state = {
+        "session_name": "run-1",
+        "tasks": [
+            _task("1", subtasks=["1.1", "1.2"]),
+            _task("1.1", completed_at="2026-01-01T00:05:00Z"),
+            _task("1.2", completed_at="2026-01-01T00:20:00Z"),
+            _task("2", dependencies=["1"], dispatched_at="2026-01-01T00:21:00Z", owner_agent="gemini"),
+        ],
+    }
+    
+    metrics = collect_metrics([state])
+    
+    assert metrics.queue_wait[("run-1", "gemini")].total == 60.0
+
+
+@given(values=st.lists(st.integers(min_value=0, max_value=10), max_size=50))
+@settings(max_examples=50)
+def test_histogram_buckets_are_cumulative(values):
+    """Bucket counts never decrease and never exceed the total count."""
+    histogram = Histogram(FIX_ATTEMPT_BUCKETS)
+    for value in values:
+        histogram.observe(value)
+    
+    assert histogram.counts == sorted(histogram.counts)
+    assert all(c <= histogram.count for c in histogram.counts)
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        assert count == sum(1 for v in values if v <= bound)
+
+
+# =============================================================================
+# OpenMetrics Output
+# =============================================================================
+
+SAMPLE_LINE = re.compile(r'^[a-z_]+(\{[a-z_]+="[^"]*"(,[a-z_]+="[^"]*")*\})? [0-9.e+-]+$')
+
+
+def test_e2e_run_exports_valid_openmetrics():
+    """A full cycle records timings that render as well-formed OpenMetrics."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_e2e_benchmark(
+            FixtureConfig(task_count=8, depth=1, dependency_density=0.3, seed=2),
+            SimulationConfig(severity_weights={"none": 1.0}, seed=2),
+            max_cycles=20,
+            work_dir=tmpdir,
+        )
+        state_file = os.path.join(tmpdir, "out", "AGENT_STATE.json")
+        metrics_file = os.path.join(tmpdir, "textfile", "orchestration.prom")
+        
+        assert export_metrics_for_state_file(state_file, metrics_file) == metrics_file
+        with open(state_file) as f:
+            tasks = json.load(f)["tasks"]
+        with open(metrics_file) as f:
+            text = f.read()
+    
+    assert all("dispatched_at" in t and "execution_seconds" in t and "review_seconds" in t for t in tasks)
+    
+    lines = text.splitlines()
+    assert lines[-1] == "# EOF"
+    samples = [line for line in lines if not line.startswith("#")]
+    assert samples and all(SAMPLE_LINE.match(line) for line in samples)
+    assert f'orchestration_task_execution_seconds_count{{session="orch-spec",backend="kiro-cli"}} {len(tasks)}' in lines
+    assert "# TYPE orchestration_task_review_seconds histogram" in lines
+
+
+def test_export_is_best_effort():
+    """No configured file means no export; unreadable state only warns."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ.pop("ORCHESTRATION_METRICS_FILE", None)
+        assert export_metrics_for_state_file(os.path.join(tmpdir, "missing.json")) is None
+        assert export_metrics_for_state_file(
+            os.path.join(tmpdir, "missing.json"), os.path.join(tmpdir, "m.prom")
+        ) is None
+        assert not os.path.exists(os.path.join(tmpdir, "m.prom"))
+
+
+def test_render_escapes_label_values():
+    """Session names with quotes or backslashes stay valid label values."""
+    state = {"session_name": 'a "b" \\c', "tasks": [_task("1")]}
+    
+    text = render_openmetrics(collect_metrics([state]))
+    
+    assert 'orchestration_tasks{session="a \\"b\\" \\\\c",backend="kiro-cli",status="completed"} 1' in text
+
+
+if __name__ == "__main__":
+    print("Running lifecycle metrics tests...")
+    print("=" * 60)
+    
+    tests = [
+        ("Record Timings Accumulate Across Rounds", test_record_timings_accumulate_across_rounds),
+        ("Collect Metrics by Backend and Status", test_collect_metrics_by_backend_and_status),
+        ("Queue Wait Expands Parent Dependencies", test_queue_wait_expands_parent_dependencies),
+        ("Histogram Buckets Are Cumulative", test_histogram_buckets_are_cumulative),
+        ("E2E Run Exports Valid OpenMetrics", test_e2e_run_exports_valid_openmetrics),
+        ("Export Is Best Effort", test_export_is_best_effort),
+        ("Render Escapes Label Values", test_render_escapes_label_values),
+    ]
+    
+    failed = []
+    for name, test in tests:
+        try:
+            print(f"\n{name}")
+            test()
+            print("  ✅ PASSED")
+        except Exception as e:
+            print(f"  ❌ FAILED: {e}")
+            failed.append((name, str(e)))
+    
+    print("\n" + "=" * 60)
+    if failed:
+        print(f"❌ {len(failed)} test(s) failed:")
+        for name, error in failed:
+            print(f"   - {name}: {error}")
+        sys.exit(1)
+    else:
+        print(f"✅ All {len(tests)} tests passed!")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for the Profiling Mode
+
+Checks that profiled CLI runs leave pstats and allocation snapshots in a
+run directory, and that reports merge runs.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from profiling import (
+    MEMORY_FILE,
+    PSTATS_FILE,
+    RUN_FILE,
+    find_runs,
+    merge_profiles,
+    profile_run,
+)
+
+
+SCRIPTS_DIR = Path(__file__).parent
+
+
+def _allocate(n):
+    return [str(i) * 10 for i in range(n)]
+
+
+# =============================================================================
+# Profile Runs
+# =============================================================================
+
+def test_profile_run_off_writes_nothing():
+    """Without --profile/--profile-memory no run directory is created."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with profile_run("noop", profile_dir=tmpdir) as run_dir:
+            _allocate(10)
+        
+        assert run_dir is None
+        assert os.listdir(tmpdir) == []
+
+
+def test_profile_run_records_exit_status():
+    """sys.exit inside a profiled block still writes the profile."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            with profile_run("failing", profile=True, memory=True, profile_dir=tmpdir, top_n=5) as run_dir:
+                _allocate(1000)
+                sys.exit(1)
+        except SystemExit:
+            pass
+        
+        with open(run_dir / RUN_FILE) as f:
+            run_info = json.load(f)
+        with open(run_dir / MEMORY_FILE) as f:
+            memory = json.load(f)
+        
+        assert run_info["command"] == "failing"
+        assert run_info["exit_status"] == 1
+        assert (run_dir / PSTATS_FILE).is_file()
+        assert 0 < len(memory["top"]) <= 5
+        assert memory["peak"] >= memory["current"]
+
+
+def test_cli_profile_flags_and_report_merge():
+    """Profiled CLI runs can be merged with `profiling.py report`."""
+    state = {
+        "spec_path": ".",
+        "session_name": "test",
+        "tasks": [
+            {"task_id": "1", "description": "A", "type": "code", "status": "not_started",
+             "dependencies": [], "subtasks": [], "writes": ["a.py"], "reads": []},
+        ],
+    }
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        with open(state_file, "w") as f:
+            json.dump(state, f)
+        profile_dir = os.path.join(tmpdir, "profiles")
+        
+        for _ in range(2):
+            result = subprocess.run(
+                [sys.executable, str(SCRIPTS_DIR / "dispatch_batch.py"), state_file, "--dry-run",
+                 "--profile", "--profile-memory", "--profile-dir", profile_dir],
+                capture_output=True, text=True, timeout=60,
+            )
+            assert result.returncode == 0, result.stderr
+        
+        runs = find_runs([profile_dir], command="dispatch_batch")
+        report = merge_profiles(runs)
+        
+        assert len(runs) == 2
+        assert report.stats is not None
+        assert any(func[2] == "dispatch_batch" for func in report.stats.stats)
+        assert report.memory_sites and report.peak_memory > 0
+        assert find_runs([profile_dir], command="sync_pulse") == []
+        
+        output = subprocess.run(
+            [sys.executable, str(SCRIPTS_DIR / "profiling.py"), "report", profile_dir, "--limit", "5"],
+            capture_output=True, text=True, timeout=60,
+        )
+        assert output.returncode == 0, output.stderr
+        assert output.stdout.startswith("Runs: 2")
+
+
+if __name__ == "__main__":
+    print("Running profiling tests...")
+    print("=" * 60)
+    
+    tests = [
+        ("profile_run Off Writes Nothing", test_profile_run_off_writes_nothing),
+        ("profile_run Records Exit Status", test_profile_run_records_exit_status),
+        ("CLI Profile Flags and Report Merge", test_cli_profile_flags_and_report_merge),
+    ]
+    
+    failed = []
+    for name, test in tests:
+        try:
+            print(f"\n{name}")
+            test()
+            print("  ✅ PASSED")
+        except Exception as e:
+            print(f"  ❌ FAILED: {e}")
+            failed.append((name, str(e)))
+    
+    print("\n" + "=" * 60)
+    if failed:
+        print(f"❌ {len(failed)} test(s) failed:")
+        for name, error in failed:
+            print(f"   - {name}: {error}")
+        sys.exit(1)
+    else:
+        print(f"✅ All {len(tests)} tests passed!")
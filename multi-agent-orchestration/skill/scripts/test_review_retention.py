@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Tests for Review History and Findings Retention
+
+Checks that old review rounds and settled findings are archived before
+they leave the state, and that rollups keep their severity counts.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from consolidate_reviews import consolidate_reviews
+from fix_loop import format_review_history
+from review_retention import ARCHIVE_OFFSET_KEY, ROLLUP_KEY, apply_review_retention, archive_path_for
+from state_store import load_state_file, write_state_file
+
+
+SEVERITIES = ["critical", "major", "minor", "none"]
+
+
+def _round(attempt, severity="major"):
+    return {"attempt": attempt, "severity": severity,
+            "findings": [{"severity": severity, "summary": f"Issue in round {attempt}"}]}
+
+
+def _read_archive(state_file):
+    with open(archive_path_for(state_file)) as f:
+        return [json.loads(line) for line in f]
+
+
+# =============================================================================
+# Retention Policy
+# =============================================================================
+
+@given(
+    severities=st.lists(st.sampled_from(SEVERITIES), max_size=12),
+    keep=st.integers(min_value=1, max_value=5),
+)
+@settings(max_examples=50, deadline=None)
+def test_history_keeps_last_rounds_and_rolls_up_the_rest(severities, keep):
+    """The newest rounds stay; archive plus rollup account for every older one."""
+    history = [_round(i, severity) for i, severity in enumerate(severities)]
+    task = {"task_id": "1", "status": "fix_required", "review_history": [dict(r) for r in history]}
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        result = apply_review_retention({"tasks": [task]}, state_file, keep=keep)
+        archived = _read_archive(state_file) if result.archive_file else []
+    
+    old = history[:-keep] if len(history) > keep else []
+    assert task["review_history"] == history[len(old):]
+    assert result.rounds_archived == len(old)
+    assert [record["entry"] for record in archived] == old
+    if old:
+        rollup = task[ROLLUP_KEY]
+        assert rollup["archived_rounds"] == len(old)
+        assert sum(rollup["rounds_by_severity"].values()) == len(old)
+    else:
+        assert ROLLUP_KEY not in task
+
+
+def test_findings_of_completed_tasks_are_archived():
+    """Findings of completed tasks leave review_findings; others stay."""
+    state = {
+        "tasks": [
+            {"task_id": "1", "status": "completed"},
+            {"task_id": "2", "status": "under_review"},
+        ],
+        "review_findings": [
+            {"task_id": "1", "severity": "minor", "summary": "a"},
+            {"task_id": "1", "severity": "none", "summary": "b"},
+            {"task_id": "2", "severity": "major", "summary": "c"},
+        ],
+    }
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        result = apply_review_retention(state, state_file)
+        archived = _read_archive(state_file)
+    
+    assert result.findings_archived == 2
+    assert [f["summary"] for f in state["review_findings"]] == ["c"]
+    assert [r["finding"]["summary"] for r in archived] == ["a", "b"]
+    assert state["tasks"][0][ROLLUP_KEY]["findings_by_severity"] == {"minor": 1, "none": 1}
+
+
+def test_failed_archive_write_leaves_state_unchanged():
+    """Nothing is dropped from the state unless it reached the archive."""
+    state = {"tasks": [{"task_id": "1", "status": "fix_required", "review_history": [_round(i) for i in range(5)]}]}
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        os.mkdir(archive_path_for(state_file))
+        
+        with pytest.raises(OSError):
+            apply_review_retention(state, state_file, keep=2)
+    
+    assert len(state["tasks"][0]["review_history"]) == 5
+    assert ROLLUP_KEY not in state["tasks"][0]
+
+
+def test_rerun_after_failed_save_does_not_duplicate_archive():
+    """A retry from the unsaved state archives each round and finding once."""
+    def make_state():
+        return {
+            "tasks": [
+                {"task_id": "1", "status": "fix_required", "review_history": [
+                    dict(_round(i), reviewed_at=f"2026-01-0{i + 1}T00:00:00Z") for i in range(5)
+                ]},
+                {"task_id": "2", "status": "completed"},
+            ],
+            "review_findings": [{"task_id": "2", "reviewer": "codex", "severity": "minor",
+                                 "summary": "Nit", "created_at": "2026-01-01T00:00:00Z"}],
+        }
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        with open(archive_path_for(state_file), "w") as f:
+            f.write('{"kind":"review_history","task_id":"0","entry":{"attempt":0}}\n')
+        saved = make_state()
+        saved[ARCHIVE_OFFSET_KEY] = os.path.getsize(archive_path_for(state_file))
+        apply_review_retention(json.loads(json.dumps(saved)), state_file, keep=2)
+        # The save failed: the next run starts from the saved state again
+        retried = json.loads(json.dumps(saved))
+        apply_review_retention(retried, state_file, keep=2)
+        archived = _read_archive(state_file)[1:]
+    
+    assert [r["entry"]["attempt"] for r in archived if r["kind"] == "review_history"] == [0, 1, 2]
+    assert [r["finding"]["summary"] for r in archived if r["kind"] == "review_finding"] == ["Nit"]
+    assert retried["tasks"][0][ROLLUP_KEY]["archived_rounds"] == 3
+    assert retried["tasks"][1][ROLLUP_KEY]["archived_findings"] == 1
+
+
+def test_committed_archive_is_not_reread():
+    """Only records past the saved offset are checked for duplicates."""
+    state = {"tasks": [{"task_id": "1", "status": "fix_required",
+                        "review_history": [_round(i) for i in range(3)]}]}
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        committed = '{"kind":"review_history","task_id":"1","entry":{"attempt":0}}\n'
+        with open(archive_path_for(state_file), "w") as f:
+            f.write(committed)
+        state[ARCHIVE_OFFSET_KEY] = len(committed)
+        
+        apply_review_retention(state, state_file, keep=1)
+        archived = _read_archive(state_file)
+        size = os.path.getsize(archive_path_for(state_file))
+    
+    assert [r["entry"]["attempt"] for r in archived] == [0, 0, 1]
+    assert state[ARCHIVE_OFFSET_KEY] == size
+
+
+def test_torn_archive_tail_is_dropped_before_appending():
+    """A partial last line from a crash does not swallow the next record."""
+    state = {"tasks": [{"task_id": "1", "status": "fix_required",
+                        "review_history": [_round(i) for i in range(3)]}]}
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        with open(archive_path_for(state_file), "w") as f:
+            f.write('{"kind":"review_history","task_id":"0","entry":{"attempt":0}}\n')
+            f.write('{"kind":"review_history","task_id":"1","entry":{"attempt":0')
+        
+        apply_review_retention(state, state_file, keep=1)
+        archived = _read_archive(state_file)
+    
+    assert [(r["task_id"], r["entry"]["attempt"]) for r in archived] == [("0", 0), ("1", 0), ("1", 1)]
+
+
+def test_escalation_history_mentions_archived_rounds():
+    """Prompts built from a trimmed history still report the earlier rounds."""
+    text = format_review_history(
+        [_round(3)],
+        {"archived_rounds": 3, "rounds_by_severity": {"critical": 1, "major": 2}},
+    )
+    
+    assert text.startswith("3 earlier review round(s) archived (critical: 1, major: 2)")
+    assert "### Fix Attempt 3 Review" in text
+
+
+# =============================================================================
+# Consolidation
+# =============================================================================
+
+def test_consolidation_bounds_history(monkeypatch):
+    """Each consolidation that enters the fix loop keeps only the last rounds."""
+    monkeypatch.setenv("ORCHESTRATION_REVIEW_HISTORY_KEEP", "2")
+    state = {
+        "spec_path": ".",
+        "session_name": "test",
+        "tasks": [{"task_id": "1", "description": "A", "type": "code", "status": "final_review",
+                   "owner_agent": "kiro-cli", "dependencies": [], "subtasks": [], "fix_attempts": 2,
+                   "review_history": [_round(0), _round(1)]}],
+        "review_findings": [{"task_id": "1", "reviewer": "codex", "severity": "major",
+                             "summary": "Still broken", "created_at": "2026-01-01T00:00:00Z"}],
+        "final_reports": [],
+    }
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        write_state_file(state_file, state)
+        
+        result = consolidate_reviews(state_file)
+        
+        task = load_state_file(state_file)["tasks"][0]
+        archived = _read_archive(state_file)
+    
+    assert result.success
+    assert task["status"] == "fix_required"
+    assert len(task["review_history"]) == 2
+    assert task["review_history"][0]["attempt"] == 1
+    assert task[ROLLUP_KEY]["archived_rounds"] == 1
+    assert archived[0]["entry"]["attempt"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Tests for AGENT_STATE.json Persistence
+
+Checks the JSON codecs, compact/pretty writes, zstd snapshots, detached
+task fields, the StateWriter flush thresholds and
+that a dispatch cycle writes the state file once.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import state_store
+from state_store import (
+    CODECS,
+    DETACHED_KEY,
+    JSON_CODEC_ENV_VAR,
+    STATE_FORMAT_ENV_VAR,
+    StateWriter,
+    attach_detached_fields,
+    detached_dir_for,
+    get_codec,
+    load_state_file,
+    write_state_file,
+    write_state_snapshot,
+)
+from blob_store import BlobStore, blob_dir_for
+from consolidate_reviews import consolidate_reviews
+from dispatch_batch import dispatch_batch
+from fake_codeagent_wrapper import install_fake_wrapper
+
+
+# Integers beyond 64 bits are not supported by every codec
+json_values = st.recursive(
+    st.none() | st.booleans() | st.integers(min_value=-(2**63), max_value=2**63 - 1) | st.text(max_size=20),
+    lambda children: st.lists(children, max_size=4) | st.dictionaries(st.text(max_size=8), children, max_size=4),
+    max_leaves=20,
+)
+
+
+# =============================================================================
+# write_state_file and StateWriter
+# =============================================================================
+
+@given(state=st.dictionaries(st.text(max_size=8), json_values, max_size=5))
+@settings(max_examples=50, deadline=None)
+def test_codecs_round_trip_compact_and_pretty(state):
+    """Every installed codec loads back both formats; compact is never larger."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for codec in CODECS.values():
+            pretty = os.path.join(tmpdir, f"{codec.name}-pretty.json")
+            compact = os.path.join(tmpdir, f"{codec.name}-compact.json")
+            write_state_file(pretty, state, compact=False, codec=codec)
+            write_state_file(compact, state, compact=True, durable=True, codec=codec)
+            
+            assert load_state_file(pretty, codec) == state
+            assert load_state_file(compact, get_codec("json")) == state
+            assert os.path.getsize(compact) <= os.path.getsize(pretty)
+        assert not [name for name in os.listdir(tmpdir) if name.endswith(".tmp")]
+
+
+def test_codec_selection_and_default_format(monkeypatch):
+    """Env vars pick the codec and the output format; unknown codecs fail."""
+    monkeypatch.setenv(JSON_CODEC_ENV_VAR, "json")
+    assert get_codec().name == "json"
+    monkeypatch.delenv(JSON_CODEC_ENV_VAR)
+    assert get_codec().name == next(iter(CODECS))
+    with pytest.raises(ValueError):
+        get_codec("simdjson")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "AGENT_STATE.json")
+        write_state_file(path, {"tasks": [{"task_id": "1"}]})
+        with open(path) as f:
+            assert f.read() == '{"tasks":[{"task_id":"1"}]}'
+        
+        monkeypatch.setenv(STATE_FORMAT_ENV_VAR, "pretty")
+        write_state_file(path, {"tasks": []})
+        with open(path) as f:
+            assert json.load(f) == {"tasks": []}
+        assert os.path.getsize(path) > len('{"tasks":[]}')
+
+
+@pytest.mark.skipif(state_store.zstandard is None, reason="zstandard not installed")
+def test_zstd_snapshot_round_trip():
+    """Snapshots are compressed and load like the state file."""
+    state = {"tasks": [{"task_id": str(i), "output": "x" * 200} for i in range(50)]}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        write_state_file(state_file, state, compact=False)
+        
+        snapshot = write_state_snapshot(state_file)
+        
+        assert snapshot.endswith(".json.zst")
+        assert os.path.getsize(snapshot) < os.path.getsize(state_file)
+        assert load_state_file(snapshot) == state
+
+
+@pytest.mark.skipif(state_store.zstandard is not None, reason="zstandard installed")
+def test_zstd_snapshot_requires_zstandard():
+    """Without zstandard, snapshots fail with a clear error."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        write_state_file(state_file, {"tasks": []})
+        
+        with pytest.raises(RuntimeError, match="zstandard"):
+            write_state_snapshot(state_file)
+        
+        with open(state_file, "wb") as f:
+            f.write(state_store.ZSTD_MAGIC + b"\0" * 8)
+        with pytest.raises(RuntimeError, match="zstandard"):
+            load_state_file(state_file)
+
+
+def test_writer_coalesces_until_flush_or_threshold():
+    """Marks are batched; the change-count threshold and flush() write."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "AGENT_STATE.json")
+        state = {"tasks": []}
+        writer = StateWriter(path, state, flush_interval=None, max_pending=5)
+        
+        assert not writer.flush()
+        assert not writer.mark_dirty(2)
+        assert not os.path.exists(path)
+        
+        assert writer.mark_dirty(3)
+        assert writer.writes == 1
+        
+        state["tasks"].append({"task_id": "1"})
+        with writer:
+            writer.mark_dirty()
+        assert writer.writes == 2
+        with open(path) as f:
+            assert json.load(f) == state
+
+
+def test_writer_flushes_after_interval():
+    """A zero interval writes on every mark (long-running batches persist)."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        writer = StateWriter(os.path.join(tmpdir, "s.json"), {}, flush_interval=0.0, max_pending=None)
+        
+        assert writer.mark_dirty()
+        assert writer.mark_dirty()
+        assert writer.writes == 2
+
+
+# =============================================================================
+# Detached Task Fields
+# =============================================================================
+
+def _history(rounds):
+    return [{"attempt": i, "severity": "major", "findings": [{"summary": "s" * 500}]} for i in range(rounds)]
+
+
+def test_large_fields_are_detached_and_loaded_on_demand():
+    """Big output/history leave the state file; partial loads attach them per task."""
+    # blobs=False: without the blob store the large output itself is detached
+    state = {"tasks": [
+        {"task_id": "1", "status": "completed", "output": "o" * 5000, "review_history": _history(3)},
+        {"task_id": "2", "status": "completed", "output": "short"},
+    ]}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        write_state_file(state_file, state, blobs=False)
+        
+        with open(state_file) as f:
+            on_disk = json.load(f)["tasks"]
+        assert "output" not in on_disk[0] and "review_history" not in on_disk[0]
+        assert on_disk[0][DETACHED_KEY]["fields"] == ["output", "review_history"]
+        assert on_disk[1]["output"] == "short"
+        assert os.path.getsize(state_file) < 1000
+        
+        assert load_state_file(state_file)["tasks"][0]["review_history"] == _history(3)
+        
+        partial = load_state_file(state_file, detached=False)
+        assert "output" not in partial["tasks"][0]
+        assert attach_detached_fields(state_file, partial["tasks"]) == 1
+        assert partial["tasks"][0]["output"] == "o" * 5000
+
+
+def test_partial_save_keeps_unloaded_fields(monkeypatch):
+    """Saving a partially loaded state rewrites only side files that changed."""
+    state = {"tasks": [
+        {"task_id": "1", "output": "a" * 5000, "review_history": _history(2)},
+        {"task_id": "2", "output": "b" * 5000},
+    ]}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        write_state_file(state_file, state, blobs=False)
+        
+        partial = load_state_file(state_file, detached=False)
+        partial["tasks"][0]["output"] = "c" * 6000
+        written = []
+        real_write = state_store._write_atomic
+        monkeypatch.setattr(state_store, "_write_atomic",
+                            lambda path, data, durable: (written.append(path), real_write(path, data, durable)))
+        write_state_file(state_file, partial, blobs=False)
+        
+        assert [os.path.basename(p) for p in written] == ["1.json", "AGENT_STATE.json"]
+        tasks = load_state_file(state_file)["tasks"]
+        assert tasks[0]["output"] == "c" * 6000
+        assert tasks[0]["review_history"] == _history(2)
+        assert tasks[1]["output"] == "b" * 5000
+        
+        # Shrunk fields move back inline and the side file goes away
+        tasks[1]["output"] = "done"
+        write_state_file(state_file, {"tasks": tasks}, blobs=False)
+        assert sorted(os.listdir(detached_dir_for(state_file))) == ["1.json"]
+        with open(state_file) as f:
+            assert json.load(f)["tasks"][1]["output"] == "done"
+
+
+def test_consolidation_appends_to_detached_history():
+    """The fix loop sees the full detached review_history of a consolidated task."""
+    state = {
+        "spec_path": ".",
+        "session_name": "test",
+        "tasks": [{"task_id": "1", "description": "A", "type": "code", "status": "final_review",
+                   "owner_agent": "kiro-cli", "dependencies": [], "subtasks": [],
+                   "output": "x" * 5000, "review_history": _history(2), "fix_attempts": 1}],
+        "review_findings": [{"task_id": "1", "reviewer": "codex", "severity": "major",
+                             "summary": "Still broken", "details": "", "created_at": "2026-01-01T00:00:00Z"}],
+        "final_reports": [],
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        write_state_file(state_file, state)
+        
+        result = consolidate_reviews(state_file)
+        
+        assert result.success and result.reports_created == 1
+        task = load_state_file(state_file)["tasks"][0]
+        assert task["status"] == "fix_required"
+        assert len(task["review_history"]) == 3
+        assert BlobStore(blob_dir_for(state_file)).get(task["output_ref"]) == "x" * 5000
+
+
+# =============================================================================
+# Dispatch Cycle
+# =============================================================================
+
+def test_dispatch_cycle_writes_state_once(monkeypatch):
+    """Several conflict batches in one dispatch produce a single state write."""
+    tasks = [
+        {"task_id": str(i), "description": f"Task {i}", "type": "code", "status": "not_started",
+         "owner_agent": "kiro-cli", "dependencies": [], "subtasks": [], "writes": ["shared.py"], "reads": []}
+        for i in range(1, 5)
+    ]
+    state = {"spec_path": ".", "session_name": "test", "tasks": tasks}
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        with open(state_file, "w") as f:
+            json.dump(state, f)
+        bin_dir = os.path.join(tmpdir, "bin")
+        install_fake_wrapper(bin_dir)
+        monkeypatch.setenv("PATH", bin_dir + os.pathsep + os.environ.get("PATH", ""))
+        
+        writes = []
+        real_write = state_store.write_state_file
+        
+        def counting_write(path, data, compact=None, durable=False, codec=None):
+            writes.append(compact)
+            real_write(path, data, compact=compact, durable=durable, codec=codec)
+        
+        monkeypatch.setattr(state_store, "write_state_file", counting_write)
+        
+        result = dispatch_batch(state_file, workdir=tmpdir, compact_state=True)
+        
+        assert result.success
+        assert result.tasks_dispatched == 4
+        assert writes == [True]
+        with open(state_file) as f:
+            content = f.read()
+        assert "\n" not in content
+        assert {t["status"] for t in json.loads(content)["tasks"]} == {"pending_review"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -9,18 +9,35 @@ Validates: Requirements 6.3, 3.5, 9.6
 """
 
 import json
+import os
+import re
 import string
 import sys
 import tempfile
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, Any, List
 
+import pytest
 from hypothesis import given, strategies as st, settings, assume
 
 # Add script directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# The agent-pulse-coordination skill, when present in the repository layout
+AGENT_PULSE_SCRIPTS = next(
+    (parent / "skills" / "agent-pulse-coordination" / "scripts"
+     for parent in Path(__file__).resolve().parents
+     if (parent / "skills" / "agent-pulse-coordination" / "scripts").is_dir()),
+    Path("agent-pulse-coordination-not-found")
+)
+needs_agent_pulse = pytest.mark.skipif(
+    not (AGENT_PULSE_SCRIPTS / "pulse_engine.py").is_file(),
+    reason="agent-pulse-coordination skill not present"
+)
+
 from sync_pulse import (
     sync_pulse,
     sync_pulse_from_state,
@@ -36,6 +53,16 @@ from sync_pulse import (
     get_blocked_tasks,
     format_blocked_item,
     is_older_than_24h,
+    sync_pulse_files,
+    fingerprint_sync_inputs,
+    summarize_state,
+    get_completed_tasks,
+    get_in_progress_tasks,
+    build_semantic_anchors,
+    watch_pulse,
+    SECTION_PATTERNS,
+    find_sections,
+    find_section_spans,
 )
 
 
@@ -269,6 +296,25 @@ def pulse_document_strategy(draw):
     )
 
 
+@st.composite
+def pulse_markdown_strategy(draw):
+    """Generate loosely structured PULSE markdown with section headers mixed in"""
+    header_lines = [
+        "## 🟢 Mental Model", "## Mental Model", "##  mental   model extra",
+        "## 🟡 Narrative Delta", "## 🔴 Risks & Debt", "## Risks ＆ Debt\r",
+        "## 🔗 Semantic Anchors", "## semantic anchors",
+    ]
+    other_lines = [
+        "", "# PROJECT_PULSE", "- item", "### Technical Debt", "text ## Mental Model",
+        " ## Mental Model", "##", "Mental Model", "## Other Section", "```mermaid",
+    ]
+    lines = draw(st.lists(
+        st.one_of(st.sampled_from(header_lines), st.sampled_from(other_lines)),
+        max_size=30
+    ))
+    return "\n".join(lines)
+
+
 # =============================================================================
 # Property 12: Dual Document Synchronization
 # =============================================================================
@@ -735,6 +781,317 @@ def test_build_mental_model_contains_task_info():
     assert "Orchestrator" in new_model.mermaid_diagram
 
 
+def _find_sections_line_by_line(content: str) -> Dict[str, str]:
+    """Reference implementation: try every header pattern on every line"""
+    sections = {}
+    current_section = None
+    current_lines = []
+    for line in content.split('\n'):
+        found = next(
+            (name for name, pattern in SECTION_PATTERNS.items()
+             if re.match(pattern, line, re.IGNORECASE)),
+            None
+        )
+        if found:
+            if current_section:
+                sections[current_section] = '\n'.join(current_lines)
+            current_section = found
+            current_lines = [line]
+        elif current_section:
+            current_lines.append(line)
+    if current_section:
+        sections[current_section] = '\n'.join(current_lines)
+    return sections
+
+
+@given(content=pulse_markdown_strategy())
+@settings(max_examples=200, deadline=None)
+def test_section_scanner_matches_line_by_line(content):
+    """The single-pass section scanner finds the same sections as per-line matching."""
+    assert find_sections(content) == _find_sections_line_by_line(content)
+
+
+def test_section_spans_are_offsets_into_content():
+    """Section spans slice the original document without re-joining lines."""
+    content = generate_pulse(PulseDocument(
+        mental_model=MentalModel(description="Demo project", mermaid_diagram="flowchart TB"),
+        narrative_delta="Did things",
+        risks_and_debt=RisksAndDebt(),
+        semantic_anchors=[SemanticAnchor(module="Core", path="src/a.py", symbol="A")],
+    ))
+    spans = find_section_spans(content)
+    
+    assert list(spans) == ["mental_model", "narrative_delta", "risks_and_debt", "semantic_anchors"]
+    start, end = spans["narrative_delta"]
+    assert content[start:end].startswith("## 🟡 Narrative Delta")
+    assert content[end] == "\n"
+    assert content[end + 1:].startswith("## 🔴 Risks & Debt")
+    assert spans["semantic_anchors"][1] == len(content)
+
+
+def test_sync_pulse_files_skips_unchanged_write():
+    """A repeat sync with unchanged inputs leaves the PULSE file untouched."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = Path(tmpdir) / "AGENT_STATE.json"
+        pulse_file = Path(tmpdir) / "PROJECT_PULSE.md"
+        
+        state = {
+            "spec_path": "/test/spec",
+            "tasks": [{"task_id": "1", "description": "Task 1", "status": "blocked"}],
+            "blocked_items": [{"task_id": "1", "blocking_reason": "Missing dep"}],
+            "pending_decisions": [],
+            "deferred_fixes": [],
+        }
+        state_file.write_text(json.dumps(state), encoding='utf-8')
+        pulse_file.write_text(generate_pulse(PulseDocument(
+            mental_model=MentalModel(description="Test", mermaid_diagram=""),
+            narrative_delta="",
+            risks_and_debt=RisksAndDebt(),
+            semantic_anchors=[]
+        )), encoding='utf-8')
+        
+        first = sync_pulse_files(str(state_file), str(pulse_file))
+        assert first.success and first.pulse_updated
+        synced = pulse_file.read_text(encoding='utf-8')
+        assert synced.count("🚫 BLOCKED: [1]") == 1
+        
+        # Same inputs: memoized no-op, file not rewritten
+        pulse_file.touch()
+        mtime = pulse_file.stat().st_mtime_ns
+        second = sync_pulse_files(str(state_file), str(pulse_file))
+        assert second.success and not second.pulse_updated
+        assert pulse_file.stat().st_mtime_ns == mtime
+        
+        # Unrelated state change: regenerated, but identical content is not written
+        state["review_findings"] = [{"task_id": "1", "severity": "minor"}]
+        state_file.write_text(json.dumps(state), encoding='utf-8')
+        third = sync_pulse_files(str(state_file), str(pulse_file))
+        assert third.success and not third.pulse_updated
+        assert pulse_file.stat().st_mtime_ns == mtime
+        assert pulse_file.read_text(encoding='utf-8') == synced
+        
+        # Relevant change: written atomically with no temp file left behind
+        state["tasks"][0]["status"] = "completed"
+        state_file.write_text(json.dumps(state), encoding='utf-8')
+        fourth = sync_pulse_files(str(state_file), str(pulse_file))
+        assert fourth.success and fourth.pulse_updated
+        assert "Completed: 1" in pulse_file.read_text(encoding='utf-8')
+        assert sorted(p.name for p in Path(tmpdir).iterdir()) == ["AGENT_STATE.json", "PROJECT_PULSE.md"]
+
+
+@given(agent_state=agent_state_strategy())
+@settings(max_examples=100, deadline=None)
+def test_sync_fingerprint_ignores_unrelated_state(agent_state):
+    """The sync fingerprint tracks PULSE inputs only."""
+    before = fingerprint_sync_inputs(agent_state)
+    
+    agent_state["review_findings"] = [{"task_id": "x", "summary": "unrelated"}]
+    agent_state["window_mapping"] = {"x": "window-1"}
+    for task in agent_state["tasks"]:
+        task["output"] = "long agent output"
+    assert fingerprint_sync_inputs(agent_state) == before
+    
+    assert fingerprint_sync_inputs(agent_state, update_mental_model=True) != before
+    agent_state["tasks"].append({"task_id": "new", "status": "not_started"})
+    assert fingerprint_sync_inputs(agent_state) != before
+
+
+@given(states=st.lists(agent_state_strategy(), min_size=1, max_size=4),
+       update_mental_model=st.booleans())
+@settings(max_examples=50, deadline=None)
+def test_incremental_sync_matches_full_regeneration(states, update_mental_model):
+    """Section-level sync yields the same document as a full parse/build/generate."""
+    content = generate_pulse(PulseDocument(
+        mental_model=MentalModel(description="Test", mermaid_diagram="flowchart TB"),
+        narrative_delta="",
+        risks_and_debt=RisksAndDebt(technical_debt=["Existing debt"]),
+        semantic_anchors=[]
+    ))
+    
+    # Run each state twice so the second pass is served from the section memo
+    for state in states + states:
+        expected = generate_pulse(sync_pulse(
+            state, parse_pulse(content), update_mental_model=update_mental_model
+        ))
+        content, was_updated = sync_pulse_from_state(
+            content, state, update_mental_model=update_mental_model
+        )
+        assert was_updated
+        assert content == expected
+
+
+def test_sync_pulse_files_rerenders_only_changed_sections():
+    """Only sections whose inputs changed are rebuilt and reported."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = Path(tmpdir) / "AGENT_STATE.json"
+        pulse_file = Path(tmpdir) / "PROJECT_PULSE.md"
+        state = {
+            "spec_path": "/test/spec",
+            "tasks": [{"task_id": "1", "description": "Task 1", "status": "in_progress"}],
+            "deferred_fixes": [],
+        }
+        state_file.write_text(json.dumps(state), encoding='utf-8')
+        pulse_file.write_text(generate_pulse(PulseDocument(
+            mental_model=MentalModel(description="Test", mermaid_diagram=""),
+            narrative_delta="",
+            risks_and_debt=RisksAndDebt(),
+            semantic_anchors=[]
+        )), encoding='utf-8')
+        
+        first = sync_pulse_files(str(state_file), str(pulse_file))
+        assert first.pulse_updated
+        assert first.sections_updated == ["narrative_delta"]
+        
+        state["deferred_fixes"] = [{"task_id": "1", "description": "Tidy up", "severity": "minor"}]
+        state_file.write_text(json.dumps(state), encoding='utf-8')
+        second = sync_pulse_files(str(state_file), str(pulse_file))
+        assert second.pulse_updated
+        assert second.sections_updated == ["risks_and_debt"]
+        assert "Tidy up" in pulse_file.read_text(encoding='utf-8')
+        
+        # A human edit to the PULSE file is preserved on the next sync
+        edited = pulse_file.read_text(encoding='utf-8').replace(
+            "### Technical Debt\n", "### Technical Debt\n- Manual note\n")
+        pulse_file.write_text(edited, encoding='utf-8')
+        third = sync_pulse_files(str(state_file), str(pulse_file))
+        assert third.success and not third.pulse_updated
+        assert "Manual note" in pulse_file.read_text(encoding='utf-8')
+
+
+def test_sync_splices_sections_after_custom_title_block():
+    """Regenerated sections are spliced in without rewriting the title block."""
+    body = generate_pulse(PulseDocument(
+        mental_model=MentalModel(description="Test", mermaid_diagram=""),
+        narrative_delta="Old narrative",
+        risks_and_debt=RisksAndDebt(),
+        semantic_anchors=[]
+    ))
+    header = "# PROJECT_PULSE\n\n> Owned by the platform team\n\n"
+    content = header + body[len("# PROJECT_PULSE\n\n"):]
+    state = {"spec_path": "/test/spec", "tasks": [{"task_id": "1", "status": "completed"}]}
+    
+    updated, was_updated = sync_pulse_from_state(content, state)
+    assert was_updated
+    assert updated.startswith(header + "## 🟢 Mental Model")
+    assert "Completed: 1" in updated
+    assert "Old narrative" not in updated
+
+
+@given(agent_state=agent_state_strategy())
+@settings(max_examples=100, deadline=None)
+def test_state_summary_matches_per_status_scans(agent_state):
+    """The single-pass summary matches the per-status filters and full sort."""
+    summary = summarize_state(agent_state)
+    tasks = agent_state["tasks"]
+    
+    assert summary.total == len(tasks)
+    for status in {t.get("status") for t in tasks}:
+        assert summary.count(status) == len([t for t in tasks if t.get("status") == status])
+    assert summary.completed == get_completed_tasks(agent_state)
+    assert summary.in_progress == get_in_progress_tasks(agent_state)
+    assert summary.blocked == get_blocked_tasks(agent_state)
+    assert summary.recent_completions == sorted(
+        get_completed_tasks(agent_state),
+        key=lambda t: t.get("completed_at", ""),
+        reverse=True
+    )[:5]
+    assert set(summary.agent_counts) == {t["owner_agent"] for t in tasks if t.get("owner_agent")}
+    
+    # Builders produce the same output with a shared summary
+    existing = MentalModel(description="", mermaid_diagram="")
+    assert build_mental_model(agent_state, existing, summary) == build_mental_model(agent_state, existing)
+    assert build_narrative_delta(agent_state, "", summary) == build_narrative_delta(agent_state, "")
+    assert build_risks_and_debt(agent_state, RisksAndDebt(), summary) == \
+        build_risks_and_debt(agent_state, RisksAndDebt())
+    assert build_semantic_anchors(agent_state, [], summary) == build_semantic_anchors(agent_state, [])
+
+
+@needs_agent_pulse
+def test_pulse_engine_copy_matches_agent_pulse():
+    """The linked (or copied) pulse_engine.py matches the shared engine."""
+    bundled = Path(__file__).parent / "pulse_engine.py"
+    
+    assert bundled.read_bytes() == (AGENT_PULSE_SCRIPTS / "pulse_engine.py").read_bytes()
+
+
+@needs_agent_pulse
+@given(agent_state=agent_state_strategy())
+@settings(max_examples=50, deadline=None)
+def test_synced_pulse_passes_agent_pulse_validation(agent_state):
+    """Both PULSE stacks share one engine, so synced output parses strictly."""
+    if str(AGENT_PULSE_SCRIPTS) not in sys.path:
+        sys.path.append(str(AGENT_PULSE_SCRIPTS))
+    import pulse_parser
+    
+    assert pulse_parser.PulseDocument is PulseDocument
+    initial = pulse_parser.generate_pulse(PulseDocument(
+        mental_model=MentalModel(description="Demo project", mermaid_diagram="flowchart TB"),
+        narrative_delta="",
+        risks_and_debt=RisksAndDebt(),
+        semantic_anchors=[],
+    ))
+    updated, _ = sync_pulse_from_state(initial, agent_state, update_mental_model=True)
+    
+    result = pulse_parser.parse_pulse(updated)
+    assert result.valid, result.errors
+    assert result.document == parse_pulse(updated)
+
+
+def _run_watch_with_burst(use_inotify):
+    """Start watch_pulse, write a burst of state updates, collect sync results"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = Path(tmpdir) / "AGENT_STATE.json"
+        pulse_file = Path(tmpdir) / "PROJECT_PULSE.md"
+        state = {"spec_path": "/test/spec", "tasks": []}
+        state_file.write_text(json.dumps(state), encoding='utf-8')
+        pulse_file.write_text(generate_pulse(PulseDocument(
+            mental_model=MentalModel(description="Test", mermaid_diagram=""),
+            narrative_delta="",
+            risks_and_debt=RisksAndDebt(),
+            semantic_anchors=[]
+        )), encoding='utf-8')
+        
+        results = []
+        started = threading.Event()
+        
+        def on_sync(result):
+            results.append(result)
+            started.set()
+        
+        watcher = threading.Thread(target=watch_pulse, kwargs=dict(
+            state_file_path=str(state_file),
+            pulse_file_path=str(pulse_file),
+            debounce=0.3,
+            poll_interval=0.01,
+            use_inotify=use_inotify,
+            on_sync=on_sync,
+            max_syncs=2,
+        ))
+        watcher.start()
+        assert started.wait(5)
+        
+        # Burst of atomic state saves, faster than the debounce window
+        for i in range(5):
+            state["tasks"].append({"task_id": str(i), "status": "completed"})
+            tmp = str(state_file) + ".tmp"
+            Path(tmp).write_text(json.dumps(state), encoding='utf-8')
+            os.replace(tmp, state_file)
+            time.sleep(0.03)
+        
+        watcher.join(10)
+        assert not watcher.is_alive()
+        return results, pulse_file.read_text(encoding='utf-8')
+
+
+def test_watch_pulse_debounces_bursts():
+    """A burst of state writes results in a single sync with the final state."""
+    for use_inotify in (False, True):
+        results, content = _run_watch_with_burst(use_inotify)
+        assert len(results) == 2
+        assert all(r.success for r in results)
+        assert "Completed: 5" in content
+
+
 if __name__ == "__main__":
     print("Running property tests for sync_pulse...")
     print("=" * 60)
@@ -751,6 +1108,17 @@ if __name__ == "__main__":
         ("Mental Model Update When Flag Set", test_mental_model_update_when_flag_set),
         ("Mental Model Preserved When Flag Not Set", test_mental_model_preserved_when_flag_not_set),
         ("Build Mental Model Contains Task Info", test_build_mental_model_contains_task_info),
+        ("Section Scanner Matches Line-by-Line", test_section_scanner_matches_line_by_line),
+        ("Section Spans Are Offsets Into Content", test_section_spans_are_offsets_into_content),
+        ("sync_pulse_files Skips Unchanged Write", test_sync_pulse_files_skips_unchanged_write),
+        ("Sync Fingerprint Ignores Unrelated State", test_sync_fingerprint_ignores_unrelated_state),
+        ("Incremental Sync Matches Full Regeneration", test_incremental_sync_matches_full_regeneration),
+        ("sync_pulse_files Re-renders Only Changed Sections", test_sync_pulse_files_rerenders_only_changed_sections),
+        ("Sync Splices Sections After Custom Title Block", test_sync_splices_sections_after_custom_title_block),
+        ("watch_pulse Debounces Bursts", test_watch_pulse_debounces_bursts),
+        ("State Summary Matches Per-Status Scans", test_state_summary_matches_per_status_scans),
+        ("pulse_engine Copy Matches Agent-Pulse", test_pulse_engine_copy_matches_agent_pulse),
+        ("Synced PULSE Passes Agent-Pulse Validation", test_synced_pulse_passes_agent_pulse_validation),
     ]
     
     failed = []
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Tests for Task Index
+
+Verifies the task_id keyed view over AGENT_STATE tasks stays consistent
+with the underlying task list and matches linear-scan behavior.
+"""
+
+import sys
+from pathlib import Path
+
+from hypothesis import given, strategies as st, settings
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from task_index import TaskIndex, TaskGraph, TaskRecord, find_task
+from fix_loop import get_all_dependent_task_ids
+from dispatch_batch import (
+    process_execution_report,
+    update_task_statuses,
+    ExecutionReport,
+    _dict_to_task_like,
+)
+from spec_parser import expand_dependencies
+
+
+# =============================================================================
+# Strategies
+# =============================================================================
+
+STATUSES = ["not_started", "in_progress", "pending_review", "under_review",
+            "fix_required", "final_review", "completed", "blocked"]
+
+
+@st.composite
+def state_strategy(draw):
+    """Generate a state with unique task IDs and random statuses"""
+    count = draw(st.integers(min_value=0, max_value=20))
+    tasks = [
+        {"task_id": f"task-{i}", "status": draw(st.sampled_from(STATUSES))}
+        for i in range(count)
+    ]
+    return {"tasks": tasks}
+
+
+@st.composite
+def hierarchy_state_strategy(draw):
+    """Generate a state with parent/subtask hierarchy and random dependencies"""
+    num_parents = draw(st.integers(min_value=1, max_value=5))
+    tasks = []
+    for p in range(1, num_parents + 1):
+        num_children = draw(st.integers(min_value=0, max_value=3))
+        children = [f"{p}.{c}" for c in range(1, num_children + 1)]
+        tasks.append({"task_id": str(p), "status": "not_started", "subtasks": children})
+        for child in children:
+            tasks.append({"task_id": child, "status": "not_started",
+                          "parent_id": str(p), "subtasks": []})
+    
+    all_ids = [t["task_id"] for t in tasks] + ["99"]  # "99" is an unresolved ID
+    for task in tasks:
+        task["dependencies"] = draw(st.lists(st.sampled_from(all_ids), max_size=3, unique=True))
+    return {"tasks": tasks}
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+@settings(max_examples=100)
+@given(state=state_strategy(), data=st.data())
+def test_index_lookup_matches_linear_scan(state, data):
+    """Indexed lookup returns the same dict object as a linear scan."""
+    index = TaskIndex(state)
+    probe = data.draw(st.sampled_from(
+        [t["task_id"] for t in state["tasks"]] + ["missing"]
+    ))
+    
+    assert find_task(state, probe, index) is find_task(state, probe)
+
+
+@settings(max_examples=100)
+@given(state=state_strategy(), status=st.sampled_from(STATUSES))
+def test_with_status_preserves_file_order(state, status):
+    """with_status returns matching tasks in task list order."""
+    index = TaskIndex(state)
+    expected = [t for t in state["tasks"] if t["status"] == status]
+    
+    assert index.with_status(status) == expected
+
+
+def test_set_status_updates_shared_dicts():
+    """Bulk status updates are visible in state and respect from_statuses."""
+    state = {
+        "tasks": [
+            {"task_id": "1", "status": "under_review"},
+            {"task_id": "2", "status": "pending_review"},
+            {"task_id": "3", "status": "under_review"},
+        ]
+    }
+    index = TaskIndex(state)
+    
+    updated = index.set_status(["1", "2", "missing"], "pending_review",
+                               from_statuses=["under_review"])
+    
+    assert updated == ["1"]
+    assert [t["status"] for t in state["tasks"]] == [
+        "pending_review", "pending_review", "under_review"
+    ]
+
+
+def test_add_indexes_new_task():
+    """Tasks added through the index are appended to state and indexed."""
+    state = {"tasks": [{"task_id": "1", "status": "not_started"}]}
+    index = TaskIndex(state)
+    
+    index.add({"task_id": "2", "status": "not_started"})
+    
+    assert len(state["tasks"]) == 2
+    assert index.get("2") is state["tasks"][1]
+    assert "2" in index
+
+
+def test_duplicate_ids_resolve_to_first_occurrence():
+    """Duplicate task IDs resolve to the first task, like next() over the list."""
+    state = {
+        "tasks": [
+            {"task_id": "1", "status": "not_started", "marker": "first"},
+            {"task_id": "1", "status": "not_started", "marker": "second"},
+        ]
+    }
+    
+    assert TaskIndex(state).get("1")["marker"] == "first"
+
+
+def test_process_execution_report_with_shared_index():
+    """Result processing through a shared index updates the right tasks."""
+    state = {
+        "tasks": [
+            {"task_id": "1", "status": "not_started"},
+            {"task_id": "2", "status": "not_started"},
+            {"task_id": "3", "status": "not_started"},
+        ]
+    }
+    index = TaskIndex(state)
+    report = ExecutionReport(
+        success=True,
+        tasks_completed=1,
+        tasks_failed=1,
+        task_results=[
+            {"task_id": "1", "status": "completed", "exit_code": 0, "output": "ok"},
+            {"task_id": "3", "status": "blocked", "exit_code": 1},
+            {"task_id": "unknown", "status": "completed", "exit_code": 0},
+        ],
+    )
+    
+    update_task_statuses(state, ["1", "3"], "in_progress", index)
+    process_execution_report(state, report, index)
+    
+    statuses = {t["task_id"]: t["status"] for t in state["tasks"]}
+    assert statuses == {"1": "pending_review", "2": "not_started", "3": "blocked"}
+    assert state["tasks"][0]["output"] == "ok"
+    assert "completed_at" not in state["tasks"][1]
+
+
+@settings(max_examples=100)
+@given(state=hierarchy_state_strategy())
+def test_graph_expansion_matches_expand_dependencies(state):
+    """TaskGraph expansion yields the same IDs as spec_parser.expand_dependencies."""
+    graph = TaskGraph(state["tasks"])
+    task_map = {t["task_id"]: _dict_to_task_like(t) for t in state["tasks"]}
+    
+    for record in graph.records:
+        expected = expand_dependencies(record.task["dependencies"], task_map)
+        actual = [graph.ids[i] for i in graph.expanded_dependencies(record.index)]
+        assert actual == expected
+
+
+def test_graph_parent_index_and_phantoms():
+    """Parent links come from subtasks lists and unknown IDs become phantom nodes."""
+    graph = TaskGraph([
+        {"task_id": "1", "status": "not_started", "subtasks": ["1.1", "1.2"]},
+        {"task_id": "1.1", "status": "completed", "dependencies": []},
+        {"task_id": "1.2", "status": "not_started", "dependencies": ["missing"]},
+    ])
+    
+    assert len(graph) == 3
+    assert graph.records[graph.position["1.1"]].parent == graph.position["1"]
+    assert graph.records[graph.position["1"]].parent == -1
+    assert not graph.is_task(graph.position["missing"])
+    assert graph.leaves(graph.position["1"]) == (graph.position["1.1"], graph.position["1.2"])
+
+
+def test_task_record_is_slotted():
+    """TaskRecord and Task-like stand-ins carry no per-instance __dict__."""
+    record = TaskRecord("1", 0, "not_started", False, {"task_id": "1"})
+    assert not hasattr(record, "__dict__")
+    assert not hasattr(_dict_to_task_like({"task_id": "1"}), "__dict__")
+    assert type(_dict_to_task_like({})) is type(_dict_to_task_like({"task_id": "2"}))
+
+
+def _uncached_dependents(graph, index):
+    """Plain BFS over reverse dependencies (reference for the closure cache)"""
+    reverse = graph.reverse_dependencies()
+    seen = set()
+    queue = list(reverse[index])
+    while queue:
+        node = queue.pop()
+        if node not in seen:
+            seen.add(node)
+            queue.extend(reverse[node])
+    return seen
+
+
+@settings(max_examples=100)
+@given(state=hierarchy_state_strategy(), data=st.data())
+def test_cached_dependents_match_uncached_closure(state, data):
+    """Cached closures match a fresh BFS regardless of query order."""
+    graph = TaskGraph(state["tasks"])
+    order = data.draw(st.permutations(range(len(graph.ids))))
+    
+    for index in order:
+        expected = {graph.ids[i] for i in _uncached_dependents(graph, index)}
+        assert set(graph.ids_from_mask(graph.dependents_mask(index))) == expected
+
+
+def test_dependent_closure_invalidated_on_structure_change():
+    """The cached graph is reused until invalidate_structure() is called."""
+    state = {"tasks": [
+        {"task_id": "1", "status": "not_started", "dependencies": []},
+        {"task_id": "2", "status": "not_started", "dependencies": ["1"]},
+        {"task_id": "3", "status": "not_started", "dependencies": []},
+    ]}
+    index = TaskIndex(state)
+    
+    assert get_all_dependent_task_ids(state, "1", index) == {"2"}
+    graph = index.graph()
+    
+    # Status changes keep the cached graph
+    index.set_status(["2"], "in_progress")
+    assert index.graph() is graph
+    
+    state["tasks"][2]["dependencies"] = ["2"]
+    index.invalidate_structure()
+    assert index.graph() is not graph
+    assert get_all_dependent_task_ids(state, "1", index) == {"2", "3"}
+    assert get_all_dependent_task_ids(state, "1") == {"2", "3"}
+
+
+if __name__ == "__main__":
+    print("Running tests for task index...")
+    print("=" * 60)
+    
+    tests = [
+        ("Index Lookup Matches Linear Scan", test_index_lookup_matches_linear_scan),
+        ("with_status Preserves File Order", test_with_status_preserves_file_order),
+        ("set_status Updates Shared Dicts", test_set_status_updates_shared_dicts),
+        ("add Indexes New Task", test_add_indexes_new_task),
+        ("Duplicate IDs Resolve to First", test_duplicate_ids_resolve_to_first_occurrence),
+        ("Process Execution Report With Shared Index", test_process_execution_report_with_shared_index),
+        ("Graph Expansion Matches expand_dependencies", test_graph_expansion_matches_expand_dependencies),
+        ("Graph Parent Index and Phantoms", test_graph_parent_index_and_phantoms),
+        ("TaskRecord Is Slotted", test_task_record_is_slotted),
+        ("Cached Dependents Match Uncached Closure", test_cached_dependents_match_uncached_closure),
+        ("Dependent Closure Invalidated on Structure Change", test_dependent_closure_invalidated_on_structure_change),
+    ]
+    
+    failed = []
+    for name, test in tests:
+        try:
+            print(f"\n{name}")
+            test()
+            print("  ✅ PASSED")
+        except Exception as e:
+            print(f"  ❌ FAILED: {e}")
+            failed.append((name, str(e)))
+    
+    print("\n" + "=" * 60)
+    if failed:
+        print(f"❌ {len(failed)} test(s) failed:")
+        for name, error in failed:
+            print(f"   - {name}: {error}")
+        sys.exit(1)
+    else:
+        print(f"✅ All {len(tests)} tests passed!")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for Orchestration Timing Spans
+
+Checks that spans are free no-ops while disabled, that enabled spans are
+written as nested JSON lines, and that dispatch entry points emit the
+hot-path spans.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import tracing
+from tracing import (
+    disable_tracing,
+    enable_tracing,
+    read_trace,
+    span,
+    summarize_trace,
+    traced,
+    tracing_enabled,
+)
+from dispatch_batch import dispatch_batch
+
+
+@pytest.fixture(autouse=True)
+def _restore_tracing():
+    """Leave global tracing as the environment configured it"""
+    previous = tracing._tracer
+    tracing._tracer = None
+    yield
+    disable_tracing()
+    tracing._tracer = previous
+
+
+# =============================================================================
+# Span API
+# =============================================================================
+
+def test_disabled_spans_write_nothing():
+    """Without a trace file, span() is a shared no-op and @traced calls through."""
+    @traced("work")
+    def work(x):
+        return x * 2
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert not tracing_enabled()
+        with span("outer", n=1) as s:
+            s.set(m=2)
+            assert work(3) == 6
+        
+        assert span("a") is span("b")
+        assert os.listdir(tmpdir) == []
+
+
+def test_nested_spans_record_parents_and_self_time():
+    """Child spans point at their parent; self time excludes children."""
+    @traced("child")
+    def child():
+        return sum(range(1000))
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "trace", "spans.jsonl")
+        assert enable_tracing(path)
+        
+        with span("parent", tasks=2) as s:
+            child()
+            child()
+            s.set(done=True)
+        disable_tracing()
+        
+        records = read_trace(path)
+        by_name = {}
+        for record in records:
+            by_name.setdefault(record["name"], []).append(record)
+        
+        parent = by_name["parent"][0]
+        assert parent["attrs"] == {"tasks": 2, "done": True}
+        assert parent["parent_id"] is None
+        assert [c["parent_id"] for c in by_name["child"]] == [parent["span_id"]] * 2
+        assert all(c["depth"] == 1 for c in by_name["child"])
+        
+        stats = {s.name: s for s in summarize_trace(records)}
+        children_ms = sum(c["duration_ms"] for c in by_name["child"])
+        assert stats["child"].count == 2
+        assert abs(stats["parent"].self_ms - (parent["duration_ms"] - children_ms)) < 1e-6
+
+
+def test_traced_records_errors_and_reraises():
+    """A failing call still closes its span and marks the error."""
+    @traced("boom")
+    def boom():
+        raise ValueError("bad")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "spans.jsonl")
+        enable_tracing(path)
+        with pytest.raises(ValueError):
+            boom()
+        with span("after"):
+            pass
+        disable_tracing()
+        
+        records = read_trace(path)
+        assert records[0]["name"] == "boom"
+        assert records[0]["error"] == "ValueError"
+        assert records[1]["parent_id"] is None
+
+
+# =============================================================================
+# Instrumented Entry Points
+# =============================================================================
+
+def test_dispatch_batch_emits_hot_path_spans():
+    """A dry-run dispatch records state load, ready set and partitioning."""
+    state = {
+        "spec_path": ".",
+        "session_name": "test",
+        "tasks": [
+            {"task_id": "1", "description": "A", "type": "code", "status": "not_started",
+             "dependencies": [], "subtasks": [], "writes": ["a.py"], "reads": []},
+            {"task_id": "2", "description": "B", "type": "code", "status": "not_started",
+             "dependencies": [], "subtasks": [], "writes": ["a.py"], "reads": []},
+        ],
+        "review_findings": [],
+        "final_reports": [],
+        "blocked_items": [],
+        "pending_decisions": [],
+        "deferred_fixes": [],
+        "window_allocation": {},
+    }
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_file = os.path.join(tmpdir, "AGENT_STATE.json")
+        with open(state_file, "w") as f:
+            json.dump(state, f)
+        path = os.path.join(tmpdir, "spans.jsonl")
+        enable_tracing(path)
+        
+        dispatch_batch(state_file, dry_run=True)
+        disable_tracing()
+        
+        records = {r["name"]: r for r in read_trace(path)}
+        assert {"dispatch_batch", "state.load", "fix_loop.process", "dispatch.ready_tasks",
+                "dispatch.partition", "dispatch.wrapper"} <= set(records)
+        assert records["dispatch.ready_tasks"]["attrs"] == {"tasks": 2, "ready": 2}
+        assert records["dispatch.partition"]["attrs"] == {"tasks": 2, "batches": 2}
+        assert records["state.load"]["parent_id"] == records["dispatch_batch"]["span_id"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
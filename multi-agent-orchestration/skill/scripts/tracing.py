@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Timing Spans for Multi-Agent Orchestration
+
+Lightweight span API used to time the orchestration hot paths (state
+load/save, ready-set computation, partitioning, wrapper invocation, result
+processing, fix loop evaluation and pulse sync).
+- Disabled by default; span() then returns a shared no-op object and
+  @traced functions call straight through
+- Enabled by ORCHESTRATION_TRACE=<file> or the --trace flag of the CLIs
+- Each finished span is appended to the trace file as one JSON line with
+  its duration, parent span and attributes
+- `tracing.py summarize TRACE` aggregates a trace by span name, with self
+  time (duration minus child spans) to separate JSON I/O, graph work and
+  waiting on agents
+
+Usage:
+    ORCHESTRATION_TRACE=trace.jsonl dispatch_batch.py AGENT_STATE.json
+    tracing.py summarize trace.jsonl
+"""
+
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, IO, List, Optional
+
+
+TRACE_ENV_VAR = "ORCHESTRATION_TRACE"
+
+
+class _NullSpan:
+    """Span stand-in used while tracing is disabled"""
+    __slots__ = ()
+    
+    def __enter__(self) -> "_NullSpan":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+    
+    def set(self, **attrs: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Appends finished spans to a JSON-lines file"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.run_id = uuid.uuid4().hex[:12]
+        self._file: Optional[IO[str]] = None
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def stack(self) -> List["Span"]:
+        """Open spans of the current thread, innermost last"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+    
+    def next_id(self) -> int:
+        return next(self._ids)
+    
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                parent = os.path.dirname(self.path)
+                if parent:
+                    os.makedirs(parent, exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            # One write + flush per span keeps lines whole when several
+            # processes append to the same trace
+            self._file.write(line)
+            self._file.flush()
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class Span:
+    """A timed region; use as a context manager"""
+    __slots__ = ("tracer", "name", "attrs", "span_id", "parent_id", "depth", "_start", "_wall")
+    
+    def __init__(self, tracer: Tracer, name: str, attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.span_id = 0
+        self.parent_id: Optional[int] = None
+        self.depth = 0
+    
+    def set(self, **attrs: Any) -> None:
+        """Attach attributes (counts, ids) to the span record"""
+        self.attrs.update(attrs)
+    
+    def __enter__(self) -> "Span":
+        stack = self.tracer.stack()
+        self.span_id = self.tracer.next_id()
+        if stack:
+            self.parent_id = stack[-1].span_id
+            self.depth = len(stack)
+        stack.append(self)
+        self._wall = time.time()
+        self._start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        duration = time.perf_counter() - self._start
+        stack = self.tracer.stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        record: Dict[str, Any] = {
+            "name": self.name,
+            "ts": self._wall,
+            "duration_ms": round(duration * 1000, 4),
+            "pid": os.getpid(),
+            "run": self.tracer.run_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "depth": self.depth,
+        }
+        if self.attrs:
+            record["attrs"] = self.attrs
+        if exc_type is not None:
+            record["error"] = exc_type.__name__
+        self.tracer.write(record)
+        return False
+
+
+_tracer: Optional[Tracer] = None
+
+
+def enable_tracing(path: Optional[str] = None) -> bool:
+    """
+    Start writing spans to path (default: $ORCHESTRATION_TRACE).
+    
+    Returns:
+        True if tracing is enabled afterwards
+    """
+    global _tracer
+    path = path or os.environ.get(TRACE_ENV_VAR)
+    if not path:
+        return _tracer is not None
+    if _tracer is not None and _tracer.path != path:
+        _tracer.close()
+    if _tracer is None or _tracer.path != path:
+        _tracer = Tracer(path)
+    return True
+
+
+def disable_tracing() -> None:
+    """Stop tracing and close the trace file"""
+    global _tracer
+    if _tracer is not None:
+        _tracer.close()
+    _tracer = None
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, **attrs: Any):
+    """
+    Time a block: `with span("state.save", tasks=n) as s: ...`.
+    
+    Returns a no-op span when tracing is disabled.
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return Span(_tracer, name, attrs)
+
+
+def traced(name: str) -> Callable:
+    """Decorator timing every call of a function as span `name`"""
+    def decorate(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return fn(*args, **kwargs)
+            with Span(_tracer, name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+# =============================================================================
+# Trace Summaries
+# =============================================================================
+
+@dataclass
+class SpanStats:
+    """Aggregated timings for one span name"""
+    name: str
+    count: int = 0
+    total_ms: float = 0.0
+    self_ms: float = 0.0
+    max_ms: float = 0.0
+    
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+def read_trace(path: str) -> List[Dict[str, Any]]:
+    """Read span records, skipping lines that are not valid JSON"""
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def summarize_trace(records: List[Dict[str, Any]]) -> List[SpanStats]:
+    """
+    Aggregate span records by name, slowest total first.
+    
+    Self time is the span's duration minus the durations of its direct
+    children (matched by run and parent_id).
+    """
+    child_ms: Dict[tuple, float] = {}
+    for record in records:
+        if record.get("parent_id") is not None:
+            key = (record.get("run"), record["parent_id"])
+            child_ms[key] = child_ms.get(key, 0.0) + record.get("duration_ms", 0.0)
+    
+    stats: Dict[str, SpanStats] = {}
+    for record in records:
+        name = record.get("name", "?")
+        duration = record.get("duration_ms", 0.0)
+        entry = stats.get(name)
+        if entry is None:
+            entry = stats[name] = SpanStats(name)
+        entry.count += 1
+        entry.total_ms += duration
+        entry.self_ms += max(0.0, duration - child_ms.get((record.get("run"), record.get("span_id")), 0.0))
+        entry.max_ms = max(entry.max_ms, duration)
+    
+    return sorted(stats.values(), key=lambda s: s.total_ms, reverse=True)
+
+
+def main():
+    """Command line entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Summarize orchestration timing traces")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    summarize = subparsers.add_parser("summarize", help="Aggregate a trace by span name")
+    summarize.add_argument("trace_file", nargs="+", help="JSON-lines trace file(s)")
+    summarize.add_argument("--json", action="store_true", help="Output result as JSON")
+    
+    args = parser.parse_args()
+    
+    records = []
+    for path in args.trace_file:
+        records.extend(read_trace(path))
+    stats = summarize_trace(records)
+    
+    if args.json:
+        print(json.dumps([
+            {
+                "name": s.name,
+                "count": s.count,
+                "total_ms": round(s.total_ms, 3),
+                "self_ms": round(s.self_ms, 3),
+                "mean_ms": round(s.mean_ms, 3),
+                "max_ms": round(s.max_ms, 3),
+            }
+            for s in stats
+        ], indent=2))
+    else:
+        print(f"{'span':<32} {'count':>7} {'total ms':>11} {'self ms':>11} {'mean ms':>9} {'max ms':>9}")
+        for s in stats:
+            print(f"{s.name:<32} {s.count:>7} {s.total_ms:>11.2f} {s.self_ms:>11.2f} {s.mean_ms:>9.2f} {s.max_ms:>9.2f}")
+
+
+# Pick up ORCHESTRATION_TRACE for every script importing this module
+enable_tracing()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,531 @@
+"""
+PULSE Engine
+
+Shared PROJECT_PULSE.md machinery used by both PULSE sync entry points
+(agent-pulse-coordination and multi-agent-orchestration):
+- Document data classes
+- Single-pass section scanner producing offsets into the document
+- Section parsers and renderers shared by both stacks
+- Bounded memo for rendered sections
+- Change-aware, atomic file sync with one stable keyword API
+
+Entry points keep their own sync policy (which sections they rebuild and
+how) and their documented sync_pulse_files signatures as thin wrappers.
+
+This file is the single source; multi-agent-orchestration/skill/scripts/
+pulse_engine.py is a relative symlink to it. Installing the orchestration
+skill without this one requires copying the resolved file (cp -L).
+"""
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class MentalModel:
+    """Structured representation of Mental Model section"""
+    description: str  # One-sentence project description
+    mermaid_diagram: str  # Mermaid code
+
+
+@dataclass
+class RisksAndDebt:
+    """Structured representation of Risks & Debt section"""
+    cognitive_warnings: List[str] = field(default_factory=list)
+    technical_debt: List[str] = field(default_factory=list)
+    pending_decisions: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SemanticAnchor:
+    """Structured representation of a semantic anchor"""
+    module: str
+    path: str
+    symbol: str
+
+
+@dataclass
+class PulseDocument:
+    """Complete structured representation of a PULSE document"""
+    mental_model: MentalModel
+    narrative_delta: str
+    risks_and_debt: RisksAndDebt
+    semantic_anchors: List[SemanticAnchor]
+
+
+# Header patterns of the four required sections
+SECTION_PATTERNS = {
+    'mental_model': r'^##\s*🟢?\s*Mental\s*Model',
+    'narrative_delta': r'^##\s*🟡?\s*Narrative\s*Delta',
+    'risks_and_debt': r'^##\s*🔴?\s*Risks\s*[&＆]\s*Debt',
+    'semantic_anchors': r'^##\s*🔗?\s*Semantic\s*Anchors',
+}
+
+# Canonical section order and the title block written before the first section
+SECTION_ORDER = ('mental_model', 'narrative_delta', 'risks_and_debt', 'semantic_anchors')
+PULSE_PREAMBLE = '# PROJECT_PULSE\n\n'
+
+
+def _compile_section_scanner(patterns: Dict[str, str]) -> "re.Pattern[str]":
+    """
+    Combine the section header patterns into one alternation regex.
+
+    Each pattern becomes a named group, tried in dict order. Whitespace
+    classes are narrowed to exclude newlines so a header never spans lines,
+    as when patterns were matched one line at a time.
+    """
+    alternatives = []
+    for name, pattern in patterns.items():
+        single_line = pattern.replace(r'\s', r'[^\S\n]')
+        alternatives.append('(?P<%s>%s)' % (name, single_line))
+    return re.compile('|'.join(alternatives), re.IGNORECASE | re.MULTILINE)
+
+
+SECTION_HEADER_RE = _compile_section_scanner(SECTION_PATTERNS)
+
+# Sub-parser patterns
+MERMAID_BLOCK_RE = re.compile(r'```mermaid\s*(.*?)```', re.DOTALL)
+LIST_ITEM_RE = re.compile(r'^[-*]\s+(.+)')
+ANCHOR_RE = re.compile(r'\[([^\]]+)\]\s*`?([^`\s]+)`?\s*->\s*`?([^`\s]+)`?')
+
+
+# =============================================================================
+# Section scanning
+# =============================================================================
+
+def find_section_layout(content: str) -> List[Tuple[str, int, int]]:
+    """
+    Locate every section header in a single pass over the document.
+
+    Returns:
+        List of (section_name, start, end) in document order. A section runs
+        from its header to the newline before the next header (or the end
+        of the document). Repeated headers each get an entry.
+    """
+    layout = []
+    current_section = None
+    current_start = 0
+
+    for match in SECTION_HEADER_RE.finditer(content):
+        if current_section:
+            layout.append((current_section, current_start, match.start() - 1))
+        current_section = match.lastgroup
+        current_start = match.start()
+
+    if current_section:
+        layout.append((current_section, current_start, len(content)))
+
+    return layout
+
+
+def find_section_spans(content: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Locate each section in a single pass over the document.
+
+    Returns:
+        Dict of section name -> (start, end) offsets into content; a repeated
+        header replaces the earlier span.
+    """
+    return {name: (start, end) for name, start, end in find_section_layout(content)}
+
+
+def find_sections(content: str) -> Dict[str, str]:
+    """Find the content of each section in the document"""
+    return {
+        name: content[start:end]
+        for name, (start, end) in find_section_spans(content).items()
+    }
+
+
+# =============================================================================
+# Section parsers
+# =============================================================================
+
+def extract_mermaid(content: str) -> Optional[str]:
+    """Get the first Mermaid block's code, or None if there is no block"""
+    match = MERMAID_BLOCK_RE.search(content)
+    return match.group(1).strip() if match else None
+
+
+def parse_risks_and_debt(content: str) -> RisksAndDebt:
+    """Parse Risks & Debt section (subsections start with ### or **)"""
+    cognitive_warnings = []
+    technical_debt = []
+    pending_decisions = []
+
+    current_subsection = None
+
+    for line in content.split('\n'):
+        line_stripped = line.strip()
+        line_lower = line_stripped.lower()
+
+        if line_stripped.startswith('###') or line_stripped.startswith('**'):
+            if 'cognitive' in line_lower:
+                current_subsection = 'cognitive'
+                continue
+            elif 'technical debt' in line_lower:
+                current_subsection = 'debt'
+                continue
+            elif 'pending' in line_lower:
+                current_subsection = 'pending'
+                continue
+
+        list_match = LIST_ITEM_RE.match(line_stripped)
+        if list_match and current_subsection:
+            item = list_match.group(1).strip()
+            # Skip the "None" placeholder written for empty lists
+            if item.lower() == 'none':
+                continue
+            if current_subsection == 'cognitive':
+                cognitive_warnings.append(item)
+            elif current_subsection == 'debt':
+                technical_debt.append(item)
+            elif current_subsection == 'pending':
+                pending_decisions.append(item)
+
+    return RisksAndDebt(
+        cognitive_warnings=cognitive_warnings,
+        technical_debt=technical_debt,
+        pending_decisions=pending_decisions
+    )
+
+
+def parse_semantic_anchors(content: str) -> List[SemanticAnchor]:
+    """Parse Semantic Anchors section ([Module] `path` -> `Symbol` list items)"""
+    anchors = []
+
+    for line in content.split('\n'):
+        if line.strip().startswith('-') or line.strip().startswith('*'):
+            match = ANCHOR_RE.search(line)
+            if match:
+                anchors.append(SemanticAnchor(
+                    module=match.group(1).strip(),
+                    path=match.group(2).strip(),
+                    symbol=match.group(3).strip()
+                ))
+
+    return anchors
+
+
+# =============================================================================
+# Section renderers
+# =============================================================================
+
+def render_mental_model(mental_model: MentalModel, keep_empty: bool = False) -> List[str]:
+    """
+    Render the Mental Model section lines.
+
+    Args:
+        mental_model: Mental Model data
+        keep_empty: Emit the description line and Mermaid block even when
+                    empty (otherwise empty parts are omitted)
+    """
+    lines = ['## 🟢 Mental Model', '']
+    if mental_model.description or keep_empty:
+        lines.append(mental_model.description)
+        lines.append('')
+    if mental_model.mermaid_diagram or keep_empty:
+        lines.append('```mermaid')
+        lines.append(mental_model.mermaid_diagram)
+        lines.append('```')
+        lines.append('')
+    return lines
+
+
+def render_narrative_delta(narrative_delta: str) -> List[str]:
+    """Render the Narrative Delta section lines"""
+    lines = ['## 🟡 Narrative Delta', '']
+    if narrative_delta:
+        lines.append(narrative_delta)
+    lines.append('')
+    return lines
+
+
+def render_risks_and_debt(risks_and_debt: RisksAndDebt) -> List[str]:
+    """Render the Risks & Debt section lines"""
+    lines = ['## 🔴 Risks & Debt', '']
+
+    for title, items in (
+        ('### Cognitive Load Warnings', risks_and_debt.cognitive_warnings),
+        ('### Technical Debt', risks_and_debt.technical_debt),
+        ('### Pending Decisions', risks_and_debt.pending_decisions),
+    ):
+        lines.append(title)
+        if items:
+            for item in items:
+                lines.append(f'- {item}')
+        else:
+            lines.append('- None')
+        lines.append('')
+
+    return lines
+
+
+def render_semantic_anchors(semantic_anchors: List[SemanticAnchor]) -> List[str]:
+    """Render the Semantic Anchors section lines"""
+    lines = ['## 🔗 Semantic Anchors', '']
+    if semantic_anchors:
+        for anchor in semantic_anchors:
+            lines.append(f'- [{anchor.module}] `{anchor.path}` -> `{anchor.symbol}`')
+    else:
+        lines.append('- None')
+    return lines
+
+
+def generate_pulse(document: PulseDocument, keep_empty_mental_model: bool = False) -> str:
+    """
+    Generate PULSE document markdown from structured data.
+
+    Args:
+        document: PulseDocument structured data
+        keep_empty_mental_model: See render_mental_model(keep_empty=...)
+
+    Returns:
+        str: Generated Markdown content
+    """
+    lines = render_mental_model(document.mental_model, keep_empty_mental_model)
+    lines.extend(render_narrative_delta(document.narrative_delta))
+    lines.extend(render_risks_and_debt(document.risks_and_debt))
+    lines.extend(render_semantic_anchors(document.semantic_anchors))
+    return PULSE_PREAMBLE + '\n'.join(lines)
+
+
+class SectionMemo:
+    """
+    Bounded memo of rendered section text.
+
+    Keys should capture everything a rendering depends on, e.g.
+    (section name, digest of its state inputs, digest of its current text).
+    The memo is cleared when it reaches its size limit.
+    """
+
+    def __init__(self, limit: int = 256):
+        self.limit = limit
+        self._entries: Dict[Tuple[str, ...], str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_render(self, key: Tuple[str, ...], render: Callable[[], str]) -> str:
+        """Return the memoized text for key, rendering and storing it on a miss"""
+        text = self._entries.get(key)
+        if text is None:
+            text = render()
+            if len(self._entries) >= self.limit:
+                self._entries.clear()
+            self._entries[key] = text
+        return text
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# =============================================================================
+# File sync
+# =============================================================================
+
+@dataclass
+class FileSyncResult:
+    """Result of sync_pulse_paths"""
+    success: bool
+    message: str
+    written: bool = False
+    content: Optional[str] = None
+    errors: List[str] = field(default_factory=list)
+
+
+# Last sync per output path: {abs_output_path: ((pulse_hash, inputs_key), output_hash)}
+_file_sync_memo: Dict[str, Tuple[Tuple[str, str], Optional[str]]] = {}
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 hex digest of text content (UTF-8 encoded)"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def write_text_atomic(path: str, content: str) -> None:
+    """Write text to path atomically (temp file + rename)"""
+    tmp_file = path + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_file, path)
+
+
+def read_text_if_exists(path: str) -> Optional[str]:
+    """Read a text file, or None if it does not exist"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def read_state_file(
+    state_path: str,
+    label: str = "state",
+    load_state: Optional[Callable[[str], Dict[str, Any]]] = None
+) -> Tuple[Optional[Dict[str, Any]], Optional[FileSyncResult]]:
+    """
+    Read AGENT_STATE.json, returning (state, None) or (None, failed FileSyncResult).
+
+    label names the file in error messages ("state" -> "State file not
+    found: ...", "Invalid JSON in state file: ..."). load_state(path)
+    replaces the plain json.load read, e.g. with the orchestration
+    skill's state_store loader; it raises ValueError for invalid JSON.
+    """
+    try:
+        if load_state is not None:
+            return load_state(state_path), None
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f), None
+    except FileNotFoundError:
+        return None, FileSyncResult(
+            success=False,
+            message=f"{label[:1].upper()}{label[1:]} file not found: {state_path}",
+            errors=[f"File not found: {state_path}"]
+        )
+    except ValueError as e:
+        return None, FileSyncResult(
+            success=False,
+            message=f"Invalid JSON in {label} file: {e}",
+            errors=[str(e)]
+        )
+    except Exception as e:
+        return None, FileSyncResult(
+            success=False,
+            message=f"Failed to read {label} file: {e}",
+            errors=[str(e)]
+        )
+
+
+def read_pulse_file(pulse_path: str) -> Tuple[Optional[str], Optional[FileSyncResult]]:
+    """Read PROJECT_PULSE.md, returning (content, None) or (None, failed FileSyncResult)"""
+    try:
+        with open(pulse_path, 'r', encoding='utf-8') as f:
+            return f.read(), None
+    except FileNotFoundError:
+        return None, FileSyncResult(
+            success=False,
+            message=f"PULSE file not found: {pulse_path}",
+            errors=[f"File not found: {pulse_path}"]
+        )
+    except Exception as e:
+        return None, FileSyncResult(
+            success=False,
+            message=f"Failed to read PULSE file: {e}",
+            errors=[str(e)]
+        )
+
+
+def sync_pulse_paths(
+    *,
+    pulse_path: str,
+    state_path: str,
+    transform: Callable[[str, Dict[str, Any]], Tuple[Optional[str], List[str]]],
+    output_path: Optional[str] = None,
+    inputs_key: Optional[Callable[[Dict[str, Any]], str]] = None,
+    state_label: str = "state",
+    pulse_first: bool = False,
+    load_state: Optional[Callable[[str], Dict[str, Any]]] = None
+) -> FileSyncResult:
+    """
+    Sync a PULSE file from a state file through a transform.
+
+    Reads both files, calls transform(pulse_content, agent_state), and
+    writes the result atomically only if it differs from the current
+    output. With inputs_key, a repeat sync whose PULSE content, inputs key
+    and output all match the previous sync to the same path skips the
+    transform entirely.
+
+    Args:
+        pulse_path: Path to PROJECT_PULSE.md
+        state_path: Path to AGENT_STATE.json
+        transform: Returns (updated_content, []) or (None, errors) on failure
+        output_path: Output path (default: overwrite pulse_path)
+        inputs_key: Digest of the state inputs the transform reads
+        state_label: Name of the state file in error messages
+        pulse_first: Read (and report errors for) the PULSE file first
+        load_state: Reads the state file (default: json.load)
+
+    Returns:
+        FileSyncResult (written is False when the output was already up to date)
+    """
+    if pulse_first:
+        pulse_content, error = read_pulse_file(pulse_path)
+        if error:
+            return error
+
+    agent_state, error = read_state_file(state_path, state_label, load_state)
+    if error:
+        return error
+
+    if not pulse_first:
+        pulse_content, error = read_pulse_file(pulse_path)
+        if error:
+            return error
+
+    # Output content before this sync (the PULSE file itself by default)
+    output_file = output_path or pulse_path
+    same_file = output_path is None or os.path.abspath(output_path) == os.path.abspath(pulse_path)
+    try:
+        existing_output = pulse_content if same_file else read_text_if_exists(output_file)
+    except Exception as e:
+        return FileSyncResult(
+            success=False,
+            message=f"Failed to read output file: {e}",
+            errors=[str(e)]
+        )
+    existing_hash = content_hash(existing_output) if existing_output is not None else None
+
+    # Skip the transform if inputs and output match the last sync to this path
+    memo_key = os.path.abspath(output_file)
+    sync_key = None
+    if inputs_key is not None:
+        sync_key = (content_hash(pulse_content), inputs_key(agent_state))
+        if _file_sync_memo.get(memo_key) == (sync_key, existing_hash):
+            return FileSyncResult(
+                success=True,
+                message=f"PULSE document already up to date: {output_file}",
+                content=existing_output
+            )
+
+    updated_content, errors = transform(pulse_content, agent_state)
+    if updated_content is None:
+        return FileSyncResult(
+            success=False,
+            message="Failed to parse PULSE document",
+            errors=errors or ["Could not parse PULSE document structure"]
+        )
+
+    updated_hash = content_hash(updated_content)
+    if sync_key is not None:
+        _file_sync_memo[memo_key] = (sync_key, updated_hash)
+
+    # Leave the file untouched if the content did not change
+    if updated_hash == existing_hash:
+        return FileSyncResult(
+            success=True,
+            message=f"PULSE document already up to date: {output_file}",
+            content=updated_content
+        )
+
+    try:
+        write_text_atomic(output_file, updated_content)
+    except Exception as e:
+        _file_sync_memo.pop(memo_key, None)
+        return FileSyncResult(
+            success=False,
+            message=f"Failed to write output file: {e}",
+            errors=[str(e)]
+        )
+
+    return FileSyncResult(
+        success=True,
+        message=f"Successfully synchronized PULSE document to {output_file}",
+        written=True,
+        content=updated_content
+    )
@@ -2,43 +2,32 @@
 PULSE Document Parser and Generator
 
 Parses and generates PROJECT_PULSE.md documents for structured human-layer document processing.
+Section scanning, shared section parsers and rendering come from pulse_engine;
+this module adds strict validation (ParseResult with per-section errors).
 """
 
 import re
+import sys
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import List, Optional, Tuple
 
+# Add script directory to path
+sys.path.insert(0, str(Path(__file__).parent))
 
-@dataclass
-class MentalModel:
-    """Structured representation of Mental Model section"""
-    description: str  # One-sentence project description
-    mermaid_diagram: str  # Mermaid code
-
-
-@dataclass
-class RisksAndDebt:
-    """Structured representation of Risks & Debt section"""
-    cognitive_warnings: List[str] = field(default_factory=list)
-    technical_debt: List[str] = field(default_factory=list)
-    pending_decisions: List[str] = field(default_factory=list)
-
-
-@dataclass
-class SemanticAnchor:
-    """Structured representation of a semantic anchor"""
-    module: str
-    path: str
-    symbol: str
-
-
-@dataclass
-class PulseDocument:
-    """Complete structured representation of a PULSE document"""
-    mental_model: MentalModel
-    narrative_delta: str
-    risks_and_debt: RisksAndDebt
-    semantic_anchors: List[SemanticAnchor]
+from pulse_engine import (
+    MentalModel,
+    RisksAndDebt,
+    SemanticAnchor,
+    PulseDocument,
+    SECTION_PATTERNS,
+    SECTION_ORDER,
+    extract_mermaid,
+    find_sections,
+    parse_risks_and_debt,
+    parse_semantic_anchors,
+    generate_pulse as _generate_pulse,
+)
 
 
 @dataclass
@@ -56,15 +45,7 @@ class ParseResult:
     errors: List[ParseError] = field(default_factory=list)
 
 
-# 四个必需节的标题模式
-SECTION_PATTERNS = {
-    'mental_model': r'^##\s*🟢?\s*Mental\s*Model',
-    'narrative_delta': r'^##\s*🟡?\s*Narrative\s*Delta',
-    'risks_and_debt': r'^##\s*🔴?\s*Risks\s*[&＆]\s*Debt',
-    'semantic_anchors': r'^##\s*🔗?\s*Semantic\s*Anchors',
-}
-
-REQUIRED_SECTIONS = ['mental_model', 'narrative_delta', 'risks_and_debt', 'semantic_anchors']
+REQUIRED_SECTIONS = list(SECTION_ORDER)
 
 
 def _find_sections(content: str) -> dict:
@@ -74,36 +55,7 @@ def _find_sections(content: str) -> dict:
     Returns:
         dict: {section_name: content}
     """
-    lines = content.split('\n')
-    sections = {}
-    current_section = None
-    current_start = 0
-    current_lines = []
-    
-    for i, line in enumerate(lines):
-        # 检查是否是新节的开始
-        found_section = None
-        for section_name, pattern in SECTION_PATTERNS.items():
-            if re.match(pattern, line, re.IGNORECASE):
-                found_section = section_name
-                break
-        
-        if found_section:
-            # 保存前一节
-            if current_section:
-                sections[current_section] = '\n'.join(current_lines)
-            
-            current_section = found_section
-            current_start = i
-            current_lines = [line]
-        elif current_section:
-            current_lines.append(line)
-    
-    # 保存最后一节
-    if current_section:
-        sections[current_section] = '\n'.join(current_lines)
-    
-    return sections
+    return find_sections(content)
 
 
 def _parse_mental_model(content: str) -> Tuple[Optional[MentalModel], List[ParseError]]:
@@ -111,12 +63,10 @@ def _parse_mental_model(content: str) -> Tuple[Optional[MentalModel], List[Parse
     errors = []
     
     # 提取 Mermaid 图
-    mermaid_match = re.search(r'```mermaid\s*(.*?)```', content, re.DOTALL)
-    if not mermaid_match:
+    mermaid_diagram = extract_mermaid(content)
+    if mermaid_diagram is None:
         errors.append(ParseError('Mental Model', 'Missing Mermaid diagram'))
         mermaid_diagram = ''
-    else:
-        mermaid_diagram = mermaid_match.group(1).strip()
     
     # 提取描述（Mermaid 之前的非空行，排除标题和注释）
     lines_before_mermaid = content.split('```mermaid')[0] if '```mermaid' in content else content
@@ -158,7 +108,7 @@ def _parse_narrative_delta(content: str) -> Tuple[str, List[ParseError]]:
             if '-->' in line:
                 in_comment = False
             continue
-        if not re.match(r'^##', line):
+        if not line.startswith('##'):
             lines.append(line)
     
     narrative = '\n'.join(lines).strip()
@@ -167,68 +117,13 @@ def _parse_narrative_delta(content: str) -> Tuple[str, List[ParseError]]:
 
 def _parse_risks_and_debt(content: str) -> Tuple[Optional[RisksAndDebt], List[ParseError]]:
     """Parse Risks & Debt section"""
-    cognitive_warnings = []
-    technical_debt = []
-    pending_decisions = []
-    
-    current_subsection = None
-    
-    for line in content.split('\n'):
-        line_stripped = line.strip()
-        line_lower = line_stripped.lower()
-        
-        # Detect subsection headers (must start with ### or **)
-        if line_stripped.startswith('###') or line_stripped.startswith('**'):
-            if 'cognitive' in line_lower:
-                current_subsection = 'cognitive'
-                continue
-            elif 'technical debt' in line_lower:
-                current_subsection = 'debt'
-                continue
-            elif 'pending' in line_lower:
-                current_subsection = 'pending'
-                continue
-        
-        # Extract list items
-        list_match = re.match(r'^[-*]\s+(.+)$', line_stripped)
-        if list_match and current_subsection:
-            item = list_match.group(1).strip()
-            # 过滤掉 "None" 占位符（生成器在列表为空时使用），不区分大小写
-            if item.lower() == 'none':
-                continue
-            if current_subsection == 'cognitive':
-                cognitive_warnings.append(item)
-            elif current_subsection == 'debt':
-                technical_debt.append(item)
-            elif current_subsection == 'pending':
-                pending_decisions.append(item)
-    
-    return RisksAndDebt(
-        cognitive_warnings=cognitive_warnings,
-        technical_debt=technical_debt,
-        pending_decisions=pending_decisions
-    ), []
+    return parse_risks_and_debt(content), []
 
 
 def _parse_semantic_anchors(content: str) -> Tuple[List[SemanticAnchor], List[ParseError]]:
     """Parse Semantic Anchors section"""
-    anchors = []
-    errors = []
-    
     # Match format: [Module] `path` -> `Symbol` or [Module] path -> Symbol
-    anchor_pattern = r'\[([^\]]+)\]\s*`?([^`\s]+)`?\s*->\s*`?([^`\s]+)`?'
-    
-    for line in content.split('\n'):
-        if line.strip().startswith('-') or line.strip().startswith('*'):
-            match = re.search(anchor_pattern, line)
-            if match:
-                anchors.append(SemanticAnchor(
-                    module=match.group(1).strip(),
-                    path=match.group(2).strip(),
-                    symbol=match.group(3).strip()
-                ))
-    
-    return anchors, errors
+    return parse_semantic_anchors(content), []
 
 
 def parse_pulse(content: str) -> ParseResult:
@@ -286,69 +181,16 @@ def generate_pulse(document: PulseDocument) -> str:
     """
     Generate PULSE document from structured data
     
+    The Mental Model description and Mermaid block are always written (even
+    when empty) so the output passes parse_pulse validation.
+    
     Args:
         document: PulseDocument structured data
         
     Returns:
         str: Generated Markdown content
     """
-    lines = ['# PROJECT_PULSE', '']
-    
-    # Mental Model
-    lines.append('## 🟢 Mental Model')
-    lines.append('')
-    lines.append(document.mental_model.description)
-    lines.append('')
-    lines.append('```mermaid')
-    lines.append(document.mental_model.mermaid_diagram)
-    lines.append('```')
-    lines.append('')
-    
-    # Narrative Delta
-    lines.append('## 🟡 Narrative Delta')
-    lines.append('')
-    if document.narrative_delta:
-        lines.append(document.narrative_delta)
-    lines.append('')
-    
-    # Risks & Debt section
-    lines.append('## 🔴 Risks & Debt')
-    lines.append('')
-    
-    lines.append('### Cognitive Load Warnings')
-    if document.risks_and_debt.cognitive_warnings:
-        for warning in document.risks_and_debt.cognitive_warnings:
-            lines.append(f'- {warning}')
-    else:
-        lines.append('- None')
-    lines.append('')
-    
-    lines.append('### Technical Debt')
-    if document.risks_and_debt.technical_debt:
-        for debt in document.risks_and_debt.technical_debt:
-            lines.append(f'- {debt}')
-    else:
-        lines.append('- None')
-    lines.append('')
-    
-    lines.append('### Pending Decisions')
-    if document.risks_and_debt.pending_decisions:
-        for decision in document.risks_and_debt.pending_decisions:
-            lines.append(f'- {decision}')
-    else:
-        lines.append('- None')
-    lines.append('')
-    
-    # Semantic Anchors 节
-    lines.append('## 🔗 Semantic Anchors')
-    lines.append('')
-    if document.semantic_anchors:
-        for anchor in document.semantic_anchors:
-            lines.append(f'- [{anchor.module}] `{anchor.path}` -> `{anchor.symbol}`')
-    else:
-        lines.append('- None')
-    
-    return '\n'.join(lines)
+    return _generate_pulse(document, keep_empty_mental_model=True)
 
 
 def documents_semantically_equal(doc1: PulseDocument, doc2: PulseDocument) -> bool:
@@ -10,7 +10,6 @@ Requirements: 7.5, 8.3
 - 8.3: Guardian Agent SHALL surface pending_decisions in PULSE_Document Risks & Debt section
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -25,6 +24,7 @@ from pulse_parser import (
     PulseDocument,
     RisksAndDebt,
 )
+from pulse_engine import sync_pulse_paths
 
 
 @dataclass
@@ -227,6 +227,10 @@ def sync_pulse_files(
     """
     Sync PULSE document from files
     
+    File handling goes through pulse_engine.sync_pulse_paths: the output file
+    is left untouched when the synced content is identical, and otherwise
+    written atomically (temp file + rename).
+    
     Args:
         pulse_file_path: PULSE document file path
         agent_state_file_path: Agent State JSON file path
@@ -236,66 +240,39 @@ def sync_pulse_files(
     Returns:
         SyncResult: Sync result
     """
-    # Read PULSE document
-    try:
-        with open(pulse_file_path, "r", encoding="utf-8") as f:
-            pulse_content = f.read()
-    except FileNotFoundError:
-        return SyncResult(
-            success=False,
-            message=f"PULSE file not found: {pulse_file_path}",
-            errors=[f"File not found: {pulse_file_path}"]
-        )
-    except Exception as e:
-        return SyncResult(
-            success=False,
-            message=f"Failed to read PULSE file: {e}",
-            errors=[str(e)]
-        )
+    synced: List[SyncResult] = []
     
-    # Read Agent State
-    try:
-        with open(agent_state_file_path, "r", encoding="utf-8") as f:
-            agent_state = json.load(f)
-    except FileNotFoundError:
-        return SyncResult(
-            success=False,
-            message=f"Agent State file not found: {agent_state_file_path}",
-            errors=[f"File not found: {agent_state_file_path}"]
-        )
-    except json.JSONDecodeError as e:
-        return SyncResult(
-            success=False,
-            message=f"Invalid JSON in Agent State file: {e}",
-            errors=[str(e)]
-        )
-    except Exception as e:
+    def transform(pulse_content: str, agent_state: Dict[str, Any]):
+        result = sync_pulse_from_agent_state(pulse_content, agent_state, preserve_existing)
+        synced.append(result)
+        if not result.success or not result.updated_document:
+            return None, result.errors
+        return generate_pulse(result.updated_document), []
+    
+    outcome = sync_pulse_paths(
+        pulse_path=pulse_file_path,
+        state_path=agent_state_file_path,
+        transform=transform,
+        output_path=output_path,
+        state_label="Agent State",
+        pulse_first=True
+    )
+    
+    if not outcome.success:
+        if synced and not synced[-1].success:
+            # The sync itself failed: keep its specific message and errors
+            return synced[-1]
         return SyncResult(
             success=False,
-            message=f"Failed to read Agent State file: {e}",
-            errors=[str(e)]
+            message=outcome.message,
+            errors=outcome.errors
         )
     
-    # Execute sync
-    result = sync_pulse_from_agent_state(pulse_content, agent_state, preserve_existing)
-    
-    if result.success and result.updated_document:
-        # Generate updated Markdown
-        updated_markdown = generate_pulse(result.updated_document)
-        
-        # Write output file
-        output_file = output_path or pulse_file_path
-        try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(updated_markdown)
-            result.message = f"Successfully synchronized and saved to {output_file}"
-        except Exception as e:
-            return SyncResult(
-                success=False,
-                message=f"Failed to write output file: {e}",
-                errors=[str(e)]
-            )
-    
+    result = synced[-1]
+    if outcome.written:
+        result.message = f"Successfully synchronized and saved to {output_path or pulse_file_path}"
+    else:
+        result.message = outcome.message
     return result
 
 